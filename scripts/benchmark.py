@@ -0,0 +1,684 @@
+"""
+Retrieval Benchmark
+PDF 로딩부터 검색까지 단계별 지연 시간, 처리량, 메모리 사용량을 측정하여 JSON으로 저장하는 스크립트
+
+사용법:
+    python scripts/benchmark.py --tiny_model
+    python scripts/benchmark.py --stages embedding,search,batch_search \
+        --output logs/bench.json
+    python scripts/benchmark.py --tiny_model --compare logs/bench_base.json \
+        --tolerance 0.2
+    python scripts/benchmark.py --compare logs/bench_base.json --current logs/bench.json
+
+--compare로 기준 결과보다 허용 비율 이상 느려지거나(지연 시간, 메모리) 처리량이 줄어든
+항목이 있으면 종료 코드 1을 반환하므로 커밋 간 성능 회귀 검사에 사용할 수 있습니다.
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.evaluate.retriever_evaluator import (  # noqa: E402
+    _create_query_from_answer,
+    load_dataset,
+)
+from src.knowledge_base import tracing  # noqa: E402
+from src.knowledge_base.chunking.kor_chunker import KORChunker  # noqa: E402
+from src.knowledge_base.embedding.sentence_transformers_embedding import (  # noqa: E402
+    SentenceTransformersEmbedding,
+)
+from src.knowledge_base.loading.pdf_loader import PDFLoader  # noqa: E402
+from src.knowledge_base.pipeline import KORPipeline  # noqa: E402
+from src.knowledge_base.retrieval.vector_store_retriever import (  # noqa: E402
+    VectorStoreRetriever,
+)
+from src.knowledge_base.storage.faiss_vector_store import (  # noqa: E402
+    FAISSVectorStore,
+)
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+
+STAGES = (
+    "pdf_load",
+    "chunking",
+    "model_load",
+    "embedding",
+    "index_build",
+    "kb_build",
+    "search",
+    "batch_search",
+    "cold_start",
+)
+DEFAULT_PDF_PATH = "data/국어 지식 기반 생성(RAG) 참조 문서.pdf"
+DEFAULT_DATASET_PATH = "data/korean_language_retriever_V1.0_train.json"
+DEFAULT_MODEL_NAME = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+DEFAULT_TINY_MODEL_DIR = "data/knowledge_base/benchmark_tiny_model"
+
+# 결과 비교 시 값의 방향: 이름이 이 접미사로 끝나면 작을수록 / 클수록 좋음
+LOWER_IS_BETTER = ("_ms", "_seconds", "_mb")
+HIGHER_IS_BETTER = ("_per_second",)
+
+# 새 인터프리터에서 지식베이스와 모델을 로드하고 첫 검색까지의 시간을 측정하는 코드
+COLD_START_CODE = """
+import json, resource, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from src.knowledge_base.embedding.sentence_transformers_embedding import (
+    SentenceTransformersEmbedding,
+)
+from src.knowledge_base.retrieval.vector_store_retriever import VectorStoreRetriever
+imported = time.perf_counter()
+embedding_model = SentenceTransformersEmbedding(
+    model_name={model!r}, query_cache_size=0
+)
+retriever = VectorStoreRetriever(
+    vector_store_path={kb!r}, embedding_model=embedding_model
+)
+loaded = time.perf_counter()
+retriever.search({query!r}, k={k})
+done = time.perf_counter()
+print(json.dumps({{
+    "import_seconds": imported - start,
+    "kb_load_seconds": loaded - imported,
+    "first_query_ms": (done - loaded) * 1000,
+    "time_to_first_result_seconds": done - start,
+    "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}}))
+"""
+
+
+def peak_rss_mb() -> float:
+    """현재 프로세스의 최대 RSS(MB)를 반환합니다. (Linux의 ru_maxrss는 KB 단위)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def latency_summary(samples: List[float]) -> Dict[str, float]:
+    """
+    지연 시간 표본(초)의 분위수와 평균을 밀리초로 요약합니다.
+
+    Args:
+        samples: 지연 시간 표본 (초)
+
+    Returns:
+        {"p50_ms", "p95_ms", "p99_ms", "mean_ms", "max_ms"}
+    """
+    values = np.asarray(samples, dtype=np.float64) * 1000
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {
+        "p50_ms": float(p50),
+        "p95_ms": float(p95),
+        "p99_ms": float(p99),
+        "mean_ms": float(values.mean()),
+        "max_ms": float(values.max()),
+    }
+
+
+def time_repeated(function: Callable[[], Any], repeat: int) -> List[float]:
+    """함수를 repeat번 실행하여 회차별 소요 시간(초)을 반환합니다."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def build_tiny_model(output_dir: str, texts: List[str], seed: int = 0) -> str:
+    """
+    오프라인 벤치마크용 작은 임의 초기화 BERT 문장 임베딩 모델을 만듭니다.
+
+    어휘는 주어진 텍스트의 문자로 구성하므로 모델 다운로드 없이 한국어 텍스트를
+    인코딩할 수 있습니다. 검색 품질은 의미가 없고 속도/메모리 측정에만 사용합니다.
+
+    Args:
+        output_dir: 모델을 저장할 디렉토리 (이미 있으면 그대로 사용)
+        texts: 어휘를 만들 텍스트
+        seed: 가중치 초기화 시드
+
+    Returns:
+        모델 디렉토리 경로 (SentenceTransformersEmbedding의 model_name으로 사용)
+    """
+    if os.path.exists(os.path.join(output_dir, "modules.json")):
+        return output_dir
+
+    import torch
+    from sentence_transformers import SentenceTransformer, models
+    from transformers import BertConfig, BertModel, BertTokenizerFast
+
+    logging.info(f"벤치마크용 작은 모델 생성 중: {output_dir}")
+    chars = sorted({char for text in texts for char in text if not char.isspace()})
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]"]
+    vocab += chars + [f"##{char}" for char in chars]
+
+    with tempfile.TemporaryDirectory() as hf_dir:
+        with open(os.path.join(hf_dir, "vocab.txt"), "w", encoding="utf-8") as f:
+            f.write("\n".join(vocab) + "\n")
+        BertTokenizerFast(
+            os.path.join(hf_dir, "vocab.txt"), do_lower_case=False
+        ).save_pretrained(hf_dir)
+        torch.manual_seed(seed)
+        config = BertConfig(
+            vocab_size=len(vocab),
+            hidden_size=32,
+            num_hidden_layers=2,
+            num_attention_heads=2,
+            intermediate_size=64,
+        )
+        BertModel(config).save_pretrained(hf_dir)
+
+        transformer = models.Transformer(hf_dir, max_seq_length=256)
+        pooling = models.Pooling(transformer.get_word_embedding_dimension())
+        SentenceTransformer(modules=[transformer, pooling], device="cpu").save(
+            output_dir
+        )
+    return output_dir
+
+
+class BenchmarkContext:
+    """
+    단계 사이에 공유하는 입력 (필요할 때 한 번만 준비하며 준비 시간은 측정하지 않음)
+    """
+
+    def __init__(self, args: argparse.Namespace, work_dir: str):
+        self.args = args
+        self.work_dir = work_dir
+        self._pages = None
+        self._chunks = None
+        self._embedding_model: Optional[SentenceTransformersEmbedding] = None
+        self._embeddings: Optional[np.ndarray] = None
+        self._kb_path: Optional[str] = None
+        self._queries: Optional[List[str]] = None
+
+    @property
+    def pages(self):
+        if self._pages is None:
+            self._pages = PDFLoader(self.args.pdf_path, num_workers=1).load()
+        return self._pages
+
+    @property
+    def chunks(self):
+        if self._chunks is None:
+            self._chunks = KORChunker(
+                self.pages, os.path.basename(self.args.pdf_path)
+            ).process()
+        return self._chunks
+
+    @property
+    def embedding_model(self) -> SentenceTransformersEmbedding:
+        if self._embedding_model is None:
+            self.set_embedding_model(self.new_embedding_model())
+            self._embedding_model.warmup()
+        return self._embedding_model
+
+    def new_embedding_model(self) -> SentenceTransformersEmbedding:
+        """캐시를 사용하지 않는 임베딩 모델 (매번 실제 인코딩을 측정)"""
+        return SentenceTransformersEmbedding(
+            model_name=self.args.model_name,
+            query_cache_size=0,
+            batch_size=self.args.embed_batch_size,
+        )
+
+    def set_embedding_model(self, embedding_model: SentenceTransformersEmbedding):
+        self._embedding_model = embedding_model
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        if self._embeddings is None:
+            self._embeddings = self.embedding_model.embed_texts(
+                [chunk.page_content for chunk in self.chunks],
+                show_progress_bar=False,
+            )
+        return self._embeddings
+
+    @property
+    def kb_path(self) -> str:
+        if self._kb_path is None:
+            self.build_knowledge_base()
+        return self._kb_path
+
+    def build_knowledge_base(self) -> float:
+        """임시 디렉토리에 지식베이스를 전체 구축하고 소요 시간(초)을 반환합니다."""
+        kb_path = os.path.join(self.work_dir, "knowledge_base")
+        vector_store = FAISSVectorStore.from_config(
+            self.embedding_model, self.args.config_path
+        )
+        pipeline = KORPipeline(self.embedding_model, vector_store, pdf_workers=1)
+        start = time.perf_counter()
+        pipeline.build_knowledge_base(self.args.pdf_path, kb_path)
+        elapsed = time.perf_counter() - start
+        self._kb_path = kb_path
+        return elapsed
+
+    @property
+    def queries(self) -> List[str]:
+        if self._queries is None:
+            dataset = load_dataset(self.args.dataset_path)
+            queries = [_create_query_from_answer(item) for item in dataset]
+            self._queries = [q for q in queries if q.strip()][: self.args.num_queries]
+        return self._queries
+
+
+def bench_pdf_load(ctx: BenchmarkContext) -> Dict[str, Any]:
+    """PDF 페이지 로딩 (단일 프로세스와 --pdf_workers 프로세스)"""
+    results: Dict[str, Any] = {}
+    for workers in dict.fromkeys([1, ctx.args.pdf_workers]):
+        samples = time_repeated(
+            lambda: PDFLoader(ctx.args.pdf_path, num_workers=workers).load(),
+            ctx.args.repeat,
+        )
+        results[f"workers_{workers}"] = {
+            "seconds": float(np.median(samples)),
+            "pages_per_second": len(ctx.pages) / float(np.median(samples)),
+        }
+    results["pages"] = len(ctx.pages)
+    return results
+
+
+def bench_chunking(ctx: BenchmarkContext) -> Dict[str, Any]:
+    """조항 단위 청킹"""
+    name = os.path.basename(ctx.args.pdf_path)
+    pages = ctx.pages
+    samples = time_repeated(lambda: KORChunker(pages, name).process(), ctx.args.repeat)
+    seconds = float(np.median(samples))
+    return {
+        "chunks": len(ctx.chunks),
+        "seconds": seconds,
+        "chunks_per_second": len(ctx.chunks) / seconds,
+    }
+
+
+def bench_model_load(ctx: BenchmarkContext) -> Dict[str, Any]:
+    """임베딩 모델 로딩과 첫 인코딩 (같은 프로세스에서 처음 로드할 때)"""
+    embedding_model = ctx.new_embedding_model()
+    start = time.perf_counter()
+    embedding_model.warmup()
+    seconds = time.perf_counter() - start
+    ctx.set_embedding_model(embedding_model)
+    return {"seconds": seconds, "embedding_dim": embedding_model.get_embedding_dim()}
+
+
+def bench_embedding(ctx: BenchmarkContext) -> Dict[str, Any]:
+    """청크 전체 배치 인코딩 처리량 (캐시 미사용)"""
+    embedding_model = ctx.embedding_model
+    texts = [chunk.page_content for chunk in ctx.chunks]
+    samples = []
+    for _ in range(ctx.args.repeat):
+        embedding_model.reset_encoding_stats()
+        start = time.perf_counter()
+        embedding_model.embed_texts(texts, show_progress_bar=False)
+        samples.append(time.perf_counter() - start)
+    stats = embedding_model.get_encoding_stats()
+    seconds = float(np.median(samples))
+    return {
+        "texts": len(texts),
+        "batch_size": stats["batch_size"],
+        "seconds": seconds,
+        "texts_per_second": len(texts) / seconds,
+        "tokens_per_second": stats["tokens_per_second"],
+        "padding_ratio": stats["padding_ratio"],
+    }
+
+
+def bench_index_build(ctx: BenchmarkContext) -> Dict[str, Any]:
+    """미리 계산한 임베딩으로 인덱스 종류별 구축 (IVF 학습 포함)"""
+    results = {}
+    chunks, embeddings = ctx.chunks, ctx.embeddings
+    embedding_model = ctx.embedding_model
+    for index_type in ctx.args.index_types.split(","):
+
+        def build():
+            vector_store = FAISSVectorStore(
+                embedding_model, index_type=index_type, metric="cosine"
+            )
+            vector_store.add_embeddings(chunks, embeddings)
+
+        seconds = float(np.median(time_repeated(build, ctx.args.repeat)))
+        results[index_type] = {
+            "seconds": seconds,
+            "vectors_per_second": len(embeddings) / seconds,
+        }
+    return results
+
+
+def bench_kb_build(ctx: BenchmarkContext) -> Dict[str, Any]:
+    """PDF에서 지식베이스 전체 구축 및 저장 (로딩 + 청킹 + 임베딩 + 색인)"""
+    seconds = ctx.build_knowledge_base()
+    size = sum(
+        os.path.getsize(os.path.join(ctx.kb_path, name))
+        for name in os.listdir(ctx.kb_path)
+    )
+    return {"seconds": seconds, "disk_mb": size / (1024 * 1024)}
+
+
+def bench_search(ctx: BenchmarkContext) -> Dict[str, Any]:
+    """쿼리 하나씩 검색 (쿼리 인코딩 + FAISS 검색 + 문서 조회)"""
+    retriever = VectorStoreRetriever(ctx.kb_path, ctx.embedding_model)
+    queries, k = ctx.queries, ctx.args.k
+    for query in queries[: ctx.args.warmup_queries]:
+        retriever.search(query, k=k)
+
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        retriever.search(query, k=k)
+        samples.append(time.perf_counter() - start)
+    return {
+        "queries": len(queries),
+        "k": k,
+        **latency_summary(samples),
+        "queries_per_second": len(queries) / sum(samples),
+    }
+
+
+def bench_batch_search(ctx: BenchmarkContext) -> Dict[str, Any]:
+    """배치 검색 (배치 인코딩 + 단일 FAISS 검색), 배치 크기별 배치 지연 시간"""
+    retriever = VectorStoreRetriever(ctx.kb_path, ctx.embedding_model)
+    queries, k = ctx.queries, ctx.args.k
+    retriever.search_batch(queries[: ctx.args.warmup_queries], k=k)
+
+    results = {}
+    for batch_size in (int(size) for size in ctx.args.batch_sizes.split(",")):
+        batches = [
+            queries[i : i + batch_size] for i in range(0, len(queries), batch_size)
+        ]
+        samples = []
+        for batch in batches:
+            start = time.perf_counter()
+            retriever.search_batch(batch, k=k)
+            samples.append(time.perf_counter() - start)
+        results[f"batch_{batch_size}"] = {
+            "batches": len(batches),
+            **latency_summary(samples),
+            "queries_per_second": len(queries) / sum(samples),
+        }
+    return results
+
+
+def bench_cold_start(ctx: BenchmarkContext) -> Dict[str, Any]:
+    """새 프로세스에서 import, 지식베이스/모델 로드, 첫 검색까지 (프로세스 최대 RSS 포함)"""
+    code = COLD_START_CODE.format(
+        root=PROJECT_ROOT,
+        model=ctx.args.model_name,
+        kb=os.path.abspath(ctx.kb_path),
+        query=ctx.queries[0],
+        k=ctx.args.k,
+    )
+    runs = []
+    for _ in range(ctx.args.repeat):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        wall_seconds = time.perf_counter() - start
+        if completed.returncode != 0:
+            raise RuntimeError(f"콜드 스타트 측정 실패:\n{completed.stderr}")
+        run = json.loads(completed.stdout.strip().splitlines()[-1])
+        run["process_wall_seconds"] = wall_seconds
+        runs.append(run)
+    return {key: float(np.median([run[key] for run in runs])) for key in runs[0]}
+
+
+BENCHMARKS: Dict[str, Callable[[BenchmarkContext], Dict[str, Any]]] = {
+    "pdf_load": bench_pdf_load,
+    "chunking": bench_chunking,
+    "model_load": bench_model_load,
+    "embedding": bench_embedding,
+    "index_build": bench_index_build,
+    "kb_build": bench_kb_build,
+    "search": bench_search,
+    "batch_search": bench_batch_search,
+    "cold_start": bench_cold_start,
+}
+
+
+def run_benchmarks(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    선택한 단계를 순서대로 측정합니다.
+
+    Args:
+        args: 명령행 인자
+
+    Returns:
+        {"meta": 실행 환경과 설정, "stages": 단계별 측정 결과}
+    """
+    stages = args.stages.split(",") if args.stages else list(STAGES)
+    unknown = [stage for stage in stages if stage not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"알 수 없는 단계입니다: {unknown} (지원: {STAGES})")
+    stages = [stage for stage in STAGES if stage in stages]
+
+    results: Dict[str, Any] = {"meta": collect_metadata(args), "stages": {}}
+    with tempfile.TemporaryDirectory() as work_dir:
+        ctx = BenchmarkContext(args, work_dir)
+        for stage in stages:
+            logging.info(f"벤치마크 단계: {stage}")
+            start = time.perf_counter()
+            stage_results = BENCHMARKS[stage](ctx)
+            # 최대 RSS는 프로세스 시작 후의 최고치이므로 단계가 끝난 시점까지의 값
+            # (cold_start는 측정한 새 프로세스의 값을 유지)
+            stage_results.setdefault("peak_rss_mb", peak_rss_mb())
+            results["stages"][stage] = stage_results
+            logging.info(f"{stage} 완료: {time.perf_counter() - start:.2f}초")
+    if tracing.is_enabled():
+        # 단계 안의 세부 소요 시간 (인코딩, FAISS 검색, 문서 조회 등)
+        results["trace"] = tracing.get_stats()
+    return results
+
+
+def collect_metadata(args: argparse.Namespace) -> Dict[str, Any]:
+    """결과 비교에 필요한 실행 환경과 설정을 수집합니다."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now().isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "model_name": args.model_name,
+        "tiny_model": args.tiny_model,
+        "pdf_path": args.pdf_path,
+        "dataset_path": args.dataset_path,
+        "repeat": args.repeat,
+        "num_queries": args.num_queries,
+        "k": args.k,
+    }
+
+
+def flatten_metrics(results: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    """중첩된 단계별 결과를 "단계.항목" 키의 숫자 dict로 펼칩니다."""
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten_metrics(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = float(value)
+    return flat
+
+
+def compare_results(
+    current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2
+) -> List[Dict[str, Any]]:
+    """
+    두 벤치마크 결과의 공통 항목을 비교합니다.
+
+    지연 시간/소요 시간/메모리(_ms, _seconds, _mb)는 커질수록, 처리량(_per_second)은
+    작아질수록 나빠진 것으로 보고, 나빠진 비율이 tolerance를 넘으면 회귀로 표시합니다.
+    개수처럼 방향이 없는 항목은 비교하지 않습니다.
+
+    Args:
+        current: 현재 결과
+        baseline: 기준 결과
+        tolerance: 허용하는 악화 비율 (0.2이면 20%)
+
+    Returns:
+        항목별 {"metric", "baseline", "current", "change", "regression"} 리스트
+        (change는 나빠진 방향을 양수로 한 상대 변화율)
+    """
+    current_flat = flatten_metrics(current.get("stages", {}))
+    baseline_flat = flatten_metrics(baseline.get("stages", {}))
+    rows = []
+    for metric in sorted(current_flat.keys() & baseline_flat.keys()):
+        # 마지막 항목 이름으로 판단 ("seconds"처럼 접미사만으로 된 이름 포함)
+        leaf = "_" + metric.rsplit(".", 1)[-1]
+        if leaf.endswith(LOWER_IS_BETTER):
+            sign = 1.0
+        elif leaf.endswith(HIGHER_IS_BETTER):
+            sign = -1.0
+        else:
+            continue
+        before, after = baseline_flat[metric], current_flat[metric]
+        change = sign * (after - before) / before if before else 0.0
+        rows.append(
+            {
+                "metric": metric,
+                "baseline": before,
+                "current": after,
+                "change": change,
+                "regression": change > tolerance,
+            }
+        )
+    return rows
+
+
+def print_comparison(rows: List[Dict[str, Any]]) -> None:
+    """비교 결과를 표로 출력합니다. (change는 나빠진 방향이 양수)"""
+    print(f"{'항목':<48} {'기준':>12} {'현재':>12} {'악화율':>9}")
+    for row in rows:
+        flag = "  <- 회귀" if row["regression"] else ""
+        print(
+            f"{row['metric']:<48} {row['baseline']:>12.4f} {row['current']:>12.4f} "
+            f"{row['change'] * 100:>8.1f}%{flag}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="검색 파이프라인 단계별 성능 벤치마크")
+    parser.add_argument(
+        "--stages",
+        type=str,
+        default=None,
+        help=f"측정할 단계 (쉼표 구분, 기본값: 전체 {','.join(STAGES)})",
+    )
+    parser.add_argument("--pdf_path", type=str, default=DEFAULT_PDF_PATH)
+    parser.add_argument("--dataset_path", type=str, default=DEFAULT_DATASET_PATH)
+    parser.add_argument("--config_path", type=str, default="config/model_config.yaml")
+    parser.add_argument("--model_name", type=str, default=DEFAULT_MODEL_NAME)
+    parser.add_argument(
+        "--tiny_model",
+        action="store_true",
+        help="모델 다운로드 없이 데이터의 문자로 만든 작은 임의 초기화 모델로 측정",
+    )
+    parser.add_argument(
+        "--tiny_model_dir",
+        type=str,
+        default=DEFAULT_TINY_MODEL_DIR,
+        help="--tiny_model 모델 저장 디렉토리 (있으면 재사용)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 측정 횟수")
+    parser.add_argument(
+        "--num_queries", type=int, default=200, help="검색 지연 시간 측정 쿼리 수"
+    )
+    parser.add_argument("--warmup_queries", type=int, default=10)
+    parser.add_argument("--k", type=int, default=5, help="검색 결과 수")
+    parser.add_argument("--batch_sizes", type=str, default="8,32,128")
+    parser.add_argument("--index_types", type=str, default="flat,hnsw,ivf_flat")
+    parser.add_argument("--embed_batch_size", type=int, default=32)
+    parser.add_argument(
+        "--pdf_workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="pdf_load 단계에서 단일 프로세스와 비교할 추출 프로세스 수",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="결과 JSON 경로 (기본값: logs/benchmark_<시각>.json)",
+    )
+    parser.add_argument(
+        "--compare", type=str, default=None, help="비교할 기준 결과 JSON 경로"
+    )
+    parser.add_argument(
+        "--current",
+        type=str,
+        default=None,
+        help="측정하지 않고 --compare 기준과 비교할 결과 JSON 경로",
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="회귀로 판단할 악화 비율"
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="단계별 세부 소요 시간(src.knowledge_base.tracing)을 결과의 trace 항목에 기록",
+    )
+    args = parser.parse_args()
+    if args.trace:
+        tracing.enable()
+
+    if args.current:
+        with open(args.current, "r", encoding="utf-8") as f:
+            results = json.load(f)
+    else:
+        if args.tiny_model:
+            texts = [page.page_content for page in PDFLoader(args.pdf_path).load()]
+            texts += [
+                _create_query_from_answer(item)
+                for item in load_dataset(args.dataset_path)
+            ]
+            args.model_name = build_tiny_model(
+                os.path.join(PROJECT_ROOT, args.tiny_model_dir), texts
+            )
+        results = run_benchmarks(args)
+        output = args.output or os.path.join(
+            "logs", f"benchmark_{datetime.datetime.now():%Y%m%d_%H%M%S}.json"
+        )
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(json.dumps(results["stages"], ensure_ascii=False, indent=2))
+        print(f"결과 저장: {output}")
+
+    if not args.compare:
+        return 0
+    with open(args.compare, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = compare_results(results, baseline, args.tolerance)
+    print_comparison(rows)
+    regressions = [row["metric"] for row in rows if row["regression"]]
+    if regressions:
+        print(f"성능 회귀 {len(regressions)}개: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+Import Time Report
+모듈별 import 소요 시간을 새 인터프리터에서 반복 측정하여 보고하는 스크립트
+
+사용법:
+    python scripts/import_time_report.py
+    python scripts/import_time_report.py --repeat 5 --output logs/import_time.json
+    python scripts/import_time_report.py src.knowledge_base.pipeline --top 15
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = [
+    "src.knowledge_base.storage.title_index",
+    "src.knowledge_base.embedding.sentence_transformers_embedding",
+    "src.knowledge_base.retrieval.vector_store_retriever",
+    "src.knowledge_base.pipeline",
+    "src.evaluate.retriever_evaluator",
+]
+
+# import만으로 로드되면 시작 시간이 크게 늘어나는 패키지
+HEAVY_PACKAGES = ("torch", "sentence_transformers", "transformers")
+
+
+def measure_import(module: str) -> Tuple[float, Dict[str, float], List[str]]:
+    """
+    새 인터프리터에서 모듈을 import하고 -X importtime 출력을 분석합니다.
+
+    Args:
+        module: import할 모듈명
+
+    Returns:
+        (전체 소요 시간(초), 패키지별 누적 소요 시간(초), 로드된 무거운 패키지)
+    """
+    code = (
+        f"import json, sys; import {module}; "
+        f"print(json.dumps([m for m in {HEAVY_PACKAGES!r} if m in sys.modules]))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{completed.stderr}")
+
+    # 형식: "import time: self [us] | cumulative | imported package"
+    # 하위 모듈이 상위 모듈보다 먼저 출력되므로 뒤집어서 상위 모듈부터 순회
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((depth, name.strip().split(".")[0], int(cumulative) / 1e6))
+
+    # 패키지별로 다른 패키지에서 처음 진입한 지점의 누적 시간만 합산 (중복 계산 방지)
+    total = 0.0
+    packages: Dict[str, float] = {}
+    stack: List[str] = []
+    for depth, package, cumulative in reversed(entries):
+        del stack[depth:]
+        if depth == 0:
+            total += cumulative
+        if package not in stack:
+            packages[package] = packages.get(package, 0.0) + cumulative
+        stack.append(package)
+
+    heavy = json.loads(completed.stdout.strip().splitlines()[-1])
+    return total, packages, heavy
+
+
+def build_report(modules: List[str], repeat: int, top: int) -> Dict[str, Any]:
+    """
+    모듈별 import 시간을 repeat번 측정하여 중앙값으로 보고서를 만듭니다.
+
+    Args:
+        modules: 측정할 모듈명 리스트
+        repeat: 모듈별 측정 횟수
+        top: 보고할 최상위 패키지 수
+
+    Returns:
+        모듈별 중앙값/최소/최대 소요 시간, 무거운 의존성 로드 여부, 상위 패키지
+    """
+    report: Dict[str, Any] = {"python": sys.version.split()[0], "modules": {}}
+    for module in modules:
+        totals = []
+        package_samples: Dict[str, List[float]] = {}
+        heavy: List[str] = []
+        for _ in range(repeat):
+            total, packages, heavy = measure_import(module)
+            totals.append(total)
+            for package, seconds in packages.items():
+                package_samples.setdefault(package, []).append(seconds)
+
+        package_medians = {
+            package: statistics.median(samples)
+            for package, samples in package_samples.items()
+        }
+        report["modules"][module] = {
+            "median_seconds": statistics.median(totals),
+            "min_seconds": min(totals),
+            "max_seconds": max(totals),
+            "heavy_packages_loaded": heavy,
+            "top_packages": dict(
+                sorted(package_medians.items(), key=lambda item: -item[1])[:top]
+            ),
+        }
+    return report
+
+
+def main() -> None:
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description="모듈 import 소요 시간 보고서")
+    parser.add_argument(
+        "modules", nargs="*", default=DEFAULT_MODULES, help="측정할 모듈명"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="모듈별 측정 횟수")
+    parser.add_argument("--top", type=int, default=8, help="보고할 상위 패키지 수")
+    parser.add_argument("--output", type=str, default=None, help="JSON 저장 경로")
+    args = parser.parse_args()
+
+    report = build_report(args.modules, args.repeat, args.top)
+
+    print(
+        f"\n--- import 소요 시간 (중앙값, {args.repeat}회, Python {report['python']}) ---"
+    )
+    for module, result in report["modules"].items():
+        heavy = ", ".join(result["heavy_packages_loaded"]) or "-"
+        print(f"\n{module}: {result['median_seconds']:.2f}초 (무거운 의존성: {heavy})")
+        for package, seconds in result["top_packages"].items():
+            print(f"  {package:<28} {seconds:.3f}초")
+
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n보고서 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
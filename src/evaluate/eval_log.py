@@ -0,0 +1,368 @@
+"""
+Evaluation Log
+평가 실행의 질문별 기록을 JSONL(선택적 zstd 압축)로 스트리밍 저장/재개하고,
+검색 결과를 (모델, 지식베이스 지문, 검색 설정, 쿼리) 키로 캐시하는 모듈
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+ZSTD_SUFFIX = ".zst"
+
+
+def _require_zstandard() -> Any:
+    """zstd 압축 로그에 필요한 선택 패키지를 import합니다."""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "zstd 압축 로그를 사용하려면 zstandard 패키지가 필요합니다: "
+            "pip install zstandard"
+        ) from e
+    return zstandard
+
+
+def _iter_lines(path: str) -> Iterator[bytes]:
+    """
+    JSONL 파일의 줄을 순회합니다. (.zst이면 압축 해제)
+
+    비정상 종료로 잘린 zstd 프레임은 읽을 수 있는 데까지만 반환합니다.
+    """
+    with open(path, "rb") as raw:
+        if not path.endswith(ZSTD_SUFFIX):
+            yield from raw
+            return
+
+        zstandard = _require_zstandard()
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            raw, read_across_frames=True
+        )
+        try:
+            yield from io.BufferedReader(reader)
+        except zstandard.ZstdError as e:
+            logging.warning(f"압축 로그의 손상된 끝부분을 무시합니다: {path} ({e})")
+
+
+def read_jsonl(path: str) -> Tuple[List[Dict[str, Any]], bool]:
+    """
+    JSONL 파일의 완전한 레코드를 읽습니다.
+
+    Args:
+        path: JSONL 파일 경로 (.zst이면 zstd 압축)
+
+    Returns:
+        (레코드 리스트, 잘린 마지막 줄을 버렸는지 여부)
+    """
+    records = []
+    for line in _iter_lines(path):
+        # 쓰는 도중 중단된 마지막 줄은 줄바꿈이 없거나 JSON이 깨져 있음
+        if not line.endswith(b"\n"):
+            return records, True
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            return records, True
+    return records, False
+
+
+class JsonlRunLog:
+    """
+    재개 가능한 평가 실행 로그
+
+    첫 줄은 실행 설정(header), 이후 줄은 질문별 기록이며 기록마다 파일에 바로
+    씁니다. 같은 경로로 다시 열면 설정이 같은지 확인한 뒤 완료된 기록을 반환하고
+    이어서 기록합니다. 경로가 .zst로 끝나면 zstd로 압축하며, 잘린 압축 스트림
+    뒤에는 이어 쓸 수 없으므로 재개 시 완료된 기록으로 파일을 다시 만든 뒤
+    이어서 기록합니다.
+    """
+
+    def __init__(self, path: str, header: Dict[str, Any], flush_every: int = 1):
+        """
+        Args:
+            path: 로그 파일 경로 (.jsonl 또는 .jsonl.zst)
+            header: 실행 설정 (재개 시 기존 로그와 같아야 함)
+            flush_every: 기록 몇 개마다 파일에 반영할지 (비정상 종료 시 최대 손실 수)
+        """
+        if flush_every <= 0:
+            raise ValueError("flush_every는 1 이상이어야 합니다.")
+        self.path = path
+        # 재개 시 파일에서 읽은 설정과 비교하므로 JSON 형식으로 정규화 (튜플 -> 리스트 등)
+        self.header = json.loads(json.dumps({"type": "header", **header}))
+        self.flush_every = flush_every
+        self._raw: Optional[IO[bytes]] = None
+        self._writer: Optional[IO[bytes]] = None
+        self._pending = 0
+
+    def open(self) -> List[Dict[str, Any]]:
+        """
+        로그를 열고, 기존 로그가 있으면 완료된 기록을 반환합니다.
+
+        Returns:
+            이전 실행에서 완료된 질문별 기록 리스트 (새 로그이면 빈 리스트)
+        """
+        records: List[Dict[str, Any]] = []
+        if os.path.exists(self.path):
+            lines, truncated = read_jsonl(self.path)
+            if lines:
+                if lines[0] != self.header:
+                    raise ValueError(
+                        f"기존 실행 로그의 설정이 현재 설정과 다릅니다: {self.path} "
+                        "(다른 로그 경로를 지정하세요)"
+                    )
+                records = lines[1:]
+            if truncated:
+                logging.warning(f"실행 로그의 잘린 마지막 기록을 버립니다: {self.path}")
+            logging.info(f"실행 로그 재개: {self.path} (완료된 기록 {len(records)}개)")
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # 완료된 기록으로 새 파일을 만든 뒤 교체 (잘린 기록/압축 프레임 제거)
+        fd, tmp_path = tempfile.mkstemp(prefix=".run-log-", dir=directory)
+        raw = os.fdopen(fd, "wb")
+        try:
+            os.chmod(tmp_path, 0o644)
+            writer = self._wrap(raw)
+            for record in [self.header] + records:
+                writer.write(self._encode(record))
+            self._raw, self._writer = raw, writer
+            self.flush()
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            raw.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return records
+
+    def _wrap(self, raw: IO[bytes]) -> IO[bytes]:
+        """파일 스트림을 압축 스트림으로 감쌉니다. (.zst가 아니면 그대로)"""
+        if not self.path.endswith(ZSTD_SUFFIX):
+            return raw
+        zstandard = _require_zstandard()
+        return zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=False)
+
+    @staticmethod
+    def _encode(record: Dict[str, Any]) -> bytes:
+        """기록 하나를 JSONL 한 줄로 변환합니다."""
+        return (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """질문별 기록 하나를 추가합니다."""
+        if self._writer is None:
+            raise RuntimeError(
+                "실행 로그가 열려있지 않습니다. open()을 먼저 호출하세요."
+            )
+        self._writer.write(self._encode(record))
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """버퍼의 기록을 파일에 반영합니다. (zstd는 블록 단위로 압축 해제 가능해짐)"""
+        if self._writer is None:
+            return
+        if self._writer is not self._raw:
+            zstandard = _require_zstandard()
+            self._writer.flush(zstandard.FLUSH_BLOCK)
+        self._raw.flush()
+        self._pending = 0
+
+    def close(self) -> None:
+        """로그를 닫습니다. (zstd 프레임 종료)"""
+        if self._writer is None:
+            return
+        if self._writer is not self._raw:
+            self._writer.close()
+        self._raw.close()
+        self._raw = self._writer = None
+
+    def __enter__(self) -> "JsonlRunLog":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _update_digest(digest: Any, file_path: str) -> None:
+    """파일 내용을 해시에 추가합니다."""
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+
+
+def file_fingerprint(file_path: str) -> str:
+    """
+    파일 내용의 SHA-256 지문을 계산합니다. (평가 데이터셋 변경 확인용)
+
+    Args:
+        file_path: 파일 경로
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    digest = hashlib.sha256()
+    _update_digest(digest, file_path)
+    return digest.hexdigest()
+
+
+def knowledge_base_fingerprint(vector_store_path: str) -> str:
+    """
+    저장된 지식베이스 디렉토리의 내용 지문을 계산합니다.
+
+    인덱스, 청크 저장소, 색인 파일의 이름과 내용을 해시하므로 지식베이스를 다시
+    구축하거나 갱신하면 지문이 바뀝니다.
+
+    Args:
+        vector_store_path: 벡터 저장소 경로
+
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    if not os.path.isdir(vector_store_path):
+        raise FileNotFoundError(f"벡터 저장소를 찾을 수 없습니다: {vector_store_path}")
+
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(vector_store_path)):
+        file_path = os.path.join(vector_store_path, name)
+        if name.startswith(".") or not os.path.isfile(file_path):
+            continue
+        digest.update(name.encode("utf-8") + b"\0")
+        _update_digest(digest, file_path)
+    return digest.hexdigest()
+
+
+class RetrievalCache:
+    """
+    검색 결과 디스크 캐시
+
+    (모델명, 지식베이스 지문, 검색 설정, 쿼리)를 키로 검색된 문서 ID 리스트를
+    저장합니다. 항목은 캐시 파일에 한 줄씩 추가되므로 평가가 중간에 중단되어도
+    그때까지의 결과가 남습니다. 저장된 결과가 요청한 k 이상이면 앞쪽 k개를 반환하므로,
+    더 작은 k로 다시 평가할 때는 검색하지 않습니다.
+    """
+
+    FILE_NAME = "retrieval_cache.jsonl"
+
+    def __init__(
+        self,
+        cache_dir: str,
+        model_name: str,
+        kb_fingerprint: str,
+        search_config: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            cache_dir: 캐시 루트 디렉토리
+            model_name: 임베딩 모델명
+            kb_fingerprint: knowledge_base_fingerprint() 결과
+            search_config: 결과에 영향을 주는 검색 설정 (검색 방식, 융합 방식 등)
+        """
+        namespace = json.dumps(
+            {
+                "model_name": model_name,
+                "kb_fingerprint": kb_fingerprint,
+                "search_config": search_config or {},
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        self.namespace = hashlib.sha256(namespace.encode("utf-8")).hexdigest()[:16]
+        self.cache_path = os.path.join(cache_dir, self.namespace)
+        self.hits = 0
+        self.misses = 0
+
+        # 쿼리 -> (검색한 결과 수, 문서 ID 리스트)
+        self._entries: Dict[str, Tuple[int, List[str]]] = {}
+        os.makedirs(self.cache_path, exist_ok=True)
+        namespace_file = os.path.join(self.cache_path, "namespace.json")
+        if not os.path.exists(namespace_file):
+            with open(namespace_file, "w", encoding="utf-8") as f:
+                f.write(namespace)
+
+        cache_file = os.path.join(self.cache_path, self.FILE_NAME)
+        if os.path.exists(cache_file):
+            records, truncated = read_jsonl(cache_file)
+            for record in records:
+                self._store(record["query"], record["k"], record["retrieved"])
+            logging.info(f"검색 결과 캐시 로드: {len(self._entries)}개 ({cache_file})")
+            if truncated:
+                # 잘린 줄 뒤에 이어 쓰면 다음 항목까지 깨지므로 정상 항목만 다시 기록
+                self._rewrite(cache_file)
+        self._file = open(cache_file, "a", encoding="utf-8")
+
+    def _store(self, query: str, k: int, retrieved: List[str]) -> None:
+        """같은 쿼리를 더 큰 k로 검색한 결과가 있으면 유지하고, 없으면 저장합니다."""
+        if query not in self._entries or self._entries[query][0] < k:
+            self._entries[query] = (k, retrieved)
+
+    @staticmethod
+    def _encode(query: str, k: int, retrieved: List[str]) -> str:
+        """캐시 항목 하나를 JSONL 한 줄로 변환합니다."""
+        record = {"query": query, "k": k, "retrieved": retrieved}
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+    def _rewrite(self, cache_file: str) -> None:
+        """메모리의 항목으로 캐시 파일을 다시 기록합니다."""
+        tmp_file = cache_file + ".tmp"
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            for query, (k, retrieved) in self._entries.items():
+                f.write(self._encode(query, k, retrieved))
+        os.replace(tmp_file, cache_file)
+
+    def contains(self, query: str, k: int) -> bool:
+        """쿼리를 k개 이상 검색한 결과가 있는지 확인합니다. (통계에 포함하지 않음)"""
+        entry = self._entries.get(query)
+        return entry is not None and entry[0] >= k
+
+    def get(self, query: str, k: int) -> Optional[List[str]]:
+        """
+        캐시된 검색 결과를 조회합니다.
+
+        Args:
+            query: 검색 쿼리
+            k: 필요한 결과 수
+
+        Returns:
+            앞쪽 k개 문서 ID 리스트 (캐시에 k개 이상 검색한 결과가 없으면 None)
+        """
+        if not self.contains(query, k):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._entries[query][1][:k]
+
+    def put(self, query: str, k: int, retrieved: List[str]) -> None:
+        """
+        검색 결과를 캐시에 추가합니다.
+
+        Args:
+            query: 검색 쿼리
+            k: 검색한 결과 수
+            retrieved: 검색된 문서 ID 리스트
+        """
+        self._store(query, k, retrieved)
+        self._file.write(self._encode(query, k, retrieved))
+
+    def flush(self) -> None:
+        """추가된 항목을 파일에 반영합니다."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """캐시 파일을 닫습니다."""
+        if not self._file.closed:
+            self._file.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계를 반환합니다."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
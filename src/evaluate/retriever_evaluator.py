@@ -4,14 +4,26 @@ import json
 import logging
 import math
 import os
-from typing import Any, Callable, Dict, List
+import time
+from typing import Any, Callable, Dict, List, Optional
 
+import numpy as np
 from tqdm import tqdm
 
+from src.evaluate.eval_log import (
+    ZSTD_SUFFIX,
+    JsonlRunLog,
+    RetrievalCache,
+    file_fingerprint,
+    knowledge_base_fingerprint,
+    read_jsonl,
+)
 from src.knowledge_base.embedding.sentence_transformers_embedding import (
     SentenceTransformersEmbedding,
 )
+from src.knowledge_base.retrieval.cross_encoder_reranker import CrossEncoderReranker
 from src.knowledge_base.retrieval.vector_store_retriever import VectorStoreRetriever
+from src.knowledge_base.storage.title_index import normalize_title
 
 # 로깅 설정
 logging.basicConfig(
@@ -70,6 +82,7 @@ def evaluate_retriever_metrics(
     test_data: List[Dict[str, Any]],
     retrieve_function: Callable[[str], List[str]],
     k_values: List[int],
+    normalize_id: Optional[Callable[[str], str]] = None,
 ) -> tuple[Dict[int, Dict[str, float]], List[Dict[str, Any]]]:
     """
     RAG 검색 시스템의 검색 성능 지표를 계산합니다.
@@ -80,6 +93,8 @@ def evaluate_retriever_metrics(
         retrieve_function (callable): 사용자 쿼리(str)를 받아 검색된 문서 ID 리스트(list[str])를 반환하는 함수.
                                       검색된 문서 리스트는 관련성이 높은 순서로 정렬되어 있어야 합니다.
         k_values (list): 평가할 상위 K 값들의 리스트.
+        normalize_id (callable, optional): 정답 ID와 검색된 문서 ID를 비교 전에
+                                           정규화하는 함수 (예: 제목의 꺾쇠괄호 제거).
 
     Returns:
         tuple: (평균 지표 dict, 검색 로그 리스트)
@@ -109,17 +124,24 @@ def evaluate_retriever_metrics(
 
         retrieved_docs = retrieve_function(query)
 
+        if normalize_id is not None:
+            compared_relevant_id = normalize_id(relevant_doc_id)
+            compared_docs = [normalize_id(doc_id) for doc_id in retrieved_docs]
+        else:
+            compared_relevant_id = relevant_doc_id
+            compared_docs = retrieved_docs
+
         search_log = {
             "query": query,
             "relevant_doc_id": relevant_doc_id,
             "retrieved_docs": retrieved_docs,
-            "hit_found": relevant_doc_id in retrieved_docs,
+            "hit_found": compared_relevant_id in compared_docs,
         }
         search_logs.append(search_log)
 
         first_hit_rank = -1
         try:
-            first_hit_rank = retrieved_docs.index(relevant_doc_id)
+            first_hit_rank = compared_docs.index(compared_relevant_id)
         except ValueError:
             first_hit_rank = -1
 
@@ -162,55 +184,431 @@ def evaluate_retriever_metrics(
     return final_metrics, search_logs
 
 
+def compute_hit_ranks(
+    retrieved_ids: List[List[str]],
+    relevant_ids: List[str],
+    normalize_id: Optional[Callable[[str], str]] = None,
+) -> np.ndarray:
+    """
+    쿼리별로 정답 문서가 처음 등장하는 순위(0부터)를 계산합니다.
+
+    Args:
+        retrieved_ids: 쿼리별 검색된 문서 ID 리스트 (관련성 순)
+        relevant_ids: 쿼리별 정답 문서 ID
+        normalize_id: 비교 전에 ID를 정규화하는 함수 (선택사항)
+
+    Returns:
+        쿼리별 첫 정답 순위 배열 (shape: [num_queries], 정답이 없으면 -1)
+    """
+    if normalize_id is not None:
+        retrieved_ids = [
+            [normalize_id(doc_id) for doc_id in ids] for ids in retrieved_ids
+        ]
+        relevant_ids = [normalize_id(doc_id) for doc_id in relevant_ids]
+
+    # 검색 결과 수가 쿼리마다 다를 수 있으므로 None으로 채운 객체 행렬로 비교
+    width = max((len(ids) for ids in retrieved_ids), default=0)
+    if width == 0:
+        return np.full(len(retrieved_ids), -1, dtype=np.int64)
+    retrieved = np.full((len(retrieved_ids), width), None, dtype=object)
+    for row, ids in enumerate(retrieved_ids):
+        retrieved[row, : len(ids)] = ids
+    relevant = np.empty((len(relevant_ids), 1), dtype=object)
+    relevant[:, 0] = relevant_ids
+
+    matches = retrieved == relevant
+    return np.where(matches.any(axis=1), matches.argmax(axis=1), -1)
+
+
+def metrics_from_hit_ranks(
+    hit_ranks: np.ndarray, k_values: List[int]
+) -> Dict[int, Dict[str, float]]:
+    """
+    첫 정답 순위 배열로 모든 k의 평균 지표를 한 번에 계산합니다.
+
+    쿼리마다 정답 문서가 하나이므로, k 이내 적중 여부와 순위만으로 모든 지표가
+    결정됩니다. (precision@k = 1/k, MAP = MRR)
+
+    Args:
+        hit_ranks: 쿼리별 첫 정답 순위 (정답이 없으면 -1)
+        k_values: 평가할 상위 K 값 리스트
+
+    Returns:
+        {k: {"recall", "precision", "f1", "mrr", "map", "ndcg"}} 평균 지표
+    """
+    metric_names = ("recall", "precision", "f1", "mrr", "map", "ndcg")
+    if len(hit_ranks) == 0:
+        return {k: dict.fromkeys(metric_names, 0.0) for k in k_values}
+
+    hit_ranks = np.asarray(hit_ranks)
+    num_queries = len(hit_ranks)
+    # hits[j, i]: j번째 k 이내에 i번째 쿼리의 정답이 있는지
+    hits = (hit_ranks >= 0) & (hit_ranks < np.asarray(k_values)[:, None])
+
+    # 쿼리별 값은 기존 함수와 같은 연산으로 계산 (정답이 없는 쿼리는 순위 0으로 계산한 뒤 제외)
+    ranks = np.maximum(hit_ranks, 0)
+    discounts = np.array([1.0 / math.log2(rank + 2) for rank in range(ranks.max() + 1)])
+    precision = np.array([1.0 / k for k in k_values])
+    f1 = 2 * (precision * 1.0) / (precision + 1.0)
+    per_query = {
+        "recall": hits * 1.0,
+        "precision": hits * precision[:, None],
+        "f1": hits * f1[:, None],
+        "mrr": hits * (1.0 / (ranks + 1)),
+        "ndcg": hits * discounts[ranks],
+    }
+    # np.sum은 쌍별 합산이라 마지막 자리가 달라질 수 있으므로 쿼리 순서대로 누적
+    means = {
+        name: np.add.accumulate(values, axis=1)[:, -1] / num_queries
+        for name, values in per_query.items()
+    }
+    means["map"] = means["mrr"]  # 정답 문서가 하나이면 MAP와 MRR이 같음
+
+    return {
+        k: {name: float(means[name][j]) for name in metric_names}
+        for j, k in enumerate(k_values)
+    }
+
+
+def evaluate_retriever_metrics_batch(
+    test_data: List[Dict[str, Any]],
+    batch_retrieve_function: Callable[[List[str]], List[List[str]]],
+    k_values: List[int],
+    normalize_id: Optional[Callable[[str], str]] = None,
+) -> tuple[Dict[int, Dict[str, float]], List[Dict[str, Any]]]:
+    """
+    데이터셋 전체 쿼리를 한 번에 검색하고 지표를 벡터 연산으로 계산합니다.
+
+    evaluate_retriever_metrics()와 같은 지표와 검색 로그를 반환하지만, 쿼리마다
+    검색 함수를 호출하는 대신 batch_retrieve_function을 한 번 호출하고, 첫 정답
+    순위 배열로 모든 k의 지표를 NumPy 연산으로 계산합니다.
+
+    Args:
+        test_data: 평가 데이터셋 (evaluate_retriever_metrics와 같은 형식)
+        batch_retrieve_function: 쿼리 리스트를 받아 쿼리별 검색된 문서 ID 리스트를
+            반환하는 함수 (예: 배치 인코딩 + 단일 FAISS 검색)
+        k_values: 평가할 상위 K 값 리스트
+        normalize_id: 정답 ID와 검색된 문서 ID를 비교 전에 정규화하는 함수 (선택사항)
+
+    Returns:
+        (평균 지표 dict, 검색 로그 리스트)
+    """
+    if not test_data:
+        return metrics_from_hit_ranks(np.empty(0, dtype=np.int64), k_values), []
+
+    queries = [_create_query_from_answer(item) for item in test_data]
+    relevant_ids = [item["output"]["article"] for item in test_data]
+
+    logging.info(f"전체 쿼리 {len(queries)}개를 한 번에 검색합니다.")
+    retrieved_ids = batch_retrieve_function(queries)
+    if len(retrieved_ids) != len(queries):
+        raise ValueError(
+            f"검색 결과 수가 쿼리 수와 다릅니다: {len(retrieved_ids)} != {len(queries)}"
+        )
+
+    hit_ranks = compute_hit_ranks(retrieved_ids, relevant_ids, normalize_id)
+    search_logs = [
+        {
+            "query": query,
+            "relevant_doc_id": relevant_id,
+            "retrieved_docs": retrieved,
+            "hit_found": bool(rank >= 0),
+        }
+        for query, relevant_id, retrieved, rank in zip(
+            queries, relevant_ids, retrieved_ids, hit_ranks
+        )
+    ]
+    return metrics_from_hit_ranks(hit_ranks, k_values), search_logs
+
+
+def stream_search_logs(
+    test_data: List[Dict[str, Any]],
+    batch_retrieve_function: Callable[[List[str]], List[List[str]]],
+    max_k: int,
+    normalize_id: Optional[Callable[[str], str]] = None,
+    run_log: Optional[JsonlRunLog] = None,
+    completed: Optional[List[Dict[str, Any]]] = None,
+    retrieval_cache: Optional[RetrievalCache] = None,
+    batch_size: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    질문별 검색 기록을 만들면서 실행 로그에 바로 기록합니다.
+
+    이전 실행에서 완료된 기록(completed) 다음 질문부터 batch_size개씩 검색하며,
+    검색 결과 캐시에 있는 쿼리는 검색하지 않습니다.
+
+    Args:
+        test_data: 평가 데이터셋 (evaluate_retriever_metrics와 같은 형식)
+        batch_retrieve_function: 쿼리 리스트를 받아 쿼리별 검색된 문서 ID 리스트를
+            반환하는 함수
+        max_k: 쿼리별 검색할 문서 수 (캐시 키의 k)
+        normalize_id: 정답 ID와 검색된 문서 ID를 비교 전에 정규화하는 함수 (선택사항)
+        run_log: 열려있는 실행 로그 (선택사항)
+        completed: 이전 실행에서 완료된 기록 (run_log.open()의 반환값)
+        retrieval_cache: 검색 결과 캐시 (선택사항)
+        batch_size: 한 번에 검색하고 기록할 질문 수
+
+    Returns:
+        전체 질문의 검색 기록 리스트 (completed 포함)
+    """
+    search_logs = list(completed or [])
+    for position, record in enumerate(search_logs):
+        if record.get("index") != position:
+            raise ValueError(
+                f"실행 로그의 기록 순서가 올바르지 않습니다: {position}번째"
+            )
+
+    with tqdm(
+        total=len(test_data), initial=len(search_logs), desc="Evaluating Retriever"
+    ) as progress:
+        for start in range(len(search_logs), len(test_data), batch_size):
+            items = test_data[start : start + batch_size]
+            queries = [_create_query_from_answer(item) for item in items]
+
+            retrieved = [
+                retrieval_cache.get(query, max_k) if retrieval_cache else None
+                for query in queries
+            ]
+            missing = [i for i, docs in enumerate(retrieved) if docs is None]
+            if missing:
+                fetched = batch_retrieve_function([queries[i] for i in missing])
+                for i, docs in zip(missing, fetched):
+                    retrieved[i] = docs
+                    if retrieval_cache is not None:
+                        retrieval_cache.put(queries[i], max_k, docs)
+                if retrieval_cache is not None:
+                    retrieval_cache.flush()
+
+            relevant_ids = [item["output"]["article"] for item in items]
+            hit_ranks = compute_hit_ranks(retrieved, relevant_ids, normalize_id)
+            for offset, (query, relevant_id, docs, rank) in enumerate(
+                zip(queries, relevant_ids, retrieved, hit_ranks)
+            ):
+                record = {
+                    "index": start + offset,
+                    "query": query,
+                    "relevant_doc_id": relevant_id,
+                    "retrieved_docs": docs,
+                    "hit_found": bool(rank >= 0),
+                }
+                search_logs.append(record)
+                if run_log is not None:
+                    run_log.append(record)
+            if run_log is not None:
+                run_log.flush()
+            progress.update(len(items))
+    return search_logs
+
+
+def score_search_logs(
+    search_logs: List[Dict[str, Any]],
+    k_values: List[int],
+    normalize_id: Optional[Callable[[str], str]] = None,
+) -> Dict[int, Dict[str, float]]:
+    """
+    저장된 검색 기록으로 지표를 다시 계산합니다. (검색 없이 k_values만 바꿔 재평가)
+
+    Args:
+        search_logs: 질문별 검색 기록 (relevant_doc_id, retrieved_docs)
+        k_values: 평가할 상위 K 값 리스트
+        normalize_id: 정답 ID와 검색된 문서 ID를 비교 전에 정규화하는 함수 (선택사항)
+
+    Returns:
+        {k: 평균 지표} (evaluate_retriever_metrics와 같은 값)
+    """
+    hit_ranks = compute_hit_ranks(
+        [record["retrieved_docs"] for record in search_logs],
+        [record["relevant_doc_id"] for record in search_logs],
+        normalize_id,
+    )
+    return metrics_from_hit_ranks(hit_ranks, k_values)
+
+
+def print_metrics(metrics: Dict[int, Dict[str, float]]) -> None:
+    """k별 평균 지표를 출력합니다."""
+    print("\n--- 검색 시스템 성능 평가 결과 ---")
+    for k, values in metrics.items():
+        print(f"\n--- Metrics for k={k} ---")
+        for metric_name, value in values.items():
+            print(f"{metric_name.capitalize()}: {value:.4f}")
+    print("------------------------------------")
+
+
+def rescore(args) -> None:
+    """저장된 실행 로그로 검색 없이 지표만 다시 계산합니다."""
+    lines, truncated = read_jsonl(args.rescore)
+    if not lines or lines[0].get("type") != "header":
+        raise ValueError(f"실행 로그 형식이 아닙니다: {args.rescore}")
+    header, search_logs = lines[0], lines[1:]
+    if truncated or len(search_logs) != header["dataset_size"]:
+        logging.warning(
+            f"완료되지 않은 실행 로그입니다: {len(search_logs)}/{header['dataset_size']}개"
+        )
+
+    k_values = [int(k) for k in args.k_values.split(",")]
+    if max(k_values) > header["max_k"]:
+        raise ValueError(
+            f"실행 로그는 상위 {header['max_k']}개까지만 검색했습니다: k={max(k_values)}"
+        )
+
+    results = {
+        **{key: value for key, value in header.items() if key != "type"},
+        "run_log": args.rescore,
+        "evaluation_time": datetime.datetime.now().isoformat(),
+        "num_queries": len(search_logs),
+        "k_values": k_values,
+        "metrics": score_search_logs(search_logs, k_values, normalize_title),
+    }
+    print_metrics(results["metrics"])
+    save_results(results, args.output_dir)
+
+
 def main(args):
     """메인 실행 함수"""
+    if args.rescore:
+        rescore(args)
+        return
+
     logging.info("평가를 시작합니다.")
 
     # 1. 데이터셋 로드
     logging.info(f"데이터셋 로딩: {args.dataset_path}")
     eval_dataset = load_dataset(args.dataset_path)
+    k_values = [int(k) for k in args.k_values.split(",")]
+    max_k = max(k_values)
 
-    # 2. 임베딩 모델 및 Retriever 초기화
+    # 2. 실행 로그 및 검색 결과 캐시 준비
+    reranker = (
+        CrossEncoderReranker.from_config(args.config_path) if args.rerank else None
+    )
+    search_config = {
+        "search_mode": args.search_mode,
+        "fusion": args.fusion if args.search_mode == "hybrid" else None,
+        "rerank_model": reranker.model_name if reranker is not None else None,
+        "rerank_fetch_k": reranker.fetch_k if reranker is not None else None,
+    }
+    kb_fingerprint = knowledge_base_fingerprint(args.vector_store_path)
+    header = {
+        "model_name": args.model_name,
+        "dataset": args.dataset_path,
+        "dataset_fingerprint": file_fingerprint(args.dataset_path),
+        "dataset_size": len(eval_dataset),
+        "vector_store": args.vector_store_path,
+        "kb_fingerprint": kb_fingerprint,
+        "search_config": search_config,
+        "max_k": max_k,
+    }
+    run_log_path = args.run_log or os.path.join(
+        args.output_dir,
+        f"retriever_run_{datetime.datetime.now():%Y%m%d_%H%M%S}.jsonl"
+        + (ZSTD_SUFFIX if args.compress_log else ""),
+    )
+    run_log = JsonlRunLog(run_log_path, header)
+    completed = run_log.open()
+
+    retrieval_cache = (
+        RetrievalCache(
+            args.retrieval_cache_dir, args.model_name, kb_fingerprint, search_config
+        )
+        if args.retrieval_cache_dir
+        else None
+    )
+    pending_queries = [
+        query
+        for query in map(_create_query_from_answer, eval_dataset[len(completed) :])
+        if retrieval_cache is None or not retrieval_cache.contains(query, max_k)
+    ]
+    logging.info(
+        f"검색할 질문: {len(pending_queries)}개 "
+        f"(완료 {len(completed)}개, 전체 {len(eval_dataset)}개)"
+    )
+
+    # 3. 임베딩 모델 및 Retriever 초기화 (모델은 첫 인코딩 시 로드)
     logging.info(f"임베딩 모델 및 Retriever 초기화 중: {args.model_name}")
-    embedding_model = SentenceTransformersEmbedding(model_name=args.model_name)
+    embedding_model = SentenceTransformersEmbedding(
+        model_name=args.model_name,
+        query_cache_size=max(1024, len(eval_dataset)),
+        num_workers=args.embed_workers,
+    )
     retriever = VectorStoreRetriever(
         vector_store_path=args.vector_store_path,
         embedding_model=embedding_model,
+        reranker=reranker,
     )
+    if args.embed_workers and pending_queries:
+        # 검색할 평가 쿼리 전체를 작업 프로세스들로 미리 인코딩하여 쿼리 캐시에 저장
+        embedding_model.warm_query_cache(pending_queries)
+        embedding_model.close()
     logging.info("초기화 완료.")
 
-    # 3. 검색 함수 정의
-    k_values = [int(k) for k in args.k_values.split(",")]
-    max_k = max(k_values)
-
+    # 4. 검색 함수 정의
     def retrieve_function(query: str) -> List[str]:
-        retrieved_docs = retriever.search(query=query, k=max_k)
+        if reranker is not None:
+            first_stage = "hybrid" if args.search_mode == "hybrid" else "dense"
+            retrieved_docs = retriever.rerank_search(
+                query=query, k=max_k, first_stage=first_stage
+            )
+        elif args.search_mode == "hybrid":
+            retrieved_docs = retriever.hybrid_search(
+                query=query, k=max_k, fusion=args.fusion
+            )
+        elif args.search_mode == "reference":
+            retrieved_docs = retriever.reference_search(query=query, k=max_k)
+        else:
+            retrieved_docs = retriever.search(query=query, k=max_k)
         return [doc.metadata.get("title", "") for doc in retrieved_docs]
 
-    # 4. 평가 수행
-    logging.info(f"k={k_values}에 대한 평가를 수행합니다.")
-
-    eval_metrics, search_logs = evaluate_retriever_metrics(
-        eval_dataset, retrieve_function, k_values
-    )
+    def batch_retrieve_function(queries: List[str]) -> List[List[str]]:
+        if args.batch_eval and reranker is None and args.search_mode == "dense":
+            # 쿼리 묶음을 한 번에 인코딩하고 max_k로 단일 FAISS 검색
+            results = retriever.search_batch(queries, k=max_k)
+            return [[doc.metadata.get("title", "") for doc in docs] for docs in results]
+        # 쿼리별 검색이 필요한 방식은 검색만 순차로 수행
+        return [retrieve_function(query) for query in queries]
+
+    # 5. 평가 수행 (질문별 기록을 실행 로그에 바로 기록)
+    # --batch_eval은 기본적으로 남은 질문 전체를 한 번의 배치 인코딩 + FAISS 검색으로 처리
+    eval_batch_size = 1
+    if args.batch_eval:
+        eval_batch_size = args.eval_batch_size or max(len(eval_dataset), 1)
+    logging.info(f"k={k_values}에 대한 평가를 수행합니다. (실행 로그: {run_log_path})")
+    evaluation_start = time.perf_counter()
+    with run_log:
+        # 정답(<규범 - 조항>)과 청크 제목(규범 - 조항)의 표기 차이를 정규화하여 비교
+        search_logs = stream_search_logs(
+            eval_dataset,
+            batch_retrieve_function,
+            max_k,
+            normalize_id=normalize_title,
+            run_log=run_log,
+            completed=completed,
+            retrieval_cache=retrieval_cache,
+            batch_size=eval_batch_size,
+        )
+    if retrieval_cache is not None:
+        retrieval_cache.close()
+    eval_metrics = score_search_logs(search_logs, k_values, normalize_title)
+    evaluation_seconds = time.perf_counter() - evaluation_start
+    logging.info(f"평가 소요 시간: {evaluation_seconds:.2f}초")
 
     results = {
-        "model_name": args.model_name,
-        "dataset": args.dataset_path,
-        "vector_store": args.vector_store_path,
+        **header,
+        "run_log": run_log_path,
+        "resumed_from": len(completed),
+        "rerank": reranker.get_stats() if reranker is not None else None,
+        "retrieval_cache": (
+            retrieval_cache.get_stats() if retrieval_cache is not None else None
+        ),
         "evaluation_time": datetime.datetime.now().isoformat(),
+        "evaluation_seconds": evaluation_seconds,
+        "batch_eval": args.batch_eval,
+        "num_queries": len(search_logs),
         "k_values": k_values,
         "metrics": eval_metrics,
-        "logs": search_logs,
     }
 
-    # 5. 결과 출력 및 저장
-    print("\n--- 검색 시스템 성능 평가 결과 ---")
-    for k, metrics in results["metrics"].items():
-        print(f"\n--- Metrics for k={k} ---")
-        for metric_name, value in metrics.items():
-            print(f"{metric_name.capitalize()}: {value:.4f}")
-    print("------------------------------------")
+    # 6. 결과 출력 및 저장 (질문별 기록은 실행 로그에 있음)
+    print_metrics(results["metrics"])
     save_results(results, args.output_dir)
 
 
@@ -246,5 +644,82 @@ if __name__ == "__main__":
         default="1,3,5,10",
         help="평가를 수행할 k 값들의 쉼표로 구분된 리스트",
     )
+    parser.add_argument(
+        "--search_mode",
+        type=str,
+        choices=["dense", "hybrid", "reference"],
+        default="dense",
+        help=(
+            "검색 방식 (dense: 벡터 검색, hybrid: BM25 + 벡터 검색 융합, "
+            "reference: 조항 인용 시 제목 색인 조회 후 벡터 검색)"
+        ),
+    )
+    parser.add_argument(
+        "--fusion",
+        type=str,
+        choices=["rrf", "weighted"],
+        default="rrf",
+        help="hybrid 검색 시 점수 융합 방식",
+    )
+    parser.add_argument(
+        "--rerank",
+        action="store_true",
+        help="설정 파일의 rerank_model로 1차 검색 후보를 재순위화 (retrieval.rerank가 true일 때)",
+    )
+    parser.add_argument(
+        "--batch_eval",
+        action="store_true",
+        help=(
+            "전체 질문을 배치 인코딩 + 단일 FAISS 검색으로 처리하고 지표를 벡터 연산으로 계산 "
+            "(dense 검색, 재순위화 미사용 시. 그 외 방식은 검색만 질문별로 수행)"
+        ),
+    )
+    parser.add_argument(
+        "--eval_batch_size",
+        type=int,
+        default=None,
+        help=(
+            "--batch_eval 시 한 번에 검색하고 실행 로그에 기록할 질문 수 "
+            "(기본값: 전체 질문을 한 번에 검색)"
+        ),
+    )
+    parser.add_argument(
+        "--run_log",
+        type=str,
+        default=None,
+        help=(
+            "질문별 기록을 스트리밍할 JSONL 실행 로그 경로 (.zst이면 zstd 압축). "
+            "기존 로그를 지정하면 마지막 완료 질문 다음부터 재개"
+        ),
+    )
+    parser.add_argument(
+        "--compress_log",
+        action="store_true",
+        help="--run_log를 지정하지 않았을 때 새 실행 로그를 zstd로 압축 (.jsonl.zst)",
+    )
+    parser.add_argument(
+        "--retrieval_cache_dir",
+        type=str,
+        default="data/knowledge_base/retrieval_cache",
+        help="(모델, 지식베이스 지문, 검색 설정, 쿼리)별 검색 결과 캐시 디렉토리 (빈 값이면 미사용)",
+    )
+    parser.add_argument(
+        "--rescore",
+        type=str,
+        default=None,
+        help="검색 없이 지정한 실행 로그의 기록으로 --k_values 지표만 다시 계산",
+    )
+    parser.add_argument(
+        "--embed_workers",
+        type=int,
+        default=0,
+        help="평가 질문을 미리 인코딩할 임베딩 작업 프로세스 수 (0이면 질문마다 인코딩)",
+    )
+    parser.add_argument(
+        "--config_path",
+        type=str,
+        default="config/model_config.yaml",
+        help="재순위화 설정을 읽을 모델 설정 파일 경로",
+    )
     args = parser.parse_args()
     main(args)
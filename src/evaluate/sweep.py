@@ -0,0 +1,653 @@
+"""
+Retriever Sweep
+청크 크기, 임베딩 모델, 인덱스 종류, 쿼리 생성 방식, k 값의 조합(그리드)을 평가하여
+하나의 비교 표로 저장하는 모듈
+
+서로 다른 청킹/임베딩 결과(아티팩트)는 한 번만 만들어 디스크에 저장하고, 인덱스 구축과
+평가는 저장된 벡터로 프로세스 풀에서 병렬 수행하므로 작업 프로세스는 모델을 로드하지 않습니다.
+"""
+
+import argparse
+import csv
+import datetime
+import hashlib
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import yaml
+from langchain_core.documents import Document
+from tqdm import tqdm
+
+from src.evaluate.eval_log import file_fingerprint
+from src.evaluate.retriever_evaluator import (
+    _create_query_from_answer,
+    compute_hit_ranks,
+    load_dataset,
+    metrics_from_hit_ranks,
+)
+from src.knowledge_base.chunking.kor_chunker import KORChunker
+from src.knowledge_base.embedding.sentence_transformers_embedding import (
+    SentenceTransformersEmbedding,
+)
+from src.knowledge_base.loading.pdf_loader import PDFLoader
+from src.knowledge_base.storage.faiss_vector_store import (
+    INDEX_TYPES,
+    METRICS,
+    FAISSVectorStore,
+)
+from src.knowledge_base.storage.title_index import normalize_title
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(message)s")
+
+# 그리드 축 (순서대로 비교 표의 설정 열이 됨)
+SWEEP_KEYS = (
+    "model_name",
+    "chunk_size",
+    "chunk_overlap",
+    "index_type",
+    "metric",
+    "query_strategy",
+)
+# 청킹/임베딩 아티팩트를 구분하는 축과, 인덱스를 구분하는 축
+ARTIFACT_KEYS = ("model_name", "chunk_size", "chunk_overlap")
+INDEX_KEYS = ARTIFACT_KEYS + ("index_type", "metric")
+DEFAULT_GRID = {
+    "model_name": "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
+    "chunk_size": 500,
+    "chunk_overlap": 50,
+    "index_type": "flat",
+    "metric": "cosine",
+    "query_strategy": "answer",
+}
+# 비교 표에 k별로 표시할 지표
+TABLE_METRICS = ("recall", "mrr", "ndcg")
+
+CHUNKS_FILE = "chunks.json"
+QUERIES_FILE = "queries.json"
+EMBEDDINGS_FILE = "embeddings.npy"
+MANIFEST_FILE = "manifest.json"
+
+
+def _create_query_from_question(item: Dict[str, Any]) -> str:
+    """input.question을 그대로 평가 쿼리로 사용합니다."""
+    return item.get("input", {}).get("question", "")
+
+
+QUERY_STRATEGIES: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "answer": _create_query_from_answer,
+    "question": _create_query_from_question,
+}
+
+
+def expand_grid(grid: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    그리드 설정을 개별 설정 조합 리스트로 펼칩니다.
+
+    Args:
+        grid: 축 이름별 값 리스트 (단일 값도 허용, 없는 축은 DEFAULT_GRID 값 사용)
+
+    Returns:
+        SWEEP_KEYS 순서의 설정 dict 리스트 (중복 조합 제외, 그리드 순서 유지)
+    """
+    unknown = set(grid) - set(SWEEP_KEYS)
+    if unknown:
+        raise ValueError(
+            f"알 수 없는 그리드 항목입니다: {sorted(unknown)} (지원: {SWEEP_KEYS})"
+        )
+
+    axes = []
+    for key in SWEEP_KEYS:
+        values = grid.get(key, DEFAULT_GRID[key])
+        values = values if isinstance(values, list) else [values]
+        if not values:
+            raise ValueError(f"그리드 항목에 값이 없습니다: {key}")
+        axes.append(values)
+
+    allowed = {
+        "index_type": INDEX_TYPES,
+        "metric": METRICS,
+        "query_strategy": tuple(QUERY_STRATEGIES),
+    }
+    for key, values in zip(SWEEP_KEYS, axes):
+        invalid = [
+            value for value in values if key in allowed and value not in allowed[key]
+        ]
+        if invalid:
+            raise ValueError(
+                f"지원하지 않는 {key} 값입니다: {invalid} (지원: {allowed[key]})"
+            )
+
+    configs, seen = [], set()
+    for values in itertools.product(*axes):
+        config = dict(zip(SWEEP_KEYS, values))
+        key = json.dumps(config, sort_keys=True, ensure_ascii=False)
+        if key not in seen:
+            seen.add(key)
+            configs.append(config)
+    return configs
+
+
+def _config_key(config: Dict[str, Any], keys: Tuple[str, ...], salt: str) -> str:
+    """설정의 일부 축과 입력 파일 지문으로 아티팩트 디렉토리 이름을 만듭니다."""
+    payload = json.dumps(
+        {"config": {key: config[key] for key in keys}, "salt": salt},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _save_artifact(
+    path: str, payload: Dict[str, Any], records: List[Any], embeddings: np.ndarray
+) -> None:
+    """
+    아티팩트를 임시 디렉토리에 모두 기록한 뒤 교체합니다.
+
+    중단된 저장은 manifest가 없는 임시 디렉토리로만 남으므로 다음 실행에서 다시 만듭니다.
+
+    Args:
+        path: 아티팩트 디렉토리
+        payload: manifest에 기록할 설정
+        records: 벡터 순서대로의 청크 또는 쿼리 기록
+        embeddings: 임베딩 행렬
+    """
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    temp_dir = tempfile.mkdtemp(dir=parent, prefix=".tmp-")
+    try:
+        file_name = CHUNKS_FILE if payload["kind"] == "chunks" else QUERIES_FILE
+        with open(os.path.join(temp_dir, file_name), "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False)
+        np.save(
+            os.path.join(temp_dir, EMBEDDINGS_FILE),
+            np.asarray(embeddings, dtype=np.float32),
+        )
+        with open(os.path.join(temp_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(
+                {**payload, "count": len(records), "dimension": embeddings.shape[1]},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.replace(temp_dir, path)
+    except BaseException:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        raise
+
+
+def _artifact_exists(path: str) -> bool:
+    """저장이 완료된 아티팩트인지 확인합니다."""
+    return os.path.exists(os.path.join(path, MANIFEST_FILE))
+
+
+def build_artifacts(
+    configs: List[Dict[str, Any]],
+    pdf_path: str,
+    test_data: List[Dict[str, Any]],
+    dataset_fingerprint: str,
+    artifact_dir: str,
+    embedding_cache_dir: Optional[str] = None,
+    embed_workers: int = 0,
+) -> Tuple[Dict[str, str], Dict[str, str], Dict[str, int]]:
+    """
+    설정 조합에 필요한 청킹/임베딩 아티팩트와 쿼리 임베딩을 한 번씩만 만듭니다.
+
+    아티팩트는 (모델, 청크 크기, 청크 겹침, PDF 지문), 쿼리 임베딩은 (모델, 쿼리 생성 방식,
+    데이터셋 지문)을 키로 저장되어 다음 스윕에서도 재사용됩니다. PDF는 새로 만들 청크
+    아티팩트가 있을 때 한 번만 로드하고, 모델은 새로 인코딩할 텍스트가 있을 때만 로드합니다.
+
+    Args:
+        configs: expand_grid()가 반환한 설정 조합
+        pdf_path: 참조 문서 PDF 경로
+        test_data: 평가 데이터셋
+        dataset_fingerprint: 평가 데이터셋 파일 지문
+        artifact_dir: 아티팩트 저장 디렉토리
+        embedding_cache_dir: 임베딩 캐시 디렉토리 (청크 크기가 달라도 같은 청크는 재사용)
+        embed_workers: 임베딩 작업 프로세스 수
+
+    Returns:
+        (청크 아티팩트 키별 경로, 쿼리 아티팩트 키별 경로, 생성/재사용 통계)
+    """
+    pdf_fingerprint = file_fingerprint(pdf_path)
+    chunk_paths: Dict[str, str] = {}
+    query_paths: Dict[str, str] = {}
+    stats = {"chunk_built": 0, "chunk_reused": 0, "query_built": 0, "query_reused": 0}
+    pages: Optional[List[Document]] = None
+
+    for model_name in dict.fromkeys(config["model_name"] for config in configs):
+        model_configs = [c for c in configs if c["model_name"] == model_name]
+        embedding_model = SentenceTransformersEmbedding(
+            model_name=model_name,
+            cache_dir=embedding_cache_dir,
+            query_cache_size=0,
+            num_workers=embed_workers,
+        )
+        try:
+            for config in model_configs:
+                key = _config_key(config, ARTIFACT_KEYS, pdf_fingerprint)
+                if key in chunk_paths:
+                    continue
+                path = os.path.join(artifact_dir, "chunks", key)
+                chunk_paths[key] = path
+                if _artifact_exists(path):
+                    stats["chunk_reused"] += 1
+                    continue
+
+                if pages is None:
+                    logging.info(f"PDF 로딩: {pdf_path}")
+                    pages = PDFLoader(pdf_path, num_workers=None).load()
+                chunks = KORChunker(
+                    pages,
+                    os.path.basename(pdf_path),
+                    chunk_size=config["chunk_size"],
+                    chunk_overlap=config["chunk_overlap"],
+                ).process()
+                logging.info(
+                    f"청크 아티팩트 생성: chunk_size={config['chunk_size']}, "
+                    f"chunk_overlap={config['chunk_overlap']} (청크 {len(chunks)}개)"
+                )
+                embeddings = embedding_model.embed_texts(
+                    [chunk.page_content for chunk in chunks]
+                )
+                _save_artifact(
+                    path,
+                    {
+                        "kind": "chunks",
+                        **{k: config[k] for k in ARTIFACT_KEYS},
+                        "pdf_fingerprint": pdf_fingerprint,
+                    },
+                    [
+                        {"page_content": c.page_content, "metadata": c.metadata}
+                        for c in chunks
+                    ],
+                    embeddings,
+                )
+                stats["chunk_built"] += 1
+
+            for strategy in dict.fromkeys(c["query_strategy"] for c in model_configs):
+                query_config = {"model_name": model_name, "query_strategy": strategy}
+                key = _config_key(
+                    query_config, ("model_name", "query_strategy"), dataset_fingerprint
+                )
+                path = os.path.join(artifact_dir, "queries", key)
+                query_paths[key] = path
+                if _artifact_exists(path):
+                    stats["query_reused"] += 1
+                    continue
+
+                queries = [QUERY_STRATEGIES[strategy](item) for item in test_data]
+                logging.info(f"쿼리 임베딩 생성: {strategy} (쿼리 {len(queries)}개)")
+                _save_artifact(
+                    path,
+                    {
+                        "kind": "queries",
+                        **query_config,
+                        "dataset_fingerprint": dataset_fingerprint,
+                    },
+                    queries,
+                    embedding_model.embed_texts(queries),
+                )
+                stats["query_built"] += 1
+        finally:
+            # 새로 인코딩한 청크/쿼리 벡터를 모델마다 한 번에 캐시 파일로 저장
+            embedding_model.save_cache()
+            embedding_model.close()
+
+    return chunk_paths, query_paths, stats
+
+
+def _init_worker(num_threads: int) -> None:
+    """작업 프로세스 시작 시 FAISS 연산 스레드 수를 고정합니다."""
+    import faiss
+
+    faiss.omp_set_num_threads(num_threads)
+
+
+def evaluate_index(task: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    저장된 아티팩트로 인덱스 하나를 구축하고 모든 쿼리 생성 방식을 평가합니다.
+
+    인덱스는 (아티팩트, 인덱스 종류, 척도)별로 한 번만 구축하고, 쿼리 생성 방식마다
+    저장된 쿼리 임베딩으로 max(k_values) 단일 FAISS 검색을 수행합니다.
+
+    Args:
+        task: {"config": 인덱스 설정 (INDEX_KEYS), "chunk_path": 청크 아티팩트 경로,
+            "queries": {쿼리 생성 방식: 쿼리 아티팩트 경로}, "relevant_ids": 정답 조항,
+            "k_values": k 리스트, "index_params": 인덱스 파라미터}
+
+    Returns:
+        쿼리 생성 방식별 결과 dict 리스트
+    """
+    config = task["config"]
+    chunk_path = task["chunk_path"]
+    k_values = task["k_values"]
+
+    with open(os.path.join(chunk_path, CHUNKS_FILE), "r", encoding="utf-8") as f:
+        chunks = [Document(**record) for record in json.load(f)]
+    embeddings = np.load(os.path.join(chunk_path, EMBEDDINGS_FILE))
+
+    # 차원을 알려주므로 저장된 벡터로 인덱스를 만들 때 모델을 로드하지 않음
+    embedding_model = SentenceTransformersEmbedding(
+        model_name=config["model_name"],
+        query_cache_size=0,
+        embedding_dim=embeddings.shape[1],
+    )
+    vector_store = FAISSVectorStore(
+        embedding_model,
+        index_type=config["index_type"],
+        index_params=task.get("index_params"),
+        metric=config["metric"],
+    )
+    start = time.perf_counter()
+    vector_store.add_embeddings(chunks, embeddings)
+    build_seconds = time.perf_counter() - start
+
+    titles = [chunk.metadata.get("title", "") for chunk in chunks]
+    rows = []
+    for strategy, query_path in task["queries"].items():
+        query_embeddings = np.load(os.path.join(query_path, EMBEDDINGS_FILE))
+        start = time.perf_counter()
+        _, positions = vector_store.search_positions(query_embeddings, k=max(k_values))
+        search_seconds = time.perf_counter() - start
+
+        # 저장된 청크가 k보다 적으면 FAISS가 -1 위치를 반환
+        retrieved_ids = [[titles[i] for i in row if i >= 0] for row in positions]
+        hit_ranks = compute_hit_ranks(
+            retrieved_ids, task["relevant_ids"], normalize_title
+        )
+        rows.append(
+            {
+                **config,
+                "query_strategy": strategy,
+                "num_chunks": len(chunks),
+                "build_seconds": build_seconds,
+                "search_ms_per_query": search_seconds * 1000 / max(len(positions), 1),
+                "metrics": metrics_from_hit_ranks(hit_ranks, k_values),
+            }
+        )
+    return rows
+
+
+def run_index_tasks(
+    tasks: List[Dict[str, Any]], workers: int = 0
+) -> List[List[Dict[str, Any]]]:
+    """
+    인덱스 구축/평가 작업을 프로세스 풀에서 병렬로 수행합니다.
+
+    Args:
+        tasks: evaluate_index() 작업 리스트
+        workers: 작업 프로세스 수 (0 또는 1이면 현재 프로세스에서 순차 수행,
+            None이면 CPU 코어 수)
+
+    Returns:
+        작업 순서대로의 evaluate_index() 결과
+    """
+    workers = min(workers if workers is not None else os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        return [evaluate_index(task) for task in tqdm(tasks, desc="인덱스 평가")]
+
+    results: List[Optional[List[Dict[str, Any]]]] = [None] * len(tasks)
+    num_threads = max(1, (os.cpu_count() or 1) // workers)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(num_threads,),
+    ) as executor:
+        futures = {
+            executor.submit(evaluate_index, task): i for i, task in enumerate(tasks)
+        }
+        for future in tqdm(as_completed(futures), total=len(tasks), desc="인덱스 평가"):
+            results[futures[future]] = future.result()
+    return results
+
+
+def comparison_table(
+    rows: List[Dict[str, Any]], k_values: List[int]
+) -> List[Dict[str, Any]]:
+    """
+    설정별 결과를 비교 표의 행(설정 열 + k별 지표 열 + 시간 열)으로 변환합니다.
+
+    Args:
+        rows: 설정 조합 순서대로의 evaluate_index() 결과
+        k_values: 표에 표시할 k 리스트
+
+    Returns:
+        비교 표 행 리스트
+    """
+    table = []
+    for row in rows:
+        line = {key: row[key] for key in SWEEP_KEYS}
+        line["num_chunks"] = row["num_chunks"]
+        for name in TABLE_METRICS:
+            for k in k_values:
+                line[f"{name}@{k}"] = round(row["metrics"][k][name], 4)
+        line["build_seconds"] = round(row["build_seconds"], 3)
+        line["search_ms_per_query"] = round(row["search_ms_per_query"], 4)
+        table.append(line)
+    return table
+
+
+def write_comparison_table(table: List[Dict[str, Any]], output_prefix: str) -> None:
+    """
+    비교 표를 CSV(output_prefix.csv)와 마크다운(output_prefix.md)으로 저장합니다.
+
+    Args:
+        table: comparison_table()이 반환한 행 리스트
+        output_prefix: 확장자를 제외한 저장 경로
+    """
+    os.makedirs(os.path.dirname(output_prefix) or ".", exist_ok=True)
+    columns = list(table[0]) if table else list(SWEEP_KEYS)
+    with open(f"{output_prefix}.csv", "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(table)
+    with open(f"{output_prefix}.md", "w", encoding="utf-8") as f:
+        f.write(format_markdown_table(table, columns))
+
+
+def format_markdown_table(table: List[Dict[str, Any]], columns: List[str]) -> str:
+    """비교 표를 마크다운 표 문자열로 변환합니다."""
+    lines = [
+        "| " + " | ".join(columns) + " |",
+        "|" + "|".join("---" for _ in columns) + "|",
+    ]
+    for line in table:
+        lines.append("| " + " | ".join(str(line[c]) for c in columns) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def run_sweep(sweep_config: Dict[str, Any], workers: int = 0) -> Dict[str, Any]:
+    """
+    그리드 스윕을 실행하고 비교 표를 저장합니다.
+
+    Args:
+        sweep_config: 스윕 설정 (config/sweep_config.yaml의 sweep 항목 형식)
+        workers: 인덱스 구축/평가 작업 프로세스 수
+
+    Returns:
+        스윕 결과 요약 (설정, 아티팩트 통계, 설정별 지표, 비교 표 경로)
+    """
+    sweep_start = time.perf_counter()
+    k_values = sweep_config.get("k_values", [1, 3, 5, 10])
+    if isinstance(k_values, str):
+        k_values = [int(k) for k in k_values.split(",")]
+    configs = expand_grid(sweep_config.get("grid") or {})
+    dataset_path = sweep_config["dataset_path"]
+    test_data = load_dataset(dataset_path)
+    dataset_fingerprint = file_fingerprint(dataset_path)
+    logging.info(f"설정 조합 {len(configs)}개, 평가 질문 {len(test_data)}개")
+
+    # 1. 서로 다른 청킹/임베딩 아티팩트와 쿼리 임베딩을 한 번씩만 생성
+    artifact_start = time.perf_counter()
+    pdf_path = sweep_config["pdf_path"]
+    chunk_paths, query_paths, artifact_stats = build_artifacts(
+        configs,
+        pdf_path,
+        test_data,
+        dataset_fingerprint,
+        sweep_config["artifact_dir"],
+        embedding_cache_dir=sweep_config.get("embedding_cache_dir"),
+        embed_workers=sweep_config.get("embed_workers", 0),
+    )
+    artifact_seconds = time.perf_counter() - artifact_start
+    logging.info(f"아티팩트 준비 완료: {artifact_stats} ({artifact_seconds:.2f}초)")
+
+    # 2. (아티팩트, 인덱스 종류, 척도)별 작업으로 묶어 병렬 평가
+    pdf_fingerprint = file_fingerprint(pdf_path)
+    relevant_ids = [item["output"]["article"] for item in test_data]
+    tasks: Dict[str, Dict[str, Any]] = {}
+    for config in configs:
+        index_key = _config_key(config, INDEX_KEYS, pdf_fingerprint)
+        task = tasks.setdefault(
+            index_key,
+            {
+                "config": {key: config[key] for key in INDEX_KEYS},
+                "chunk_path": chunk_paths[
+                    _config_key(config, ARTIFACT_KEYS, pdf_fingerprint)
+                ],
+                "queries": {},
+                "relevant_ids": relevant_ids,
+                "k_values": k_values,
+                "index_params": sweep_config.get("index_params"),
+            },
+        )
+        task["queries"][config["query_strategy"]] = query_paths[
+            _config_key(config, ("model_name", "query_strategy"), dataset_fingerprint)
+        ]
+    logging.info(f"인덱스 구축/평가 작업 {len(tasks)}개 (작업 프로세스 {workers}개)")
+    evaluation_start = time.perf_counter()
+    task_rows = run_index_tasks(list(tasks.values()), workers)
+    evaluation_seconds = time.perf_counter() - evaluation_start
+
+    # 3. 그리드 순서대로 비교 표 작성
+    def row_key(config: Dict[str, Any]) -> str:
+        return json.dumps(
+            {key: config[key] for key in SWEEP_KEYS}, sort_keys=True, ensure_ascii=False
+        )
+
+    results = {row_key(row): row for rows in task_rows for row in rows}
+    rows = [results[row_key(config)] for config in configs]
+    table = comparison_table(rows, k_values)
+    output_prefix = os.path.join(
+        sweep_config.get("output_dir", "logs"),
+        f"retriever_sweep_{datetime.datetime.now():%Y%m%d_%H%M%S}",
+    )
+    write_comparison_table(table, output_prefix)
+
+    summary = {
+        "dataset": dataset_path,
+        "dataset_fingerprint": dataset_fingerprint,
+        "pdf_path": pdf_path,
+        "pdf_fingerprint": pdf_fingerprint,
+        "k_values": k_values,
+        "num_configs": len(configs),
+        "num_index_tasks": len(tasks),
+        "artifacts": artifact_stats,
+        "artifact_seconds": artifact_seconds,
+        "evaluation_seconds": evaluation_seconds,
+        "total_seconds": time.perf_counter() - sweep_start,
+        "results": rows,
+        "table": {"csv": f"{output_prefix}.csv", "markdown": f"{output_prefix}.md"},
+    }
+    with open(f"{output_prefix}.json", "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=4)
+    logging.info(f"비교 표 저장 완료: {output_prefix}.csv, {output_prefix}.md")
+    return summary
+
+
+def load_sweep_config(config_path: str) -> Dict[str, Any]:
+    """
+    스윕 설정 파일의 sweep 항목을 읽습니다.
+
+    Args:
+        config_path: 스윕 설정 파일 경로
+
+    Returns:
+        스윕 설정 dict
+    """
+    if not os.path.exists(config_path):
+        raise FileNotFoundError(f"스윕 설정 파일을 찾을 수 없습니다: {config_path}")
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    return dict(config.get("sweep", {}))
+
+
+def main(args):
+    """메인 실행 함수"""
+    sweep_config = load_sweep_config(args.config_path)
+    for key in ("dataset_path", "pdf_path", "artifact_dir", "output_dir"):
+        if getattr(args, key):
+            sweep_config[key] = getattr(args, key)
+    if args.k_values:
+        sweep_config["k_values"] = args.k_values
+    if args.model_name:
+        sweep_config.setdefault("grid", {})["model_name"] = args.model_name.split(",")
+    if args.embed_workers is not None:
+        sweep_config["embed_workers"] = args.embed_workers
+
+    summary = run_sweep(sweep_config, workers=args.workers)
+    table = comparison_table(summary["results"], summary["k_values"])
+    print(format_markdown_table(table, list(table[0]) if table else []))
+    logging.info(
+        f"스윕 소요 시간: {summary['total_seconds']:.2f}초 "
+        f"(아티팩트 {summary['artifact_seconds']:.2f}초, "
+        f"평가 {summary['evaluation_seconds']:.2f}초)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="검색 설정 그리드 스윕 평가 스크립트")
+    parser.add_argument(
+        "--config_path",
+        type=str,
+        default="config/sweep_config.yaml",
+        help="스윕 설정 파일 경로 (sweep.grid에 축별 값 리스트)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help="인덱스 구축/평가 작업 프로세스 수 (0이면 현재 프로세스에서 순차 수행)",
+    )
+    parser.add_argument(
+        "--embed_workers",
+        type=int,
+        default=None,
+        help="아티팩트 임베딩 작업 프로세스 수 (설정 파일의 embed_workers보다 우선)",
+    )
+    parser.add_argument(
+        "--model_name",
+        type=str,
+        default=None,
+        help="그리드의 model_name 축을 대체할 쉼표로 구분된 모델 이름 리스트",
+    )
+    parser.add_argument(
+        "--k_values",
+        type=str,
+        default=None,
+        help="평가를 수행할 k 값들의 쉼표로 구분된 리스트 (설정 파일보다 우선)",
+    )
+    parser.add_argument(
+        "--dataset_path", type=str, default=None, help="평가 데이터셋 경로"
+    )
+    parser.add_argument("--pdf_path", type=str, default=None, help="참조 문서 PDF 경로")
+    parser.add_argument(
+        "--artifact_dir", type=str, default=None, help="청킹/임베딩 아티팩트 디렉토리"
+    )
+    parser.add_argument(
+        "--output_dir", type=str, default=None, help="비교 표를 저장할 디렉토리"
+    )
+    args = parser.parse_args()
+    main(args)
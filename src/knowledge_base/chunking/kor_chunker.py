@@ -1,44 +1,73 @@
+import bisect
 import re
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from langchain_core.documents import Document
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from ..tracing import traced
+
+# 조항 제목(<...>) 시작 위치에서 분할하기 위한 전방 탐색 패턴
+TITLE_SPLIT_PATTERN = re.compile(r"(?=<[^>]+>)")
+TITLE_PATTERN = re.compile(r"<([^>]+)>\n?(.*)", re.DOTALL)
+
 
 class KORChunker:
-    def __init__(self, documents: List[Document], document_name: str = None):
+    def __init__(
+        self,
+        documents: Iterable[Document],
+        document_name: str = None,
+        chunk_size: int = 500,
+        chunk_overlap: int = 50,
+        split_threshold: Optional[int] = None,
+    ):
+        """
+        Args:
+            documents: 페이지 단위 문서
+            document_name: 청크 메타데이터의 source 값
+            chunk_size: 긴 조항 블록을 나눌 때의 청크 최대 길이
+            chunk_overlap: 나눈 청크 사이의 겹침 길이
+            split_threshold: 이 길이 이상인 조항 블록만 나눔 (None이면 chunk_size의 2배)
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size는 1 이상이어야 합니다.")
+        if not 0 <= chunk_overlap < chunk_size:
+            raise ValueError("chunk_overlap은 0 이상 chunk_size 미만이어야 합니다.")
+
         self._documents = documents
         self._document_name = document_name or "unknown"
+        self._splitter = RecursiveCharacterTextSplitter(
+            chunk_size=chunk_size, chunk_overlap=chunk_overlap
+        )
+        self._split_threshold = (
+            split_threshold if split_threshold is not None else 2 * chunk_size
+        )
+        # 페이지를 이어 붙인 전체 텍스트에서 각 페이지의 시작 위치와 페이지 번호
+        self._page_offsets: List[int] = []
+        self._page_numbers: List[int] = []
 
-    def _split_blocks_by_title(self, text: str, pattern: str) -> List[str]:
-        """정규표현식으로 텍스트를 분할하되 구분자를 유지"""
-        matches = list(re.finditer(pattern, text))
-        if not matches:
-            return [text] if text.strip() else []
-
-        blocks = []
-        start = 0
-
-        for match in matches:
-            # 이전 블록이 있으면 추가
-            if match.start() > start:
-                prev_block = text[start : match.start()].strip()
-                if prev_block:
-                    blocks.append(prev_block)
-            start = match.start()
+    def _add_page(self, offset: int, page: Document) -> None:
+        """전체 텍스트의 offset 위치부터 시작하는 페이지를 페이지 위치 표에 추가"""
+        page_number = page.metadata.get("page")
+        if not isinstance(page_number, int):
+            page_number = len(self._page_numbers)
+        self._page_offsets.append(offset)
+        # PDF 메타데이터의 page는 0부터 시작하므로 1부터 시작하는 번호로 변환
+        self._page_numbers.append(page_number + 1)
 
-        # 마지막 블록 추가
-        if start < len(text):
-            last_block = text[start:].strip()
-            if last_block:
-                blocks.append(last_block)
+    def _page_at(self, offset: int) -> int:
+        """전체 텍스트 위치가 속한 페이지 번호를 이진 탐색으로 조회"""
+        index = bisect.bisect_right(self._page_offsets, offset) - 1
+        return self._page_numbers[max(index, 0)]
 
-        return blocks
+    def _page_range(self, start: int, end: int) -> Tuple[int, int]:
+        """전체 텍스트의 [start, end) 구간이 걸친 첫 페이지와 마지막 페이지"""
+        return self._page_at(start), self._page_at(max(start, end - 1))
 
     def _extract_title_and_content(
         self, block: str, page: int, chunk_id: int
     ) -> Document:
-        match = re.match(r"<([^>]+)>\n?(.*)", block, re.DOTALL)
+        match = TITLE_PATTERN.match(block)
         if match:
             title, body = match.groups()
         else:
@@ -54,24 +83,132 @@ class KORChunker:
         )
 
     def _split_long_chunks(self, doc: Document) -> List[Document]:
-        if len(doc.page_content) < 1000:
+        if len(doc.page_content) < self._split_threshold:
             return [doc]
-        splitter = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50)
-        sub_texts = splitter.split_text(doc.page_content)
+        sub_texts = self._splitter.split_text(doc.page_content)
         return [
             Document(page_content=txt, metadata=doc.metadata.copy())
             for txt in sub_texts
         ]
 
+    def _block_to_chunks(
+        self, segment: str, offset: int, block_index: int
+    ) -> List[Document]:
+        """
+        원문 구간 하나(조항 블록)를 청크로 변환
+
+        Args:
+            segment: 조항 블록의 원문 구간 (앞뒤 공백 포함)
+            offset: 전체 텍스트에서 구간의 시작 위치
+            block_index: 블록 번호 (chunk_id)
+
+        Returns:
+            청크 리스트 (빈 구간이면 빈 리스트)
+        """
+        block = segment.strip()
+        if not block:
+            return []
+        block_start = offset + len(segment) - len(segment.lstrip())
+        page_start, page_end = self._page_range(block_start, block_start + len(block))
+
+        doc = self._extract_title_and_content(
+            block, page=page_start, chunk_id=block_index
+        )
+        chunks = self._split_long_chunks(doc)
+        if len(chunks) == 1:
+            doc.metadata.update(page_start=page_start, page_end=page_end)
+            return chunks
+
+        # 분할된 청크는 본문에서의 위치로 각자의 페이지 범위를 계산
+        body = doc.page_content
+        body_start = block_start + block.find(body)
+        cursor = 0
+        for chunk in chunks:
+            position = body.find(chunk.page_content, cursor)
+            if position == -1:
+                chunk_range = (page_start, page_end)
+            else:
+                cursor = position + 1
+                chunk_start = body_start + position
+                chunk_range = self._page_range(
+                    chunk_start, chunk_start + len(chunk.page_content)
+                )
+            chunk.metadata.update(
+                page=chunk_range[0], page_start=chunk_range[0], page_end=chunk_range[1]
+            )
+        return chunks
+
+    @traced("chunker.process")
     def process(self) -> List[Document]:
-        full_text = "\n".join([doc.page_content for doc in self._documents])
-        raw_blocks = self._split_blocks_by_title(full_text, r"(?=<[^>]+>)")
-        documents = [
-            self._extract_title_and_content(block, page=i // 3 + 1, chunk_id=idx)
-            for idx, (i, block) in enumerate(enumerate(raw_blocks))
-            if block.strip()
-        ]
+        self._page_offsets, self._page_numbers = [], []
+        offset = 0
+        texts = []
+        for doc in self._documents:
+            self._add_page(offset, doc)
+            texts.append(doc.page_content)
+            offset += len(doc.page_content) + 1
+        full_text = "\n".join(texts)
+
+        # 조항 제목 시작 위치를 경계로 블록 구간을 나눔
+        bounds = [match.start() for match in TITLE_SPLIT_PATTERN.finditer(full_text)]
+        bounds = [0] + bounds + [len(full_text)]
+
         final_chunks = []
-        for doc in documents:
-            final_chunks.extend(self._split_long_chunks(doc))
+        block_index = 0
+        for start, end in zip(bounds, bounds[1:]):
+            chunks = self._block_to_chunks(full_text[start:end], start, block_index)
+            if chunks:
+                final_chunks.extend(chunks)
+                block_index += 1
         return final_chunks
+
+    def iter_chunks(
+        self, pages: Optional[Iterable[Document]] = None
+    ) -> Iterator[Document]:
+        """
+        페이지를 순서대로 읽으며 청크를 하나씩 생성 (결과는 process()와 동일)
+
+        전체 텍스트를 합치지 않고 현재 조항 블록만 버퍼에 유지하며, 페이지 경계를
+        넘는 조항은 다음 페이지와 이어 붙여 처리합니다. 조항 제목(<...>)은 닫는
+        꺾쇠가 나타나야 제목으로 확정되므로, 마지막 '>' 이후의 '<'는 다음 페이지를
+        읽은 뒤 다시 검사합니다.
+
+        Args:
+            pages: 페이지 Document 스트림 (기본값: 생성 시 전달한 documents)
+        """
+        pages = self._documents if pages is None else pages
+        self._page_offsets, self._page_numbers = [], []
+        buffer: Optional[str] = None
+        # 전체 텍스트에서 버퍼 시작 위치
+        buffer_offset = 0
+        scan_from = 1
+        block_index = 0
+
+        for page in pages:
+            if buffer is None:
+                self._add_page(0, page)
+                buffer = page.page_content
+            else:
+                self._add_page(buffer_offset + len(buffer) + 1, page)
+                buffer = buffer + "\n" + page.page_content
+
+            # 확정된 조항 시작 위치마다 이전 블록을 내보냄 (버퍼 시작은 블록 시작)
+            block_start = 0
+            for match in TITLE_SPLIT_PATTERN.finditer(buffer, scan_from):
+                chunks = self._block_to_chunks(
+                    buffer[block_start : match.start()],
+                    buffer_offset + block_start,
+                    block_index,
+                )
+                block_start = match.start()
+                if chunks:
+                    yield from chunks
+                    block_index += 1
+
+            buffer = buffer[block_start:]
+            buffer_offset += block_start
+            # 마지막 '>' 앞의 '<'는 모두 판정되었으므로 그 뒤부터 다시 검사
+            scan_from = max(1, buffer.rfind(">") + 1)
+
+        if buffer is not None:
+            yield from self._block_to_chunks(buffer, buffer_offset, block_index)
@@ -0,0 +1,205 @@
+"""
+Embedding Cache
+전처리된 텍스트의 해시를 키로 임베딩 벡터를 디스크에 보관하는 캐시
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    내용 기반(content-addressed) 임베딩 캐시
+
+    (모델명, 전처리된 텍스트 해시)를 키로 임베딩 벡터를 저장합니다.
+    모델별 디렉토리에 float32 벡터 배열(vectors.npy)과 키 인덱스(index.json)를
+    저장하며, 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다.
+    """
+
+    VECTORS_FILE = "vectors.npy"
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: str, model_name: str, max_entries: int = 100000):
+        """
+        임베딩 캐시 초기화
+
+        Args:
+            cache_dir: 캐시 루트 디렉토리
+            model_name: 임베딩 모델명 (모델별로 캐시 디렉토리가 분리됨)
+            max_entries: 보관할 최대 벡터 수
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries는 1 이상이어야 합니다.")
+
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.cache_path = os.path.join(cache_dir, self._model_dir_name(model_name))
+
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._load()
+
+    @staticmethod
+    def _model_dir_name(model_name: str) -> str:
+        """모델명을 디렉토리명으로 사용할 수 있도록 변환합니다."""
+        return re.sub(r"[^0-9A-Za-z._-]+", "__", model_name).strip("_")
+
+    @staticmethod
+    def hash_text(text: str) -> str:
+        """
+        전처리된 텍스트의 해시 키를 생성합니다.
+
+        Args:
+            text: 전처리된 텍스트
+
+        Returns:
+            SHA-256 16진수 문자열
+        """
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _load(self) -> None:
+        """디스크에 저장된 캐시를 로드합니다."""
+        index_file = os.path.join(self.cache_path, self.INDEX_FILE)
+        vectors_file = os.path.join(self.cache_path, self.VECTORS_FILE)
+        if not (os.path.exists(index_file) and os.path.exists(vectors_file)):
+            return
+
+        try:
+            with open(index_file, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            vectors = np.load(vectors_file)
+        except (OSError, ValueError) as e:
+            logging.warning(f"임베딩 캐시 로드 실패, 빈 캐시로 시작합니다: {e}")
+            return
+
+        keys = index.get("keys", [])
+        if index.get("model_name") != self.model_name or len(keys) != len(vectors):
+            logging.warning(f"임베딩 캐시가 손상되어 무시합니다: {self.cache_path}")
+            return
+
+        # 저장 순서가 곧 LRU 순서 (오래된 항목이 앞)
+        for key, vector in zip(keys, vectors):
+            self._entries[key] = vector
+        logging.info(f"임베딩 캐시 로드 완료: {len(self._entries)}개")
+
+    def get_many(self, texts: List[str]) -> Tuple[Dict[int, np.ndarray], List[int]]:
+        """
+        캐시에서 여러 텍스트의 임베딩을 조회합니다.
+
+        Args:
+            texts: 전처리된 텍스트 리스트
+
+        Returns:
+            (입력 위치 -> 벡터 dict, 캐시에 없는 입력 위치 리스트)
+        """
+        found = {}
+        missing = []
+        for i, text in enumerate(texts):
+            key = self.hash_text(text)
+            vector = self._entries.get(key)
+            if vector is None:
+                missing.append(i)
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                found[i] = vector
+                self.hits += 1
+        return found, missing
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """
+        캐시에서 단일 텍스트의 임베딩을 조회합니다.
+
+        Args:
+            text: 전처리된 텍스트
+
+        Returns:
+            임베딩 벡터 (없으면 None)
+        """
+        found, _ = self.get_many([text])
+        return found.get(0)
+
+    def put_many(self, texts: List[str], embeddings: np.ndarray) -> None:
+        """
+        여러 텍스트의 임베딩을 캐시에 추가합니다.
+
+        Args:
+            texts: 전처리된 텍스트 리스트
+            embeddings: 임베딩 벡터 배열 (shape: [len(texts), embedding_dim])
+        """
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        for text, vector in zip(texts, vectors):
+            key = self.hash_text(text)
+            self._entries[key] = vector.copy()
+            self._entries.move_to_end(key)
+        self._dirty = True
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def put(self, text: str, embedding: np.ndarray) -> None:
+        """
+        단일 텍스트의 임베딩을 캐시에 추가합니다.
+
+        Args:
+            text: 전처리된 텍스트
+            embedding: 임베딩 벡터
+        """
+        self.put_many([text], np.asarray(embedding).reshape(1, -1))
+
+    def save(self) -> None:
+        """변경된 캐시를 디스크에 원자적으로 저장합니다."""
+        if not self._dirty:
+            return
+
+        os.makedirs(self.cache_path, exist_ok=True)
+        keys = list(self._entries.keys())
+        if keys:
+            vectors = np.stack(list(self._entries.values())).astype(np.float32)
+        else:
+            vectors = np.zeros((0, 0), dtype=np.float32)
+
+        vectors_file = os.path.join(self.cache_path, self.VECTORS_FILE)
+        index_file = os.path.join(self.cache_path, self.INDEX_FILE)
+
+        # 임시 파일에 기록한 뒤 교체하여 중간 실패 시에도 기존 캐시를 유지
+        with open(vectors_file + ".tmp", "wb") as f:
+            np.save(f, vectors)
+        with open(index_file + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"model_name": self.model_name, "keys": keys}, f)
+        os.replace(vectors_file + ".tmp", vectors_file)
+        os.replace(index_file + ".tmp", index_file)
+
+        self._dirty = False
+        logging.info(f"임베딩 캐시 저장 완료: {len(keys)}개 ({self.cache_path})")
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            항목 수, 적중/미스 횟수, 적중률, 제거 횟수
+        """
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,138 @@
+"""
+Embedding Pool
+모델 사본을 가진 작업 프로세스들로 대량의 텍스트를 나누어 임베딩하는 프로세스 풀
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 작업 프로세스마다 하나씩 로드되는 임베딩 모델
+_worker_embedding = None
+
+STAT_KEYS = ("texts", "batches", "tokens", "padded_tokens")
+
+
+def _init_worker(model_kwargs: Dict[str, Any], num_threads: int) -> None:
+    """작업 프로세스 시작 시 연산 스레드 수를 고정하고 모델을 로드합니다."""
+    global _worker_embedding
+
+    import torch
+
+    torch.set_num_threads(num_threads)
+    from .sentence_transformers_embedding import SentenceTransformersEmbedding
+
+    # 캐시는 부모 프로세스가 관리하므로 작업 프로세스에서는 사용하지 않음
+    _worker_embedding = SentenceTransformersEmbedding(
+        **model_kwargs, cache_dir=None, query_cache_size=0, num_workers=0
+    )
+
+
+def _encode_shard(texts: List[str]) -> Tuple[np.ndarray, Dict[str, int]]:
+    """작업 프로세스에서 전처리된 텍스트 묶음 하나를 인코딩합니다."""
+    _worker_embedding.reset_encoding_stats()
+    embeddings = _worker_embedding._encode(texts, show_progress_bar=False)
+    stats = _worker_embedding.get_encoding_stats()
+    return embeddings, {key: stats[key] for key in STAT_KEYS}
+
+
+class EmbeddingPool:
+    """
+    임베딩 작업 프로세스 풀
+
+    작업 프로세스마다 모델 사본을 한 번 로드하고 연산 스레드 수를 고정합니다.
+    입력 텍스트는 shard_size개씩 나누어 여러 프로세스에 분배하며, 결과는 입력
+    순서대로 하나의 연속된 배열로 모읍니다. 풀은 close()를 호출할 때까지 유지되므로
+    반복 호출해도 모델을 다시 로드하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        model_kwargs: Dict[str, Any],
+        num_workers: Optional[int] = None,
+        threads_per_worker: Optional[int] = None,
+        shard_size: int = 256,
+    ):
+        """
+        Args:
+            model_kwargs: 작업 프로세스의 SentenceTransformersEmbedding 생성 인자
+                (model_name, device, batch_size, length_bucketing, backend,
+                artifact_dir)
+            num_workers: 작업 프로세스 수 (None이면 CPU 코어 수)
+            threads_per_worker: 작업 프로세스당 연산 스레드 수
+                (None이면 CPU 코어 수 / 작업 프로세스 수)
+            shard_size: 작업 프로세스 하나에 한 번에 전달할 텍스트 수
+        """
+        cpu_count = os.cpu_count() or 1
+        self.num_workers = num_workers or cpu_count
+        self.threads_per_worker = threads_per_worker or max(
+            1, cpu_count // self.num_workers
+        )
+        if shard_size <= 0:
+            raise ValueError("shard_size는 1 이상이어야 합니다.")
+        self.shard_size = shard_size
+
+        logging.info(
+            f"임베딩 작업 프로세스 시작: {self.num_workers}개 "
+            f"(프로세스당 스레드 {self.threads_per_worker}개)"
+        )
+        # PyTorch 스레드 풀은 fork 후 안전하지 않으므로 spawn으로 시작
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(model_kwargs, self.threads_per_worker),
+        )
+
+    def encode(self, texts: List[str]) -> Tuple[np.ndarray, Dict[str, int]]:
+        """
+        전처리된 텍스트를 작업 프로세스들로 나누어 인코딩합니다.
+
+        Args:
+            texts: 전처리된 텍스트 리스트
+
+        Returns:
+            (입력 순서대로의 임베딩 배열, 작업 프로세스 인코딩 통계 합계)
+        """
+        if self._executor is None:
+            raise RuntimeError("임베딩 작업 프로세스 풀이 종료되었습니다.")
+
+        # 작업 프로세스 수보다 샤드가 적으면 일부 프로세스가 놀게 되므로 샤드를 줄임
+        shard_size = min(self.shard_size, max(1, -(-len(texts) // self.num_workers)))
+        shards = [texts[i : i + shard_size] for i in range(0, len(texts), shard_size)]
+
+        embeddings: Optional[np.ndarray] = None
+        totals = dict.fromkeys(STAT_KEYS, 0)
+        # map은 제출 순서대로 결과를 반환하므로 입력 순서가 유지됨
+        for i, (vectors, stats) in enumerate(self._executor.map(_encode_shard, shards)):
+            if embeddings is None:
+                embeddings = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+            start = i * shard_size
+            embeddings[start : start + len(vectors)] = vectors
+            for key in STAT_KEYS:
+                totals[key] += stats[key]
+        return embeddings, totals
+
+    def warmup(self) -> None:
+        """모든 작업 프로세스를 시작하고 모델 로딩이 끝날 때까지 기다립니다."""
+        if self._executor is None:
+            raise RuntimeError("임베딩 작업 프로세스 풀이 종료되었습니다.")
+        # 작업 프로세스 수만큼 작업을 동시에 제출하면 모든 프로세스가 시작됨
+        list(self._executor.map(_encode_shard, [["warmup"]] * self.num_workers))
+
+    def close(self) -> None:
+        """작업 프로세스를 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            logging.info("임베딩 작업 프로세스 종료")
+
+    def __enter__(self) -> "EmbeddingPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -0,0 +1,197 @@
+"""
+Inference Backend
+CPU 추론용 임베딩 모델 변환(int8 동적 양자화, ONNX)과 변환 결과 디스크 캐시
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import tempfile
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+# torch: PyTorch fp32 (기본)
+# int8: PyTorch 동적 int8 양자화 (Linear 계층)
+# onnx: ONNX Runtime fp32
+# onnx_int8: ONNX Runtime 동적 int8 양자화
+BACKENDS = ("torch", "int8", "onnx", "onnx_int8")
+
+ONNX_INT8_FILE = "onnx/model_qint8_avx2.onnx"
+
+
+def _artifact_path(artifact_dir: str, model_name: str, backend: str) -> str:
+    """모델명과 백엔드별 변환 결과 디렉토리 경로"""
+    model_dir = re.sub(r"[^0-9A-Za-z._-]+", "__", model_name).strip("_")
+    return os.path.join(artifact_dir, model_dir, backend)
+
+
+def _manifest(model_name: str, backend: str) -> Dict[str, str]:
+    """변환 결과를 재사용할 수 있는지 판단하는 버전 정보"""
+    import sentence_transformers
+    import torch
+
+    return {
+        "model_name": model_name,
+        "backend": backend,
+        "torch": torch.__version__,
+        "sentence_transformers": sentence_transformers.__version__,
+    }
+
+
+def _read_manifest(path: str) -> Dict[str, Any]:
+    """저장된 변환 결과의 버전 정보 (없으면 빈 dict)"""
+    manifest_file = os.path.join(path, "manifest.json")
+    if not os.path.exists(manifest_file):
+        return {}
+    with open(manifest_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_artifact(path: str, manifest: Dict[str, str], writer: Any) -> None:
+    """임시 디렉토리에 변환 결과를 기록한 뒤 교체합니다."""
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmp_path = tempfile.mkdtemp(prefix=".artifact-", dir=parent)
+    try:
+        os.chmod(tmp_path, 0o755)
+        writer(tmp_path)
+        with open(os.path.join(tmp_path, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        shutil.rmtree(path, ignore_errors=True)
+        os.rename(tmp_path, path)
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+
+def _require_onnxruntime() -> None:
+    """ONNX 백엔드에 필요한 선택 패키지가 설치되어 있는지 확인합니다."""
+    try:
+        import onnxruntime  # noqa: F401
+        import optimum.onnxruntime  # noqa: F401
+    except ImportError as e:
+        raise ImportError(
+            "ONNX 백엔드를 사용하려면 optimum[onnxruntime] 패키지가 필요합니다: "
+            "pip install 'optimum[onnxruntime]'"
+        ) from e
+
+
+def load_model(
+    model_name: str,
+    device: str = "cpu",
+    backend: str = "torch",
+    artifact_dir: Optional[str] = None,
+) -> "SentenceTransformer":
+    """
+    지정한 추론 백엔드로 임베딩 모델을 로드합니다.
+
+    int8, onnx, onnx_int8 백엔드는 처음 한 번 변환한 결과를 artifact_dir에 저장하고,
+    이후에는 저장된 결과를 바로 로드합니다. 모델명이나 torch/sentence-transformers
+    버전이 바뀌면 다시 변환합니다.
+
+    Args:
+        model_name: sentence-transformers 모델명 또는 경로
+        device: 실행 장치 (torch 이외의 백엔드는 "cpu"만 지원)
+        backend: 추론 백엔드 (BACKENDS 참고)
+        artifact_dir: 변환 결과 캐시 디렉토리 (None이면 매번 변환)
+
+    Returns:
+        SentenceTransformer 인스턴스 (encode 인터페이스 동일)
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 백엔드입니다: {backend} (지원: {BACKENDS})")
+
+    # sentence-transformers(torch 포함)는 import만으로 수 초가 걸리므로 로딩 시점에 import
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "torch":
+        return SentenceTransformer(model_name, device=device)
+    if device != "cpu":
+        raise ValueError(f"{backend} 백엔드는 CPU에서만 사용할 수 있습니다: {device}")
+
+    manifest = _manifest(model_name, backend)
+    path = _artifact_path(artifact_dir, model_name, backend) if artifact_dir else None
+    cached = path is not None and _read_manifest(path) == manifest
+
+    if backend == "int8":
+        if cached:
+            logging.info(f"int8 양자화 모델 로드: {path}")
+            # 직접 변환하여 저장한 파일이므로 전체 모듈 객체를 역직렬화
+            return torch.load(
+                os.path.join(path, "model.pt"), map_location="cpu", weights_only=False
+            )
+        logging.info(f"int8 동적 양자화 적용 중: {model_name}")
+        model = torch.ao.quantization.quantize_dynamic(
+            SentenceTransformer(model_name, device="cpu"),
+            {torch.nn.Linear},
+            dtype=torch.qint8,
+        )
+        if path is not None:
+            _write_artifact(
+                path,
+                manifest,
+                lambda tmp: torch.save(model, os.path.join(tmp, "model.pt")),
+            )
+        return model
+
+    _require_onnxruntime()
+    model_kwargs = {"file_name": ONNX_INT8_FILE} if backend == "onnx_int8" else None
+    if cached:
+        logging.info(f"ONNX 모델 로드: {path}")
+        return SentenceTransformer(
+            path, device="cpu", backend="onnx", model_kwargs=model_kwargs
+        )
+
+    logging.info(f"ONNX 변환 중: {model_name} ({backend})")
+    model = SentenceTransformer(model_name, device="cpu", backend="onnx")
+
+    def export(tmp: str) -> None:
+        model.save_pretrained(tmp)
+        if backend == "onnx_int8":
+            from sentence_transformers.backend import (
+                export_dynamic_quantized_onnx_model,
+            )
+
+            export_dynamic_quantized_onnx_model(model, "avx2", tmp)
+
+    if path is None:
+        path = tempfile.mkdtemp(prefix="onnx-")
+        export(path)
+    else:
+        _write_artifact(path, manifest, export)
+    return SentenceTransformer(
+        path, device="cpu", backend="onnx", model_kwargs=model_kwargs
+    )
+
+
+def cosine_drift(reference: np.ndarray, candidate: np.ndarray) -> Dict[str, float]:
+    """
+    같은 텍스트에 대한 두 임베딩 행렬의 행별 코사인 유사도를 비교합니다.
+
+    Args:
+        reference: 기준(fp32) 임베딩 행렬
+        candidate: 비교할 임베딩 행렬
+
+    Returns:
+        평균/최소 코사인 유사도와 최대 드리프트(1 - 최소 코사인 유사도)
+    """
+    reference = np.asarray(reference, dtype=np.float64)
+    candidate = np.asarray(candidate, dtype=np.float64)
+    if reference.shape != candidate.shape:
+        raise ValueError(
+            f"임베딩 행렬 크기가 다릅니다: {reference.shape} != {candidate.shape}"
+        )
+    norms = np.linalg.norm(reference, axis=1) * np.linalg.norm(candidate, axis=1)
+    cosine = (reference * candidate).sum(axis=1) / np.maximum(norms, 1e-12)
+    return {
+        "mean_cosine": float(cosine.mean()),
+        "min_cosine": float(cosine.min()),
+        "max_drift": float(1.0 - cosine.min()),
+    }
@@ -0,0 +1,159 @@
+"""
+Query Embedding Cache
+반복되는 검색 쿼리의 임베딩 벡터를 메모리에 보관하는 LRU/TTL 캐시
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class QueryEmbeddingCache:
+    """
+    스레드 안전한 쿼리 임베딩 메모리 캐시
+
+    전처리된 쿼리 문자열을 키로 임베딩 벡터를 보관합니다. 최대 항목 수를 넘으면
+    가장 오래 사용되지 않은 항목부터 제거하고, TTL이 주어지면 저장 후 TTL이 지난
+    항목은 조회 시 만료 처리합니다. 디스크에 저장하는 EmbeddingCache와 달리
+    프로세스 메모리에만 보관하며, 조회 경로에서 해시 계산도 하지 않습니다.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: Optional[float] = None):
+        """
+        쿼리 임베딩 캐시 초기화
+
+        Args:
+            max_entries: 보관할 최대 쿼리 수
+            ttl_seconds: 항목 유효 시간(초) (None이면 만료 없음)
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries는 1 이상이어야 합니다.")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds는 0보다 커야 합니다.")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[str, Tuple[np.ndarray, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """
+        전처리된 쿼리의 임베딩 벡터를 조회합니다.
+
+        Args:
+            text: 전처리된 쿼리
+
+        Returns:
+            임베딩 벡터 (없거나 만료되었으면 None)
+        """
+        with self._lock:
+            entry = self._entries.get(text)
+            if entry is not None and self._expired(entry[1]):
+                del self._entries[text]
+                self.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(text)
+            self.hits += 1
+            return entry[0]
+
+    def get_many(self, texts: List[str]) -> Tuple[Dict[int, np.ndarray], List[int]]:
+        """
+        여러 쿼리의 임베딩 벡터를 조회합니다.
+
+        Args:
+            texts: 전처리된 쿼리 리스트
+
+        Returns:
+            (입력 위치 -> 벡터 dict, 캐시에 없는 입력 위치 리스트)
+        """
+        found: Dict[int, np.ndarray] = {}
+        missing: List[int] = []
+        for i, text in enumerate(texts):
+            vector = self.get(text)
+            if vector is None:
+                missing.append(i)
+            else:
+                found[i] = vector
+        return found, missing
+
+    def put(self, text: str, vector: np.ndarray) -> None:
+        """
+        쿼리 임베딩 벡터를 저장합니다.
+
+        Args:
+            text: 전처리된 쿼리
+            vector: 임베딩 벡터
+        """
+        # 복사본을 읽기 전용으로 보관하여 호출자가 벡터를 수정해도 캐시가 오염되지 않음
+        vector = np.array(vector, dtype=np.float32)
+        vector.flags.writeable = False
+        with self._lock:
+            self._entries[text] = (vector, time.monotonic())
+            self._entries.move_to_end(text)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def put_many(self, texts: List[str], vectors: np.ndarray) -> None:
+        """
+        여러 쿼리 임베딩 벡터를 저장합니다.
+
+        Args:
+            texts: 전처리된 쿼리 리스트
+            vectors: 임베딩 벡터 배열 (shape: [len(texts), embedding_dim])
+        """
+        for text, vector in zip(texts, vectors):
+            self.put(text, vector)
+
+    def _expired(self, stored_at: float) -> bool:
+        """저장 시각이 TTL을 지났는지 확인합니다."""
+        return (
+            self.ttl_seconds is not None
+            and time.monotonic() - stored_at > self.ttl_seconds
+        )
+
+    def clear(self) -> None:
+        """모든 항목과 통계를 초기화합니다."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계를 반환합니다.
+
+        Returns:
+            항목 수, 적중/미적중 수, 적중률, 제거 수, 만료 수
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __contains__(self, text: str) -> bool:
+        """만료되지 않은 항목이 있는지 확인합니다. 적중 통계와 사용 순서는 바꾸지 않습니다."""
+        with self._lock:
+            entry = self._entries.get(text)
+            return entry is not None and not self._expired(entry[1])
+
+    def __len__(self) -> int:
+        return len(self._entries)
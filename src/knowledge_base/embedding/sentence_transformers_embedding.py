@@ -1,9 +1,24 @@
 import logging
-from typing import List
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import numpy as np
+import yaml
 from langchain_core.embeddings import Embeddings
-from sentence_transformers import SentenceTransformer
+from tqdm import tqdm
+
+from ..tracing import traced
+from . import inference_backend
+from .embedding_cache import EmbeddingCache
+from .embedding_pool import EmbeddingPool
+from .query_embedding_cache import QueryEmbeddingCache
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+# 길이별 배치 구성을 사용하지 않을 때 패딩 통계 계산을 미뤄 둘 최대 텍스트 수
+PADDING_STATS_MAX_PENDING = 100000
 
 
 class SentenceTransformersEmbedding(Embeddings):
@@ -11,12 +26,25 @@ class SentenceTransformersEmbedding(Embeddings):
     SentenceTransformer 기반 텍스트 임베딩 클래스
 
     KORChunker 파이프라인과 연동하여 한국어 텍스트를 벡터로 변환합니다.
+    모델은 처음 인코딩할 때(또는 warmup() 호출 시) 로드하므로, 캐시된 벡터만
+    사용하거나 모델이 필요 없는 작업은 모델 로딩 비용 없이 수행됩니다.
     """
 
     def __init__(
         self,
         model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
         device: str = "cpu",
+        cache_dir: Optional[str] = None,
+        cache_max_entries: int = 100000,
+        query_cache_size: int = 1024,
+        query_cache_ttl: Optional[float] = None,
+        batch_size: int = 32,
+        length_bucketing: bool = True,
+        backend: str = "torch",
+        artifact_dir: Optional[str] = None,
+        num_workers: Optional[int] = 0,
+        threads_per_worker: Optional[int] = None,
+        embedding_dim: Optional[int] = None,
     ):
         """
         SentenceTransformer 임베딩 초기화
@@ -24,19 +52,155 @@ class SentenceTransformersEmbedding(Embeddings):
         Args:
             model_name: 사용할 sentence-transformers 모델명
             device: 실행 장치 ("cpu" 또는 "cuda")
+            cache_dir: 임베딩 캐시 디렉토리 (None이면 캐시 미사용)
+            cache_max_entries: 임베딩 캐시에 보관할 최대 벡터 수
+            query_cache_size: 쿼리 임베딩 메모리 캐시 크기 (0이면 캐시 미사용)
+            query_cache_ttl: 쿼리 임베딩 캐시 항목 유효 시간(초) (None이면 만료 없음)
+            batch_size: 모델 인코딩 배치 크기
+            length_bucketing: 토큰 길이가 비슷한 텍스트끼리 배치를 구성하여 패딩을
+                줄일지 여부 (False이면 sentence-transformers 기본 배치 구성 사용)
+            backend: 추론 백엔드 ("torch", "int8", "onnx", "onnx_int8")
+            artifact_dir: int8/ONNX 변환 결과를 저장할 디렉토리 (None이면 매번 변환)
+            num_workers: 대량 배치 인코딩에 사용할 작업 프로세스 수
+                (0이면 현재 프로세스에서 인코딩, None이면 CPU 코어 수)
+            threads_per_worker: 작업 프로세스당 연산 스레드 수
+                (None이면 CPU 코어 수 / 작업 프로세스 수)
+            embedding_dim: 임베딩 차원 (미리 알고 있으면 미리 계산된 벡터로 인덱스를
+                만들 때 모델을 로드하지 않음. None이면 모델 로드 시 확인)
         """
+        if batch_size <= 0:
+            raise ValueError("batch_size는 1 이상이어야 합니다.")
+        if backend not in inference_backend.BACKENDS:
+            raise ValueError(
+                f"지원하지 않는 백엔드입니다: {backend} "
+                f"(지원: {inference_backend.BACKENDS})"
+            )
+
         self.model_name = model_name
         self.device = device
-        self.model = None
-        self._embedding_dim = None
-        self._load_model()
+        self.batch_size = batch_size
+        self.length_bucketing = length_bucketing
+        self.backend = backend
+        self.artifact_dir = artifact_dir
+        self._encoding_stats = self._empty_encoding_stats()
+        # 패딩 통계를 아직 계산하지 않은 (텍스트, 배치 구성) 목록
+        self._pending_padding: List[Tuple[List[str], List[np.ndarray]]] = []
+        self._pending_padding_texts = 0
+        self.num_workers = num_workers
+        self.threads_per_worker = threads_per_worker
+        self._model: Optional["SentenceTransformer"] = None
+        self._model_lock = threading.Lock()
+        self._embedding_dim = embedding_dim
+        self._pool: Optional[EmbeddingPool] = None
+        # 양자화/ONNX 벡터는 fp32 벡터와 조금씩 다르므로 백엔드별로 캐시를 분리
+        cache_model_name = (
+            model_name if backend == "torch" else f"{model_name}@{backend}"
+        )
+        self.cache = (
+            EmbeddingCache(cache_dir, cache_model_name, max_entries=cache_max_entries)
+            if cache_dir
+            else None
+        )
+        self.query_cache = (
+            QueryEmbeddingCache(query_cache_size, ttl_seconds=query_cache_ttl)
+            if query_cache_size > 0
+            else None
+        )
+
+    @property
+    def model(self) -> "SentenceTransformer":
+        """임베딩 모델 (처음 사용할 때 로드)"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._load_model()
+        return self._model
+
+    @property
+    def pool(self) -> Optional[EmbeddingPool]:
+        """임베딩 작업 프로세스 풀 (num_workers가 0이면 None, 처음 사용할 때 시작)"""
+        if self._pool is None and self.num_workers != 0:
+            self._pool = EmbeddingPool(
+                {
+                    "model_name": self.model_name,
+                    "device": self.device,
+                    "batch_size": self.batch_size,
+                    "length_bucketing": self.length_bucketing,
+                    "backend": self.backend,
+                    "artifact_dir": self.artifact_dir,
+                },
+                num_workers=self.num_workers,
+                threads_per_worker=self.threads_per_worker,
+            )
+        return self._pool
+
+    def warmup(self) -> float:
+        """
+        모델 로딩과 첫 인코딩 초기화를 미리 수행합니다. (서버 시작 시 호출)
+
+        작업 프로세스 풀을 사용하면 모든 작업 프로세스의 모델 로딩도 기다립니다.
+
+        Returns:
+            소요 시간(초)
+        """
+        start = time.perf_counter()
+        self.model.encode("warmup", convert_to_numpy=True, show_progress_bar=False)
+        if self.pool is not None:
+            self.pool.warmup()
+        elapsed = time.perf_counter() - start
+        logging.info(f"임베딩 모델 워밍업 완료: {elapsed:.2f}초")
+        return elapsed
+
+    @classmethod
+    def from_config(
+        cls,
+        config_path: str = "config/model_config.yaml",
+        model_name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> "SentenceTransformersEmbedding":
+        """
+        설정 파일의 embedding 항목으로 임베딩 모델을 생성합니다.
+
+        Args:
+            config_path: 모델 설정 파일 경로
+            model_name: 사용할 모델명 (None이면 embedding.model_name)
+            **kwargs: 생성자에 그대로 전달할 인자 (device, cache_dir 등)
+
+        Returns:
+            SentenceTransformersEmbedding 인스턴스
+        """
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+
+        embedding_config = config.get("embedding", {})
+        if model_name is None:
+            model_name = embedding_config.get(
+                "model_name",
+                "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
+            )
+        for key in (
+            "batch_size",
+            "length_bucketing",
+            "backend",
+            "artifact_dir",
+            "num_workers",
+            "threads_per_worker",
+        ):
+            if key in embedding_config:
+                kwargs.setdefault(key, embedding_config[key])
+        return cls(model_name=model_name, **kwargs)
 
     def _load_model(self) -> None:
         """임베딩 모델을 로드합니다."""
         try:
-            logging.info(f"임베딩 모델 로딩 중: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name, device=self.device)
-            self._embedding_dim = self.model.get_sentence_embedding_dimension()
+            logging.info(f"임베딩 모델 로딩 중: {self.model_name} ({self.backend})")
+            self._model = inference_backend.load_model(
+                self.model_name,
+                device=self.device,
+                backend=self.backend,
+                artifact_dir=self.artifact_dir,
+            )
+            self._embedding_dim = self._model.get_sentence_embedding_dimension()
             logging.info(f"모델 로딩 완료. 임베딩 차원: {self._embedding_dim}")
         except Exception as e:
             logging.error(f"모델 로딩 실패: {e}")
@@ -49,12 +213,18 @@ class SentenceTransformersEmbedding(Embeddings):
         Returns:
             임베딩 벡터 차원수
         """
+        if self._embedding_dim is None:
+            self._embedding_dim = self.model.get_sentence_embedding_dimension()
         return self._embedding_dim
 
+    @traced("embedding.embed_text")
     def embed_text(self, text: str) -> List[float]:
         """
         단일 텍스트를 임베딩 벡터로 변환합니다. (LangChain FAISS 호환)
 
+        새로 인코딩한 벡터는 임베딩 캐시에 추가되며, embed_texts()와 마찬가지로
+        save_cache()를 호출할 때 디스크에 저장됩니다.
+
         Args:
             text: 임베딩할 텍스트
 
@@ -65,15 +235,29 @@ class SentenceTransformersEmbedding(Embeddings):
             raise ValueError("입력 텍스트가 비어있습니다.")
 
         cleaned_text = self._preprocess_text(text)
+        if self.cache is not None:
+            cached = self.cache.get(cleaned_text)
+            if cached is not None:
+                return cached.tolist()
+
         embedding = self.model.encode(cleaned_text, convert_to_numpy=True)
+        if self.cache is not None:
+            self.cache.put(cleaned_text, embedding)
         return embedding.tolist()
 
-    def embed_texts(self, texts: List[str]) -> np.ndarray:
+    @traced("embedding.embed_texts")
+    def embed_texts(
+        self, texts: List[str], show_progress_bar: bool = True, save_cache: bool = False
+    ) -> np.ndarray:
         """
         여러 텍스트를 배치로 임베딩 벡터로 변환합니다.
 
         Args:
             texts: 임베딩할 텍스트 리스트
+            show_progress_bar: 인코딩 진행률 표시 여부
+            save_cache: 새로 인코딩한 벡터를 바로 캐시 파일에 저장할지 여부
+                (캐시 파일 전체를 다시 쓰므로 기본값 False이며, 호출자가 작업을 마친 뒤
+                save_cache()로 한 번에 저장)
 
         Returns:
             임베딩 벡터 배열 (shape: [len(texts), embedding_dim])
@@ -86,11 +270,293 @@ class SentenceTransformersEmbedding(Embeddings):
                 raise ValueError(f"인덱스 {i}의 텍스트가 비어있습니다.")
 
         cleaned_texts = [self._preprocess_text(text) for text in texts]
-        embeddings = self.model.encode(
-            cleaned_texts, convert_to_numpy=True, show_progress_bar=True
+        if self.cache is None:
+            return self._encode(cleaned_texts, show_progress_bar=show_progress_bar)
+
+        # 캐시에 없는 텍스트만 모델로 인코딩
+        cached, missing = self.cache.get_many(cleaned_texts)
+        embeddings = self._allocate(len(cleaned_texts), cached)
+        for i, vector in cached.items():
+            embeddings[i] = vector
+
+        if missing:
+            missing_texts = [cleaned_texts[i] for i in missing]
+            encoded = self._encode(missing_texts, show_progress_bar=show_progress_bar)
+            embeddings[missing] = encoded
+            self.cache.put_many(missing_texts, encoded)
+            if save_cache:
+                self.cache.save()
+
+        logging.info(f"임베딩 캐시: 적중 {len(cached)}개, 신규 인코딩 {len(missing)}개")
+        return embeddings
+
+    def _allocate(self, num_texts: int, cached: Dict[int, np.ndarray]) -> np.ndarray:
+        """임베딩 결과 배열을 할당합니다. 캐시된 벡터가 있으면 모델을 로드하지 않습니다."""
+        if cached:
+            dimension = len(next(iter(cached.values())))
+        else:
+            dimension = self.get_embedding_dim()
+        return np.empty((num_texts, dimension), dtype=np.float32)
+
+    @traced("embedding.encode")
+    def _encode(self, texts: List[str], show_progress_bar: bool) -> np.ndarray:
+        """
+        전처리된 텍스트를 배치 단위로 모델 인코딩합니다.
+
+        길이별 배치 구성을 사용하면 토큰 수 내림차순으로 정렬한 뒤 batch_size개씩
+        묶어 배치마다 인코딩하고, 결과는 입력 순서로 되돌립니다. sentence-transformers
+        기본 배치 구성은 문자 수로 정렬하므로, 글자당 토큰 수가 다른 텍스트가 섞이면
+        한 배치 안의 토큰 길이 차이가 커져 패딩 연산이 늘어납니다.
+        기본 배치 구성에서는 토큰 길이가 필요 없으므로 패딩 통계용 토큰화를
+        get_encoding_stats() 호출 시점으로 미룹니다.
+
+        Args:
+            texts: 전처리된 텍스트 리스트
+            show_progress_bar: 인코딩 진행률 표시 여부
+
+        Returns:
+            임베딩 벡터 배열 (shape: [len(texts), embedding_dim])
+        """
+        start = time.perf_counter()
+        stats = self._encoding_stats
+        # 한 배치보다 많은 텍스트는 작업 프로세스들로 나누어 인코딩
+        if len(texts) > self.batch_size and self.pool is not None:
+            embeddings, pool_stats = self.pool.encode(texts)
+            for key, value in pool_stats.items():
+                stats[key] += value
+            stats["seconds"] += time.perf_counter() - start
+            return embeddings
+
+        if self.length_bucketing:
+            token_lengths = self._token_lengths(texts)
+            order = np.argsort(-token_lengths, kind="stable")
+            batches = [
+                order[i : i + self.batch_size]
+                for i in range(0, len(texts), self.batch_size)
+            ]
+            embeddings = np.empty(
+                (len(texts), self.get_embedding_dim()), dtype=np.float32
+            )
+            for batch in tqdm(batches, desc="Batches", disable=not show_progress_bar):
+                embeddings[batch] = self.model.encode(
+                    [texts[i] for i in batch],
+                    batch_size=len(batch),
+                    convert_to_numpy=True,
+                    show_progress_bar=False,
+                )
+            self._add_padding_stats(token_lengths, batches)
+        else:
+            # sentence-transformers가 내부에서 구성하는 배치(문자 수 내림차순)를 재현
+            order = np.argsort([-len(text) for text in texts], kind="stable")
+            batches = [
+                order[i : i + self.batch_size]
+                for i in range(0, len(texts), self.batch_size)
+            ]
+            embeddings = self.model.encode(
+                texts,
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                show_progress_bar=show_progress_bar,
+            )
+            self._pending_padding.append((texts, batches))
+            self._pending_padding_texts += len(texts)
+            if self._pending_padding_texts > PADDING_STATS_MAX_PENDING:
+                self._flush_padding_stats()
+
+        stats["texts"] += len(texts)
+        stats["batches"] += len(batches)
+        stats["seconds"] += time.perf_counter() - start
+        return embeddings
+
+    def _add_padding_stats(
+        self, token_lengths: np.ndarray, batches: List[np.ndarray]
+    ) -> None:
+        """배치 구성별 실제 토큰 수와 패딩 포함 토큰 수를 통계에 더합니다."""
+        stats = self._encoding_stats
+        stats["tokens"] += int(token_lengths.sum())
+        stats["padded_tokens"] += sum(
+            int(token_lengths[batch].max()) * len(batch) for batch in batches
         )
+
+    def _flush_padding_stats(self) -> None:
+        """미뤄 둔 기본 배치 구성의 패딩 통계를 토큰화하여 계산합니다."""
+        pending, self._pending_padding = self._pending_padding, []
+        self._pending_padding_texts = 0
+        for texts, batches in pending:
+            self._add_padding_stats(self._token_lengths(texts), batches)
+
+    def _token_lengths(self, texts: List[str]) -> np.ndarray:
+        """모델 입력 최대 길이로 자른 텍스트별 토큰 수(특수 토큰 포함)를 계산합니다."""
+        encoded = self.model.tokenizer(
+            texts,
+            truncation=True,
+            max_length=self.model.max_seq_length,
+            return_attention_mask=False,
+            return_token_type_ids=False,
+        )
+        return np.array([len(ids) for ids in encoded["input_ids"]], dtype=np.int64)
+
+    @staticmethod
+    def _empty_encoding_stats() -> Dict[str, Any]:
+        """초기 배치 인코딩 통계"""
+        return {
+            "texts": 0,
+            "batches": 0,
+            "tokens": 0,
+            "padded_tokens": 0,
+            "seconds": 0.0,
+        }
+
+    def get_encoding_stats(self) -> Dict[str, Any]:
+        """
+        배치 인코딩 통계를 반환합니다.
+
+        Returns:
+            인코딩한 텍스트/배치 수, 실제 토큰 수, 패딩 포함 토큰 수, 패딩 비율
+            (패딩 토큰 / 패딩 포함 토큰), 초당 토큰 수
+        """
+        self._flush_padding_stats()
+        stats = dict(self._encoding_stats)
+        padded = stats["padded_tokens"]
+        stats["padding_ratio"] = (padded - stats["tokens"]) / padded if padded else 0.0
+        stats["tokens_per_second"] = (
+            stats["tokens"] / stats["seconds"] if stats["seconds"] else 0.0
+        )
+        stats["batch_size"] = self.batch_size
+        stats["length_bucketing"] = self.length_bucketing
+        return stats
+
+    def reset_encoding_stats(self) -> None:
+        """배치 인코딩 통계를 초기화합니다."""
+        self._encoding_stats = self._empty_encoding_stats()
+        self._pending_padding = []
+        self._pending_padding_texts = 0
+
+    def close(self) -> None:
+        """임베딩 작업 프로세스 풀을 종료합니다."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def check_parity(self, texts: List[str]) -> Dict[str, Any]:
+        """
+        현재 백엔드의 임베딩을 PyTorch fp32 모델의 임베딩과 비교합니다.
+
+        두 모델 모두 캐시를 거치지 않고 텍스트를 하나씩 인코딩하여 쿼리당 지연
+        시간도 함께 측정합니다.
+
+        Args:
+            texts: 비교에 사용할 텍스트 리스트
+
+        Returns:
+            백엔드, 텍스트 수, 코사인 유사도/드리프트, 모델별 텍스트당 평균 지연(ms)
+        """
+        if not texts:
+            raise ValueError("입력 텍스트 리스트가 비어있습니다.")
+
+        cleaned_texts = [self._preprocess_text(text) for text in texts]
+        reference_model = (
+            self.model
+            if self.backend == "torch"
+            else inference_backend.load_model(self.model_name, device=self.device)
+        )
+
+        def encode_each(model: "SentenceTransformer") -> Tuple[np.ndarray, float]:
+            start = time.perf_counter()
+            vectors = np.stack(
+                [
+                    model.encode(text, convert_to_numpy=True, show_progress_bar=False)
+                    for text in cleaned_texts
+                ]
+            )
+            return vectors, (time.perf_counter() - start) * 1000 / len(texts)
+
+        reference, reference_ms = encode_each(reference_model)
+        candidate, candidate_ms = encode_each(self.model)
+
+        report = {
+            "backend": self.backend,
+            "texts": len(texts),
+            **inference_backend.cosine_drift(reference, candidate),
+            "reference_ms_per_text": reference_ms,
+            "backend_ms_per_text": candidate_ms,
+        }
+        logging.info(f"백엔드 정합성 검사 결과: {report}")
+        return report
+
+    @traced("embedding.embed_queries")
+    def embed_queries(self, queries: List[str]) -> np.ndarray:
+        """
+        여러 검색 쿼리를 임베딩 벡터로 변환합니다.
+
+        쿼리 캐시에 있는 쿼리는 모델 인코딩 없이 캐시된 벡터를 사용합니다.
+
+        Args:
+            queries: 검색 쿼리 리스트
+
+        Returns:
+            임베딩 벡터 배열 (shape: [len(queries), embedding_dim])
+        """
+        if self.query_cache is None:
+            return self.embed_texts(queries, show_progress_bar=False)
+
+        for i, query in enumerate(queries):
+            if not query or not query.strip():
+                raise ValueError(f"인덱스 {i}의 텍스트가 비어있습니다.")
+
+        cleaned_queries = [self._preprocess_text(query) for query in queries]
+        cached, missing = self.query_cache.get_many(cleaned_queries)
+        embeddings = self._allocate(len(cleaned_queries), cached)
+        for i, vector in cached.items():
+            embeddings[i] = vector
+
+        if missing:
+            missing_queries = [cleaned_queries[i] for i in missing]
+            encoded = self.embed_texts(missing_queries, show_progress_bar=False)
+            embeddings[missing] = encoded
+            self.query_cache.put_many(missing_queries, encoded)
         return embeddings
 
+    def warm_query_cache(self, queries: List[str]) -> int:
+        """
+        쿼리 임베딩 캐시를 미리 채웁니다.
+
+        Args:
+            queries: 캐시에 넣을 검색 쿼리 리스트 (빈 쿼리는 무시)
+
+        Returns:
+            새로 인코딩하여 캐시에 추가한 쿼리 수
+        """
+        if self.query_cache is None:
+            raise ValueError("쿼리 캐시가 비활성화되어 있습니다. (query_cache_size=0)")
+
+        # 전처리 결과가 같은 쿼리는 한 번만 인코딩
+        cleaned_queries = list(
+            dict.fromkeys(
+                self._preprocess_text(query)
+                for query in queries
+                if query and query.strip()
+            )
+        )
+        # 캐시 용량을 넘는 쿼리는 채워도 바로 제거되므로 앞쪽 쿼리만 사용
+        cleaned_queries = cleaned_queries[: self.query_cache.max_entries]
+        missing_queries = [q for q in cleaned_queries if q not in self.query_cache]
+        if not missing_queries:
+            return 0
+
+        encoded = self.embed_texts(missing_queries, show_progress_bar=False)
+        self.query_cache.put_many(missing_queries, encoded)
+        logging.info(
+            f"쿼리 임베딩 캐시 워밍: {len(missing_queries)}개 인코딩 "
+            f"(전체 {len(self.query_cache)}개)"
+        )
+        return len(missing_queries)
+
+    def save_cache(self) -> None:
+        """임베딩 캐시의 변경 사항을 디스크에 저장합니다."""
+        if self.cache is not None:
+            self.cache.save()
+
     def _preprocess_text(self, text: str) -> str:
         """
         텍스트 전처리를 수행합니다.
@@ -108,11 +574,24 @@ class SentenceTransformersEmbedding(Embeddings):
         text = re.sub(r"\n+", " ", text)
         return text
 
+    @traced("embedding.embed_documents")
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """LangChain Embeddings 인터페이스 구현: 문서들을 임베딩으로 변환"""
         embeddings = self.embed_texts(texts)
         return embeddings.tolist()
 
+    @traced("embedding.embed_query")
     def embed_query(self, text: str) -> List[float]:
         """LangChain Embeddings 인터페이스 구현: 쿼리를 임베딩으로 변환"""
-        return self.embed_text(text)
+        if self.query_cache is None:
+            return self.embed_text(text)
+        if not text or not text.strip():
+            raise ValueError("입력 텍스트가 비어있습니다.")
+
+        # 반복되는 쿼리는 모델 인코딩 없이 캐시된 벡터 사용
+        cleaned_text = self._preprocess_text(text)
+        vector = self.query_cache.get(cleaned_text)
+        if vector is None:
+            vector = np.asarray(self.embed_text(cleaned_text), dtype=np.float32)
+            self.query_cache.put(cleaned_text, vector)
+        return vector.tolist()
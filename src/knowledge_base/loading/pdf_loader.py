@@ -1,14 +1,127 @@
-from typing import List
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-from langchain.schema import Document
-from langchain_community.document_loaders import PyPDFLoader
+import pypdf
+from langchain_core.documents import Document
+
+from ..tracing import traced
+
+
+def _extract_page_texts(file_path: str, start: int, end: int) -> List[str]:
+    """작업 프로세스에서 [start, end) 범위 페이지의 텍스트를 추출"""
+    reader = pypdf.PdfReader(file_path)
+    return [
+        reader.pages[page_number].extract_text(extraction_mode="plain").strip()
+        for page_number in range(start, end)
+    ]
+
+
+def _normalize_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    PDF 문서 메타데이터를 PyPDFLoader와 같은 형식으로 정규화
+
+    키의 '/'를 떼고 소문자로 바꾸며, 문자열/정수가 아닌 값은 문자열로, 작성/수정
+    일자(D:YYYYMMDDHHmmSS+hh'mm')는 ISO 8601 문자열로 변환합니다.
+    """
+    normalized: Dict[str, Any] = {}
+    for key, value in metadata.items():
+        if type(value) not in (str, int):
+            value = str(value)
+        key = key.lstrip("/").lower()
+        if key in ("creationdate", "moddate"):
+            try:
+                value = datetime.strptime(
+                    value.replace("'", ""), "D:%Y%m%d%H%M%S%z"
+                ).isoformat("T")
+            except ValueError:
+                pass
+        elif key in ("page_count", "file_path"):
+            # 다른 PDF 파서와 같은 키로도 기록
+            normalized[{"page_count": "total_pages", "file_path": "source"}[key]] = (
+                value
+            )
+        elif isinstance(value, str):
+            value = value.strip()
+        normalized[key] = value
+    return normalized
 
 
 class PDFLoader:
-    def __init__(self, file_path: str):
+    def __init__(
+        self, file_path: str, num_workers: Optional[int] = 1, pages_per_task: int = 4
+    ):
+        """
+        Args:
+            file_path: PDF 파일 경로
+            num_workers: 페이지 텍스트 추출 프로세스 수 (1이면 단일 프로세스,
+                None이면 CPU 코어 수)
+            pages_per_task: 작업 프로세스 하나가 한 번에 추출할 페이지 수
+        """
         self.file_path = file_path
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.pages_per_task = pages_per_task
 
+    @traced("pdf_loader.load")
     def load(self) -> List[Document]:
         """PDF를 페이지 단위로 로딩"""
-        loader = PyPDFLoader(self.file_path)
-        return loader.load()
+        if self.num_workers == 1:
+            from langchain_community.document_loaders import PyPDFLoader
+
+            return PyPDFLoader(self.file_path).load()
+        return list(self.lazy_load())
+
+    def lazy_load(self) -> Iterator[Document]:
+        """
+        PDF를 페이지 순서대로 하나씩 로딩
+
+        여러 프로세스로 추출하는 경우에도 앞쪽 페이지 범위의 추출이 끝나는 대로
+        반환하므로, 전체 페이지 추출을 기다리지 않고 후속 처리를 시작할 수 있습니다.
+        반환되는 Document는 PyPDFLoader.load()의 결과와 동일합니다.
+        """
+        # LangChain PDF 로더는 import에 약 1초가 걸리므로 로딩 시점에 import
+        from langchain_community.document_loaders import PyPDFLoader
+
+        if self.num_workers == 1:
+            yield from PyPDFLoader(self.file_path).lazy_load()
+            return
+
+        # 문서 메타데이터와 페이지 라벨은 텍스트 추출 없이 메인 프로세스에서 읽음
+        reader = pypdf.PdfReader(self.file_path)
+        num_pages = len(reader.pages)
+        doc_metadata = _normalize_metadata(
+            {"producer": "PyPDF", "creator": "PyPDF", "creationdate": ""}
+            | dict(reader.metadata or {})
+            | {"source": str(self.file_path), "total_pages": num_pages}
+        )
+        page_labels = reader.page_labels
+
+        ranges: List[Tuple[int, int]] = [
+            (start, min(start + self.pages_per_task, num_pages))
+            for start in range(0, num_pages, self.pages_per_task)
+        ]
+        # 단계 파이프라인 스레드에서 torch가 로드된 채 호출될 수 있으므로, 다중 스레드
+        # 프로세스를 fork하지 않도록 spawn으로 시작
+        with ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            # map은 제출 순서대로 결과를 반환하므로 페이지 순서가 유지됨
+            texts_by_range = executor.map(
+                _extract_page_texts,
+                [self.file_path] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+            )
+            for (start, _), texts in zip(ranges, texts_by_range):
+                for page_number, text in enumerate(texts, start):
+                    yield Document(
+                        page_content=text,
+                        metadata=doc_metadata
+                        | {
+                            "page": page_number,
+                            "page_label": page_labels[page_number],
+                        },
+                    )
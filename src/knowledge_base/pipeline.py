@@ -3,34 +3,93 @@ Knowledge Base Pipeline
 PDF 문서 로딩 -> 청킹 -> 벡터 저장소 생성까지의 전체 파이프라인
 """
 
+import hashlib
 import logging
 import os
-from typing import List, Optional
+import shutil
+import tempfile
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+import numpy as np
 from langchain_core.documents import Document
 
 from .chunking.kor_chunker import KORChunker
 from .embedding.sentence_transformers_embedding import SentenceTransformersEmbedding
 from .loading.pdf_loader import PDFLoader
+from .stage_pipeline import StagePipeline
+from .storage.bm25_index import BM25Index
+from .storage.chunk_store import ChunkStore
 from .storage.faiss_vector_store import FAISSVectorStore
+from .storage.title_index import TitleIndex
+
+
+def fingerprint_chunks(chunks: List[Document]) -> List[str]:
+    """
+    청크별 내용 지문(제목 + 본문 해시)을 생성합니다.
+
+    지문은 벡터 저장소의 문서 ID로 사용되어, 다시 구축할 때 이전 Knowledge Base와
+    비교하는 기준이 됩니다. 제목과 본문이 모두 같은 청크가 여러 개이면 등장 순서를
+    덧붙여 구분합니다.
+
+    Args:
+        chunks: KORChunker가 생성한 청크 리스트
+
+    Returns:
+        청크 순서대로의 지문 리스트
+    """
+    occurrences: Dict[str, int] = {}
+    return [_fingerprint_chunk(chunk, occurrences) for chunk in chunks]
+
+
+def _fingerprint_chunk(chunk: Document, occurrences: Dict[str, int]) -> str:
+    """
+    청크 하나의 지문을 생성합니다.
+
+    Args:
+        chunk: 청크
+        occurrences: 지금까지 생성한 해시별 등장 횟수 (갱신됨)
+    """
+    content = f"{chunk.metadata.get('title', '')}\x1f{chunk.page_content}"
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+    count = occurrences.get(digest, 0)
+    occurrences[digest] = count + 1
+    return digest if count == 0 else f"{digest}-{count}"
 
 
 class KORPipeline:
     """
     Korean RAG Pipeline
 
-    PDF 로딩 -> 청킹 -> 임베딩 -> 벡터 저장소 저장
+    PDF 로딩 -> 청킹 -> 임베딩 -> 벡터 저장소 및 BM25 색인 저장
     """
 
-    def __init__(self, embedding_model: SentenceTransformersEmbedding):
+    def __init__(
+        self,
+        embedding_model: SentenceTransformersEmbedding,
+        vector_store: Optional[FAISSVectorStore] = None,
+        pdf_workers: Optional[int] = None,
+        embed_batch_size: int = 64,
+        queue_size: int = 4,
+    ):
         """
         파이프라인 초기화
 
         Args:
             embedding_model: 임베딩 모델 인스턴스
+            vector_store: 벡터 저장소 (기본값: flat 인덱스 저장소)
+            pdf_workers: PDF 페이지 텍스트 추출 프로세스 수 (None이면 CPU 코어 수)
+            embed_batch_size: 단계 파이프라인 구축에서 한 번에 임베딩할 청크 수
+            queue_size: 단계 파이프라인 구축에서 단계 사이 큐의 최대 항목 수
         """
+        if embed_batch_size <= 0:
+            raise ValueError("embed_batch_size는 1 이상이어야 합니다.")
+
         self.embedding_model = embedding_model
-        self.vector_store = FAISSVectorStore(self.embedding_model)
+        self.pdf_workers = pdf_workers
+        self.embed_batch_size = embed_batch_size
+        self.queue_size = queue_size
+        self.vector_store = vector_store or FAISSVectorStore(self.embedding_model)
+        self.ingest_stats: Optional[Dict[str, Any]] = None
 
     def process_pdf(
         self, pdf_path: str, document_name: Optional[str] = None
@@ -45,6 +104,26 @@ class KORPipeline:
         Returns:
             생성된 청크 리스트
         """
+        chunks = list(self.iter_pdf_chunks(pdf_path, document_name))
+        logging.info(f"생성된 청크 수: {len(chunks)}")
+
+        return chunks
+
+    def iter_pdf_chunks(
+        self, pdf_path: str, document_name: Optional[str] = None
+    ) -> Iterator[Document]:
+        """
+        PDF 파일을 페이지 순서대로 읽으며 청크를 하나씩 생성합니다.
+
+        앞쪽 페이지의 청크는 뒤쪽 페이지를 추출하는 동안 바로 반환됩니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            document_name: 문서명 (기본값: 파일명)
+
+        Returns:
+            청크 이터레이터 (process_pdf와 같은 순서와 내용)
+        """
         if not os.path.exists(pdf_path):
             raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
 
@@ -54,20 +133,18 @@ class KORPipeline:
 
         logging.info(f"PDF 로딩 시작: {pdf_path}")
 
-        # 1. PDF 로딩
-        loader = PDFLoader(pdf_path)
-        documents = loader.load()
-        logging.info(f"로딩된 페이지 수: {len(documents)}")
-
-        # 2. 청킹
-        chunker = KORChunker(documents, document_name)
-        chunks = chunker.process()
-        logging.info(f"생성된 청크 수: {len(chunks)}")
-
-        return chunks
+        # PDF 로딩과 청킹을 페이지 단위로 이어서 수행
+        loader = PDFLoader(pdf_path, num_workers=self.pdf_workers)
+        chunker = KORChunker(loader.lazy_load(), document_name)
+        return chunker.iter_chunks()
 
     def build_knowledge_base(
-        self, pdf_path: str, save_path: str, document_name: Optional[str] = None
+        self,
+        pdf_path: str,
+        save_path: str,
+        document_name: Optional[str] = None,
+        incremental: bool = False,
+        pipelined: bool = False,
     ) -> None:
         """
         PDF에서 Knowledge Base를 구축하고 저장합니다.
@@ -76,23 +153,216 @@ class KORPipeline:
             pdf_path: PDF 파일 경로
             save_path: 저장할 디렉토리 경로
             document_name: 문서명 (기본값: 파일명)
+            incremental: 저장된 Knowledge Base가 있으면 바뀐 청크만 다시 임베딩
+            pipelined: 전체 구축 시 로딩/청킹/임베딩/색인 추가를 단계 파이프라인으로
+                동시에 실행 (증분 갱신에는 적용되지 않음)
         """
         logging.info("Knowledge Base 구축 시작")
 
-        # 1. PDF 처리 (로딩 + 청킹)
-        chunks = self.process_pdf(pdf_path, document_name)
-
-        # 2. 벡터 저장소에 추가
-        logging.info("벡터 저장소에 청크 추가 중...")
-        self.vector_store.add_documents(chunks)
+        # 1~2. PDF 처리 (로딩 + 청킹) 후 벡터 저장소에 추가
+        if incremental and self._load_for_update(save_path):
+            # 증분 모드는 전체 청크의 지문을 저장된 저장소와 비교
+            chunks = self._process_with_fingerprints(pdf_path, document_name)
+            logging.info("벡터 저장소 증분 갱신 중...")
+            self.vector_store.update_documents(chunks)
+        elif pipelined:
+            chunks = self._ingest_pipelined(pdf_path, document_name)
+        else:
+            chunks = self._process_with_fingerprints(pdf_path, document_name)
+            logging.info("벡터 저장소에 청크 추가 중...")
+            self.vector_store.add_documents(chunks)
+        # 임베딩 캐시는 배치마다 저장하지 않고 마지막에 한 번 저장
+        self.embedding_model.save_cache()
+
+        title_index = TitleIndex.from_documents(chunks)
+        logging.info(f"조항 제목 색인: {len(title_index)}개 제목")
+
+        # 3. 희소(BM25) 색인 구축 - 벡터 저장소의 인덱스 위치 순서와 일치
+        logging.info("BM25 색인 구축 중...")
+        index_size = self.vector_store.db.index.ntotal
+        sparse_index = BM25Index.from_documents(
+            self.vector_store.get_documents(range(index_size))
+        )
 
-        # 3. 로컬 저장
+        # 4. 로컬 저장
         logging.info(f"Knowledge Base 저장 중: {save_path}")
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-        self.vector_store.save(save_path)
+        self._save_atomically(save_path, sparse_index, title_index)
 
         logging.info("Knowledge Base 구축 완료")
 
+    def _process_with_fingerprints(
+        self, pdf_path: str, document_name: Optional[str]
+    ) -> List[Document]:
+        """PDF를 청킹하고 청크 ID를 내용 지문으로 지정합니다."""
+        chunks = self.process_pdf(pdf_path, document_name)
+        for chunk, fingerprint in zip(chunks, fingerprint_chunks(chunks)):
+            chunk.id = fingerprint
+        return chunks
+
+    def _ingest_pipelined(
+        self, pdf_path: str, document_name: Optional[str]
+    ) -> List[Document]:
+        """
+        로딩 -> 청킹 -> 임베딩 -> 색인 추가를 단계 파이프라인으로 실행합니다.
+
+        PDF 페이지 추출은 작업 프로세스(pdf_workers)에서, 청킹과 배치 임베딩은 각각
+        전용 스레드에서 실행되며, 임베딩이 끝난 배치는 순서대로 바로 인덱스에
+        추가됩니다. 따라서 인덱스 위치 순서는 process_pdf()의 청크 순서와 같습니다.
+        학습이 필요한 인덱스(IVF 계열)는 모든 임베딩이 모인 뒤 학습하고 추가합니다.
+
+        Args:
+            pdf_path: PDF 파일 경로
+            document_name: 문서명 (기본값: 파일명)
+
+        Returns:
+            인덱스 위치 순서대로의 청크 리스트
+        """
+        if not os.path.exists(pdf_path):
+            raise FileNotFoundError(f"PDF 파일을 찾을 수 없습니다: {pdf_path}")
+        if document_name is None:
+            document_name = os.path.basename(pdf_path)
+
+        logging.info(
+            f"단계 파이프라인 구축 시작: {pdf_path} "
+            f"(배치 {self.embed_batch_size}, 큐 {self.queue_size})"
+        )
+        loader = PDFLoader(pdf_path, num_workers=self.pdf_workers)
+        runner = StagePipeline(queue_size=self.queue_size)
+        chunks = runner.run(
+            loader.lazy_load(),
+            [
+                ("chunk", lambda pages: self._chunk_batches(pages, document_name)),
+                ("embed", self._embed_batches),
+                ("index", self._index_batches),
+            ],
+            source_name="load",
+        )
+        runner.log_stats()
+        self.ingest_stats = runner.get_stats()
+        logging.info(f"생성된 청크 수: {len(chunks)}")
+        return chunks
+
+    def _chunk_batches(
+        self, pages: Iterator[Document], document_name: str
+    ) -> Iterator[List[Document]]:
+        """페이지 스트림을 청킹하여 지문을 지정한 청크 배치로 묶습니다."""
+        occurrences: Dict[str, int] = {}
+        batch: List[Document] = []
+        for chunk in KORChunker(pages, document_name).iter_chunks():
+            chunk.id = _fingerprint_chunk(chunk, occurrences)
+            batch.append(chunk)
+            if len(batch) == self.embed_batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _embed_batches(
+        self, batches: Iterator[List[Document]]
+    ) -> Iterator[Tuple[List[Document], np.ndarray]]:
+        """청크 배치를 임베딩합니다."""
+        for batch in batches:
+            embeddings = self.embedding_model.embed_texts(
+                [chunk.page_content for chunk in batch],
+                show_progress_bar=False,
+            )
+            yield batch, embeddings
+
+    def _index_batches(
+        self, batches: Iterator[Tuple[List[Document], np.ndarray]]
+    ) -> Iterator[Document]:
+        """임베딩된 배치를 순서대로 인덱스에 추가하고 추가한 청크를 반환합니다."""
+        pending: List[Tuple[List[Document], np.ndarray]] = []
+        for batch, embeddings in batches:
+            if self.vector_store.db.index.is_trained:
+                self.vector_store.add_embeddings(batch, embeddings)
+                yield from batch
+            else:
+                pending.append((batch, embeddings))
+
+        if pending:
+            chunks = [chunk for batch, _ in pending for chunk in batch]
+            self.vector_store.add_embeddings(
+                chunks, np.concatenate([embeddings for _, embeddings in pending])
+            )
+            yield from chunks
+
+    def _load_for_update(self, save_path: str) -> bool:
+        """
+        증분 갱신을 위해 저장된 벡터 저장소를 로드합니다.
+
+        Args:
+            save_path: 저장된 Knowledge Base 디렉토리 경로
+
+        Returns:
+            로드 여부 (저장소가 없거나 임베딩 모델 또는 인덱스 설정이 달라졌으면 False)
+        """
+        if not ChunkStore.exists(save_path):
+            logging.info(f"저장된 Knowledge Base가 없어 전체 구축합니다: {save_path}")
+            return False
+
+        # 다른 모델(또는 모델이 기록되지 않은 이전 저장소)의 벡터는 재사용할 수 없음
+        saved_model_name = FAISSVectorStore.saved_model_name(save_path)
+        if saved_model_name != self.embedding_model.model_name:
+            logging.info(
+                f"임베딩 모델이 바뀌어 전체 구축합니다: "
+                f"{saved_model_name} -> {self.embedding_model.model_name}"
+            )
+            return False
+
+        configured = (self.vector_store.index_type, self.vector_store.metric)
+        saved_store = FAISSVectorStore(
+            self.embedding_model,
+            index_type=self.vector_store.index_type,
+            index_params=self.vector_store.index_params,
+            metric=self.vector_store.metric,
+        )
+        saved_store.load(save_path)
+        if (saved_store.index_type, saved_store.metric) != configured:
+            logging.info(
+                f"인덱스 설정이 바뀌어 전체 구축합니다: "
+                f"{(saved_store.index_type, saved_store.metric)} -> {configured}"
+            )
+            return False
+
+        self.vector_store = saved_store
+        return True
+
+    def _save_atomically(
+        self, save_path: str, sparse_index: BM25Index, title_index: TitleIndex
+    ) -> None:
+        """
+        Knowledge Base를 임시 디렉토리에 모두 기록한 뒤 기존 디렉토리와 교체합니다.
+
+        저장 중 실패하면 기존 Knowledge Base가 그대로 유지됩니다.
+
+        Args:
+            save_path: 저장할 디렉토리 경로
+            sparse_index: BM25 색인
+            title_index: 조항 제목 색인
+        """
+        save_path = os.path.abspath(save_path)
+        parent = os.path.dirname(save_path)
+        os.makedirs(parent, exist_ok=True)
+
+        tmp_path = tempfile.mkdtemp(prefix=".kb-", dir=parent)
+        try:
+            os.chmod(tmp_path, 0o755)
+            self.vector_store.save(tmp_path)
+            sparse_index.save(tmp_path)
+            title_index.save(tmp_path)
+        except BaseException:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise
+
+        old_path = None
+        if os.path.exists(save_path):
+            old_path = f"{tmp_path}.old"
+            os.rename(save_path, old_path)
+        os.rename(tmp_path, save_path)
+        if old_path is not None:
+            shutil.rmtree(old_path, ignore_errors=True)
+
 
 def main():
     """메인 실행 함수"""
@@ -106,26 +376,38 @@ def main():
     # 파일 경로 설정
     pdf_path = "data/국어 지식 기반 생성(RAG) 참조 문서.pdf"
     save_path = "data/knowledge_base/korean_rag_reference"
+    cache_dir = "data/knowledge_base/embedding_cache"
+    config_path = "config/model_config.yaml"
     document_name = "국어_지식_기반_생성_RAG_참조_문서"
 
     try:
         # 임베딩 모델 초기화
         logging.info("임베딩 모델 초기화")
-        embedding_model = SentenceTransformersEmbedding(
+        embedding_model = SentenceTransformersEmbedding.from_config(
+            config_path,
             model_name="sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
             device="cpu",
+            cache_dir=cache_dir,
         )
 
         # 파이프라인 초기화
         logging.info("Knowledge Base Pipeline 초기화")
-        pipeline = KORPipeline(embedding_model)
+        vector_store = FAISSVectorStore.from_config(embedding_model, config_path)
+        pipeline = KORPipeline(embedding_model, vector_store)
 
         # Knowledge Base 구축
         logging.info(f"PDF 처리 시작: {pdf_path}")
+        # 저장된 Knowledge Base가 있으면 바뀐 청크만 갱신 (--full: 전체 구축)
         pipeline.build_knowledge_base(
-            pdf_path=pdf_path, save_path=save_path, document_name=document_name
+            pdf_path=pdf_path,
+            save_path=save_path,
+            document_name=document_name,
+            incremental="--full" not in sys.argv,
+            pipelined=True,
         )
 
+        logging.info(f"임베딩 인코딩 통계: {embedding_model.get_encoding_stats()}")
+        embedding_model.close()
         logging.info(f"✅ Knowledge Base 구축 완료: {save_path}")
 
     except Exception as e:
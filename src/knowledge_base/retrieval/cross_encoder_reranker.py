@@ -0,0 +1,339 @@
+"""
+Cross-Encoder Reranker
+1차 검색 후보를 (질문, 청크) 쌍 단위로 다시 채점하는 재순위화 모듈
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import yaml
+from langchain_core.documents import Document
+
+from ..tracing import traced
+
+if TYPE_CHECKING:
+    from sentence_transformers import CrossEncoder
+
+
+# 워밍업 시 쌍당 채점 시간 추정에 사용할 쌍 수
+WARMUP_PAIRS = 8
+
+
+class CrossEncoderReranker:
+    """
+    Cross-Encoder 기반 재순위화기
+
+    1차 검색(벡터/하이브리드)으로 넉넉히 가져온 후보를 (질문, 청크) 쌍으로 묶어
+    한 번의 패딩된 배치로 채점한 뒤 상위 k개를 반환합니다.
+
+    요청별 시간 예산이 주어지면 지금까지 측정한 쌍당 채점 시간(warmup()에서 초기화)으로
+    예산 안에 채점할 수 있는 후보 수를 추정하고, 1차 순위가 높은 후보부터 그만큼만
+    채점합니다. 추정치가 없을 때 예산이 이미 소진되었으면 채점하지 않습니다.
+    첫 번째 미채점 후보부터는 1차 검색 순서 그대로 뒤에 붙입니다.
+    채점 결과는 (질문 해시, 청크 키)로 캐시하여 같은 질문이 반복되면 재사용합니다.
+    모델은 처음 채점할 때(또는 warmup() 호출 시) 로드합니다.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "cross-encoder/ms-marco-MiniLM-L-2-v2",
+        device: str = "cpu",
+        max_length: int = 512,
+        cache_max_entries: int = 100000,
+        fetch_k: int = 20,
+        time_budget_ms: Optional[float] = None,
+    ):
+        """
+        재순위화기 초기화
+
+        Args:
+            model_name: 사용할 Cross-Encoder 모델명
+            device: 실행 장치 ("cpu" 또는 "cuda")
+            max_length: (질문, 청크) 쌍의 최대 토큰 길이
+            cache_max_entries: 점수 캐시에 보관할 최대 쌍 수
+            fetch_k: 검색기가 재순위화를 위해 가져올 기본 후보 수
+            time_budget_ms: 검색기가 사용할 기본 요청별 시간 예산 (None이면 제한 없음)
+        """
+        if cache_max_entries <= 0:
+            raise ValueError("cache_max_entries는 1 이상이어야 합니다.")
+
+        self.model_name = model_name
+        self.device = device
+        self.max_length = max_length
+        self.cache_max_entries = cache_max_entries
+        self.fetch_k = fetch_k
+        self.time_budget_ms = time_budget_ms
+
+        self._scores: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 쌍당 채점 시간(초)의 지수 이동 평균 (첫 채점 전에는 None)
+        self._seconds_per_pair: Optional[float] = None
+
+        self.requests = 0
+        self.pairs_scored = 0
+        self.cache_hits = 0
+        self.degraded = 0
+
+        self._model: Optional["CrossEncoder"] = None
+        self._model_lock = threading.Lock()
+
+    @property
+    def model(self) -> "CrossEncoder":
+        """Cross-Encoder 모델 (처음 사용할 때 로드)"""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    # sentence-transformers는 import만으로 수 초가 걸리므로 로딩 시점에 import
+                    from sentence_transformers import CrossEncoder
+
+                    logging.info(f"재순위화 모델 로딩 중: {self.model_name}")
+                    self._model = CrossEncoder(
+                        self.model_name, device=self.device, max_length=self.max_length
+                    )
+                    logging.info("재순위화 모델 로딩 완료")
+        return self._model
+
+    def warmup(self) -> float:
+        """
+        모델 로딩과 첫 채점 초기화를 미리 수행합니다. (서버 시작 시 호출)
+
+        첫 채점 초기화 이후 작은 배치를 한 번 더 채점하여 시간 예산 계산에 사용할
+        쌍당 채점 시간 추정치를 초기화합니다.
+
+        Returns:
+            소요 시간(초)
+        """
+        start = time.perf_counter()
+        self.model.predict([("warmup", "warmup")], show_progress_bar=False)
+
+        pairs = [("warmup query", "warmup document " * 32)] * WARMUP_PAIRS
+        score_start = time.perf_counter()
+        self.model.predict(
+            pairs, batch_size=len(pairs), show_progress_bar=False, convert_to_numpy=True
+        )
+        with self._lock:
+            if self._seconds_per_pair is None:
+                self._seconds_per_pair = (
+                    time.perf_counter() - score_start
+                ) / WARMUP_PAIRS
+        elapsed = time.perf_counter() - start
+        logging.info(f"재순위화 모델 워밍업 완료: {elapsed:.2f}초")
+        return elapsed
+
+    @classmethod
+    def from_config(
+        cls, config_path: str = "config/model_config.yaml", device: str = "cpu"
+    ) -> Optional["CrossEncoderReranker"]:
+        """
+        설정 파일의 retrieval 항목으로 재순위화기를 생성합니다.
+
+        Args:
+            config_path: 모델 설정 파일 경로
+            device: 실행 장치
+
+        Returns:
+            CrossEncoderReranker 인스턴스 (retrieval.rerank가 false이면 None)
+        """
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+
+        retrieval_config = config.get("retrieval", {})
+        if not retrieval_config.get("rerank", False):
+            return None
+        return cls(
+            model_name=retrieval_config.get(
+                "rerank_model", "cross-encoder/ms-marco-MiniLM-L-2-v2"
+            ),
+            device=device,
+            fetch_k=retrieval_config.get("rerank_fetch_k", 20),
+            time_budget_ms=retrieval_config.get("rerank_time_budget_ms"),
+        )
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        """캐시 키로 사용할 텍스트 해시를 생성합니다."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+    @classmethod
+    def _document_key(cls, document: Document) -> str:
+        """
+        청크의 캐시 키를 생성합니다.
+
+        긴 조항은 여러 청크가 같은 chunk_id를 공유하므로 본문 해시를 함께 사용합니다.
+        """
+        chunk_id = document.metadata.get("chunk_id", "")
+        return f"{chunk_id}:{cls._hash(document.page_content)}"
+
+    @traced("reranker.score")
+    def score(
+        self,
+        query: str,
+        documents: List[Document],
+        time_budget_ms: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        (질문, 청크) 쌍의 관련도 점수를 계산합니다.
+
+        Args:
+            query: 검색 쿼리
+            documents: 1차 검색 순서대로의 후보 청크
+            time_budget_ms: 채점에 사용할 시간 예산 (None이면 모든 후보 채점)
+
+        Returns:
+            후보별 점수 배열 (시간 예산 부족으로 채점하지 못한 후보는 NaN)
+        """
+        start = time.perf_counter()
+        query_hash = self._hash(query)
+        keys = [(query_hash, self._document_key(doc)) for doc in documents]
+
+        scores = np.full(len(documents), np.nan, dtype=np.float32)
+        missing = []
+        with self._lock:
+            self.requests += 1
+            for i, key in enumerate(keys):
+                cached = self._scores.get(key)
+                if cached is None:
+                    missing.append(i)
+                else:
+                    self._scores.move_to_end(key)
+                    scores[i] = cached
+            self.cache_hits += len(documents) - len(missing)
+            seconds_per_pair = self._seconds_per_pair
+
+        if missing and time_budget_ms is not None:
+            remaining = time_budget_ms / 1000 - (time.perf_counter() - start)
+            if remaining <= 0:
+                affordable = 0
+            elif seconds_per_pair:
+                affordable = int(remaining / seconds_per_pair)
+            else:
+                # 추정치가 없으면(워밍업 전 첫 채점) 예산이 남은 한 모두 채점
+                affordable = len(missing)
+            if affordable < len(missing):
+                # 1차 순위가 높은 후보부터 예산 안에서만 채점
+                missing = missing[:affordable]
+                with self._lock:
+                    self.degraded += 1
+
+        if missing:
+            score_start = time.perf_counter()
+            # 모든 쌍을 하나의 패딩된 배치로 채점
+            predicted = self.model.predict(
+                [(query, documents[i].page_content) for i in missing],
+                batch_size=len(missing),
+                show_progress_bar=False,
+                convert_to_numpy=True,
+            )
+            elapsed = time.perf_counter() - score_start
+            scores[missing] = predicted
+
+            with self._lock:
+                per_pair = elapsed / len(missing)
+                self._seconds_per_pair = (
+                    per_pair
+                    if self._seconds_per_pair is None
+                    else 0.8 * self._seconds_per_pair + 0.2 * per_pair
+                )
+                self.pairs_scored += len(missing)
+                for i, value in zip(missing, predicted.tolist()):
+                    self._scores[keys[i]] = float(value)
+                while len(self._scores) > self.cache_max_entries:
+                    self._scores.popitem(last=False)
+
+        return scores
+
+    def rerank_with_scores(
+        self,
+        query: str,
+        documents: List[Document],
+        k: int = 5,
+        time_budget_ms: Optional[float] = None,
+    ) -> List[Tuple[Document, Optional[float]]]:
+        """
+        후보 청크를 재순위화하고 재순위화 점수를 함께 반환합니다.
+
+        Args:
+            query: 검색 쿼리
+            documents: 1차 검색 순서대로의 후보 청크
+            k: 반환할 문서 수
+            time_budget_ms: 채점에 사용할 시간 예산 (None이면 모든 후보 채점)
+
+        Returns:
+            (문서, 재순위화 점수) 튜플 리스트. 1차 검색 순서의 앞에서부터 연속으로
+            채점된 후보가 점수 내림차순으로 먼저 오고, 첫 번째 미채점 후보부터는
+            (캐시된 점수가 있는 후보도) 점수 None으로 1차 검색 순서를 유지합니다.
+        """
+        if not documents:
+            return []
+
+        scores = self.score(query, documents, time_budget_ms=time_budget_ms)
+        unscored = np.flatnonzero(np.isnan(scores))
+        # 뒤쪽의 캐시 적중 후보가 채점하지 못한 앞쪽 후보를 앞지르지 않도록
+        # 연속으로 채점된 앞부분 안에서만 점수로 정렬
+        prefix = int(unscored[0]) if len(unscored) else len(documents)
+        ranked = np.argsort(-scores[:prefix], kind="stable")
+
+        results: List[Tuple[Document, Optional[float]]] = [
+            (documents[i], float(scores[i])) for i in ranked
+        ]
+        results.extend((documents[i], None) for i in range(prefix, len(documents)))
+        if len(unscored):
+            logging.info(
+                f"재순위화 시간 예산 초과: {len(documents) - prefix}/{len(documents)}개 "
+                "후보는 1차 검색 순서 유지"
+            )
+        return results[:k]
+
+    def rerank(
+        self,
+        query: str,
+        documents: List[Document],
+        k: int = 5,
+        time_budget_ms: Optional[float] = None,
+    ) -> List[Document]:
+        """
+        후보 청크를 재순위화합니다. 점수는 메타데이터 rerank_score에 기록됩니다.
+
+        Args:
+            query: 검색 쿼리
+            documents: 1차 검색 순서대로의 후보 청크
+            k: 반환할 문서 수
+            time_budget_ms: 채점에 사용할 시간 예산 (None이면 모든 후보 채점)
+
+        Returns:
+            재순위화된 문서 리스트
+        """
+        results = []
+        for doc, score in self.rerank_with_scores(
+            query, documents, k=k, time_budget_ms=time_budget_ms
+        ):
+            if score is not None:
+                doc.metadata["rerank_score"] = score
+            results.append(doc)
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        재순위화 통계를 반환합니다.
+
+        Returns:
+            요청 수, 채점한 쌍 수, 캐시 적중 수/비율, 예산 초과 횟수, 쌍당 평균 채점 시간
+        """
+        with self._lock:
+            looked_up = self.pairs_scored + self.cache_hits
+            return {
+                "requests": self.requests,
+                "pairs_scored": self.pairs_scored,
+                "cache_entries": len(self._scores),
+                "cache_hits": self.cache_hits,
+                "cache_hit_rate": self.cache_hits / looked_up if looked_up else 0.0,
+                "degraded": self.degraded,
+                "ms_per_pair": (
+                    self._seconds_per_pair * 1000 if self._seconds_per_pair else None
+                ),
+            }
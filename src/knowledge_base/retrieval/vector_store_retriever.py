@@ -3,14 +3,24 @@ Vector Store Retriever
 구축된 벡터 DB에서 검색 쿼리를 수행하는 모듈
 """
 
+import json
 import logging
 import os
-from typing import List, Optional
+import time
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 from langchain_core.documents import Document
 
 from ..embedding.sentence_transformers_embedding import SentenceTransformersEmbedding
+from ..storage.bm25_index import BM25Index
 from ..storage.faiss_vector_store import FAISSVectorStore
+from ..storage.metadata_index import MetadataFilter
+from ..storage.title_index import TitleIndex
+from ..tracing import traced
+from .cross_encoder_reranker import CrossEncoderReranker
+
+FUSION_METHODS = ("rrf", "weighted")
 
 
 class VectorStoreRetriever:
@@ -18,10 +28,18 @@ class VectorStoreRetriever:
     벡터 저장소 기반 검색기
 
     저장된 벡터 DB를 로드하고 검색 쿼리를 수행
+    BM25 색인이 함께 저장되어 있으면 하이브리드(희소 + 밀집) 검색을 지원
+    재순위화기가 주어지면 1차 검색 후보를 Cross-Encoder로 재순위화하는 검색을 지원
+    검색 메서드의 filter로 메타데이터(source, 제목 접두어, 페이지 범위 등) 조건을 만족하는
+    문서 안에서만 검색 (FAISSVectorStore.search_positions() 참고)
     """
 
     def __init__(
-        self, vector_store_path: str, embedding_model: SentenceTransformersEmbedding
+        self,
+        vector_store_path: str,
+        embedding_model: SentenceTransformersEmbedding,
+        index_params: Optional[Dict[str, Any]] = None,
+        reranker: Optional[CrossEncoderReranker] = None,
     ):
         """
         검색기 초기화
@@ -29,12 +47,17 @@ class VectorStoreRetriever:
         Args:
             vector_store_path: 벡터 저장소 경로
             embedding_model: 임베딩 모델 인스턴스
+            index_params: 검색 시점 인덱스 파라미터 (예: nprobe, ef_search)
+            reranker: 재순위화기 (선택사항, rerank_search에서 사용)
         """
         self.vector_store_path = vector_store_path
         self.embedding_model = embedding_model
+        self.reranker = reranker
 
         # 벡터 저장소 초기화 및 로드
-        self.vector_store = FAISSVectorStore(self.embedding_model)
+        self.vector_store = FAISSVectorStore(
+            self.embedding_model, index_params=index_params
+        )
         self._load_vector_store()
 
     def _load_vector_store(self) -> None:
@@ -47,10 +70,24 @@ class VectorStoreRetriever:
 
         logging.info(f"벡터 저장소 로딩 중: {self.vector_store_path}")
         self.vector_store.load(self.vector_store_path)
+
+        self.sparse_index: Optional[BM25Index] = None
+        if BM25Index.exists(self.vector_store_path):
+            self.sparse_index = BM25Index.load(self.vector_store_path)
+
+        self.title_index: Optional[TitleIndex] = None
+        if TitleIndex.exists(self.vector_store_path):
+            self.title_index = TitleIndex.load(self.vector_store_path)
+        self._positions_by_chunk_id: Optional[Dict[str, List[int]]] = None
         logging.info("벡터 저장소 로딩 완료")
 
+    @traced("retriever.search")
     def search(
-        self, query: str, k: int = 5, score_threshold: Optional[float] = None
+        self,
+        query: str,
+        k: int = 5,
+        score_threshold: Optional[float] = None,
+        filter: Optional[MetadataFilter] = None,
     ) -> List[Document]:
         """
         검색 쿼리를 수행합니다.
@@ -58,18 +95,33 @@ class VectorStoreRetriever:
         Args:
             query: 검색 쿼리
             k: 반환할 문서 수
-            score_threshold: 최소 유사도 점수 (선택사항)
+            score_threshold: 점수 임계값 (선택사항, 코사인/내적은 최소 유사도,
+                L2는 최대 거리)
+            filter: 메타데이터 필터 (선택사항, 예: {"title_prefix": "한글 맞춤법"},
+                {"source": [...]}, {"page_range": (10, 20)})
 
         Returns:
             검색된 문서 리스트
         """
         logging.info(f"검색 쿼리: '{query}' (k={k})")
 
+        if filter is not None:
+            results = self._filtered_search_with_scores(query, k, filter)
+            if score_threshold is None:
+                return [doc for doc, _ in results]
+            return [
+                doc
+                for doc, score in results
+                if self.vector_store.passes_threshold(score, score_threshold)
+            ]
+
         if score_threshold is not None:
             # 점수 기반 검색
             results = self.vector_store.db.similarity_search_with_score(query, k=k)
             filtered_results = [
-                doc for doc, score in results if score >= score_threshold
+                doc
+                for doc, score in results
+                if self.vector_store.passes_threshold(score, score_threshold)
             ]
             logging.info(
                 f"검색 결과: {len(filtered_results)}개 (점수 임계값: {score_threshold})"
@@ -81,8 +133,9 @@ class VectorStoreRetriever:
             logging.info(f"검색 결과: {len(results)}개")
             return results
 
+    @traced("retriever.search_with_scores")
     def search_with_scores(
-        self, query: str, k: int = 5
+        self, query: str, k: int = 5, filter: Optional[MetadataFilter] = None
     ) -> List[tuple[Document, float]]:
         """
         검색 쿼리를 수행하고 유사도 점수를 함께 반환합니다.
@@ -90,17 +143,119 @@ class VectorStoreRetriever:
         Args:
             query: 검색 쿼리
             k: 반환할 문서 수
+            filter: 메타데이터 필터 (선택사항)
 
         Returns:
             (문서, 유사도 점수) 튜플 리스트
         """
         logging.info(f"점수 포함 검색 쿼리: '{query}' (k={k})")
-        results = self.vector_store.db.similarity_search_with_score(query, k=k)
+        if filter is not None:
+            results = self._filtered_search_with_scores(query, k, filter)
+        else:
+            results = self.vector_store.db.similarity_search_with_score(query, k=k)
         logging.info(f"검색 결과: {len(results)}개")
         return results
 
+    def _filtered_search_with_scores(
+        self, query: str, k: int, filter: MetadataFilter
+    ) -> List[tuple[Document, float]]:
+        """필터를 만족하는 문서 안에서 검색합니다. (점수는 LangChain 검색과 같은 척도)"""
+        results = self.vector_store.search_by_vectors(
+            self.embedding_model.embed_query(query), k=k, filter=filter
+        )[0]
+        logging.info(f"필터 검색 결과: {len(results)}개 (필터: {filter})")
+        return results
+
+    @traced("retriever.search_batch")
+    def search_batch(
+        self,
+        queries: List[str],
+        k: int = 5,
+        score_threshold: Optional[float] = None,
+        filter: Optional[MetadataFilter] = None,
+    ) -> List[List[Document]]:
+        """
+        여러 검색 쿼리를 한 번에 수행합니다.
+
+        모든 쿼리를 한 번의 배치 인코딩으로 임베딩한 뒤, 단일 FAISS 검색으로
+        결과를 조회합니다. 쿼리별 결과는 search()와 동일합니다.
+
+        Args:
+            queries: 검색 쿼리 리스트
+            k: 쿼리별 반환할 문서 수
+            score_threshold: 점수 임계값 (선택사항, 코사인/내적은 최소 유사도,
+                L2는 최대 거리)
+            filter: 메타데이터 필터 (선택사항, 모든 쿼리에 적용)
+
+        Returns:
+            쿼리별 검색된 문서 리스트
+        """
+        results_with_scores = self.search_batch_with_scores(queries, k=k, filter=filter)
+
+        if score_threshold is None:
+            return [[doc for doc, _ in results] for results in results_with_scores]
+        return [
+            [
+                doc
+                for doc, score in results
+                if self.vector_store.passes_threshold(score, score_threshold)
+            ]
+            for results in results_with_scores
+        ]
+
+    @traced("retriever.search_batch_with_scores")
+    def search_batch_with_scores(
+        self,
+        queries: List[str],
+        k: int = 5,
+        filter: Optional[MetadataFilter] = None,
+    ) -> List[List[tuple[Document, float]]]:
+        """
+        여러 검색 쿼리를 한 번에 수행하고 유사도 점수를 함께 반환합니다.
+
+        Args:
+            queries: 검색 쿼리 리스트
+            k: 쿼리별 반환할 문서 수
+            filter: 메타데이터 필터 (선택사항, 모든 쿼리에 적용)
+
+        Returns:
+            쿼리별 (문서, 유사도 점수) 튜플 리스트
+        """
+        if not queries:
+            return []
+
+        logging.info(f"배치 검색 쿼리: {len(queries)}개 (k={k})")
+        query_embeddings = self.embedding_model.embed_queries(queries)
+        results = self.vector_store.search_by_vectors(
+            query_embeddings, k=k, filter=filter
+        )
+        logging.info(f"배치 검색 결과: {sum(len(r) for r in results)}개")
+        return results
+
+    def warm_query_cache(self, dataset_path: str, field: str = "question") -> int:
+        """
+        데이터셋 파일의 질문으로 쿼리 임베딩 캐시를 미리 채웁니다.
+
+        Args:
+            dataset_path: RAG 데이터셋 JSON 파일 경로 (항목별 input.question 형식)
+            field: 쿼리로 사용할 input 필드명
+
+        Returns:
+            새로 인코딩하여 캐시에 추가한 쿼리 수
+        """
+        with open(dataset_path, "r", encoding="utf-8") as f:
+            dataset = json.load(f)
+
+        queries = [item.get("input", {}).get(field, "") for item in dataset]
+        return self.embedding_model.warm_query_cache(queries)
+
+    @traced("retriever.get_relevant_documents")
     def get_relevant_documents(
-        self, query: str, k: int = 5, min_score: float = 0.0
+        self,
+        query: str,
+        k: int = 5,
+        min_score: Optional[float] = None,
+        filter: Optional[MetadataFilter] = None,
     ) -> List[Document]:
         """
         관련성 높은 문서들을 검색합니다.
@@ -108,23 +263,265 @@ class VectorStoreRetriever:
         Args:
             query: 검색 쿼리
             k: 반환할 문서 수
-            min_score: 최소 관련성 점수
+            min_score: 점수 임계값 (선택사항, 코사인/내적은 최소 유사도,
+                L2는 최대 거리)
+            filter: 메타데이터 필터 (선택사항)
 
         Returns:
             관련성 높은 문서 리스트
         """
-        results_with_scores = self.vector_store.db.similarity_search_with_score(
-            query, k=k
-        )
+        results_with_scores = self.search_with_scores(query, k=k, filter=filter)
 
         relevant_docs = []
         for doc, score in results_with_scores:
-            if score >= min_score:
+            if min_score is None or self.vector_store.passes_threshold(
+                score, min_score
+            ):
                 # 메타데이터에 점수 추가
-                doc.metadata["similarity_score"] = score
+                doc.metadata["similarity_score"] = float(score)
                 relevant_docs.append(doc)
 
         logging.info(
             f"관련성 높은 문서: {len(relevant_docs)}개 (최소 점수: {min_score})"
         )
         return relevant_docs
+
+    @traced("retriever.reference_search")
+    def reference_search(
+        self,
+        query: str,
+        k: int = 5,
+        fallback: str = "dense",
+        filter: Optional[MetadataFilter] = None,
+    ) -> List[Document]:
+        """
+        쿼리에 조항 인용(예: 한글 맞춤법 제18항)이 있으면 제목 색인으로 바로 조회하고,
+        없으면 일반 검색을 수행합니다.
+
+        Args:
+            query: 검색 쿼리
+            k: 반환할 문서 수
+            fallback: 인용이 없을 때의 검색 방식 ("dense" 또는 "hybrid")
+            filter: 메타데이터 필터 (선택사항, 인용 조회 결과에도 적용)
+
+        Returns:
+            검색된 문서 리스트
+        """
+        if self.title_index is not None:
+            chunk_ids = self.title_index.find_references(query)
+            positions = self._get_chunk_positions(chunk_ids) if chunk_ids else []
+            mask = self.vector_store.filter_mask(filter)
+            if mask is not None:
+                positions = [position for position in positions if mask[position]]
+            if positions:
+                positions = positions[:k]
+                logging.info(f"조항 인용 조회: '{query}' -> {len(positions)}개 (k={k})")
+                return self.vector_store.get_documents(positions)
+
+        if fallback == "hybrid":
+            return self.hybrid_search(query, k=k, filter=filter)
+        return self.search(query, k=k, filter=filter)
+
+    def _get_chunk_positions(self, chunk_ids: List[str]) -> List[int]:
+        """chunk_id 목록에 해당하는 FAISS 인덱스 위치를 조회합니다."""
+        if self._positions_by_chunk_id is None:
+            # 최초 조회 시 chunk_id 컬럼만 읽어 위치 색인을 생성 (하나의 조항이
+            # 여러 청크로 분할되면 같은 chunk_id를 공유)
+            self._positions_by_chunk_id = {}
+            values = self.vector_store.get_metadata_values("chunk_id")
+            for position, chunk_id in enumerate(values):
+                self._positions_by_chunk_id.setdefault(chunk_id, []).append(position)
+
+        return [
+            position
+            for chunk_id in chunk_ids
+            for position in self._positions_by_chunk_id.get(chunk_id, [])
+        ]
+
+    @traced("retriever.rerank_search")
+    def rerank_search(
+        self,
+        query: str,
+        k: int = 5,
+        fetch_k: Optional[int] = None,
+        time_budget_ms: Optional[float] = None,
+        first_stage: str = "dense",
+        filter: Optional[MetadataFilter] = None,
+    ) -> List[Document]:
+        """
+        1차 검색으로 후보를 넉넉히 가져온 뒤 Cross-Encoder로 재순위화합니다.
+
+        시간 예산은 1차 검색을 포함한 요청 전체에 적용되며, 남은 예산으로 모든
+        후보를 채점할 수 없으면 채점하지 못한 후보는 1차 검색 순서를 유지합니다.
+
+        Args:
+            query: 검색 쿼리
+            k: 반환할 문서 수
+            fetch_k: 1차 검색에서 가져올 후보 수 (None이면 재순위화기 설정값)
+            time_budget_ms: 요청별 시간 예산 (None이면 재순위화기 설정값)
+            first_stage: 1차 검색 방식 ("dense" 또는 "hybrid")
+            filter: 메타데이터 필터 (선택사항, 1차 검색에 적용)
+
+        Returns:
+            재순위화된 문서 리스트 (재순위화 점수는 메타데이터 rerank_score)
+        """
+        if self.reranker is None:
+            raise ValueError("재순위화기가 설정되지 않았습니다. (reranker 인자 필요)")
+
+        start = time.perf_counter()
+        fetch_k = max(fetch_k or self.reranker.fetch_k, k)
+        if time_budget_ms is None:
+            time_budget_ms = self.reranker.time_budget_ms
+        if first_stage == "hybrid":
+            candidates = self.hybrid_search(query, k=fetch_k, filter=filter)
+        else:
+            candidates = self.search(query, k=fetch_k, filter=filter)
+
+        if time_budget_ms is not None:
+            time_budget_ms -= (time.perf_counter() - start) * 1000
+        results = self.reranker.rerank(
+            query, candidates, k=k, time_budget_ms=time_budget_ms
+        )
+        logging.info(
+            f"재순위화 결과: {len(results)}개 (후보 {len(candidates)}개, "
+            f"{(time.perf_counter() - start) * 1000:.1f}ms)"
+        )
+        return results
+
+    @traced("retriever.hybrid_search")
+    def hybrid_search(
+        self,
+        query: str,
+        k: int = 5,
+        fusion: str = "rrf",
+        fetch_k: int = 50,
+        alpha: float = 0.5,
+        rrf_k: int = 60,
+        filter: Optional[MetadataFilter] = None,
+    ) -> List[Document]:
+        """
+        BM25 희소 검색과 벡터 검색 결과를 융합하여 검색합니다.
+
+        Args:
+            query: 검색 쿼리
+            k: 반환할 문서 수
+            fusion: 융합 방식 ("rrf": 역순위 융합, "weighted": 가중 점수 융합)
+            fetch_k: 각 검색기에서 가져올 후보 수
+            alpha: weighted 융합 시 벡터 검색 점수 가중치 (0~1)
+            rrf_k: rrf 융합 시 순위 완화 상수
+            filter: 메타데이터 필터 (선택사항, 벡터 검색과 BM25 검색 모두에 적용)
+
+        Returns:
+            검색된 문서 리스트
+        """
+        return [
+            doc
+            for doc, _ in self.hybrid_search_with_scores(
+                query,
+                k=k,
+                fusion=fusion,
+                fetch_k=fetch_k,
+                alpha=alpha,
+                rrf_k=rrf_k,
+                filter=filter,
+            )
+        ]
+
+    @traced("retriever.hybrid_search_with_scores")
+    def hybrid_search_with_scores(
+        self,
+        query: str,
+        k: int = 5,
+        fusion: str = "rrf",
+        fetch_k: int = 50,
+        alpha: float = 0.5,
+        rrf_k: int = 60,
+        filter: Optional[MetadataFilter] = None,
+    ) -> List[tuple[Document, float]]:
+        """
+        하이브리드 검색을 수행하고 융합 점수를 함께 반환합니다.
+
+        Args:
+            query: 검색 쿼리
+            k: 반환할 문서 수
+            fusion: 융합 방식 ("rrf": 역순위 융합, "weighted": 가중 점수 융합)
+            fetch_k: 각 검색기에서 가져올 후보 수
+            alpha: weighted 융합 시 벡터 검색 점수 가중치 (0~1)
+            rrf_k: rrf 융합 시 순위 완화 상수
+            filter: 메타데이터 필터 (선택사항, 벡터 검색과 BM25 검색 모두에 적용)
+
+        Returns:
+            (문서, 융합 점수) 튜플 리스트
+        """
+        if self.sparse_index is None:
+            raise ValueError(
+                f"BM25 색인을 찾을 수 없습니다: {self.vector_store_path} "
+                "(파이프라인으로 다시 구축해야 합니다)"
+            )
+        if fusion not in FUSION_METHODS:
+            raise ValueError(
+                f"지원하지 않는 융합 방식입니다: {fusion} (지원: {FUSION_METHODS})"
+            )
+
+        logging.info(f"하이브리드 검색 쿼리: '{query}' (k={k}, fusion={fusion})")
+        fetch_k = max(fetch_k, k)
+        mask = self.vector_store.filter_mask(filter)
+
+        dense_scores, dense_ids = self.vector_store.search_positions(
+            self.embedding_model.embed_query(query), k=fetch_k, filter=mask
+        )
+        dense_scores, dense_ids = dense_scores[0], dense_ids[0]
+        valid = dense_ids != -1
+        dense_scores, dense_ids = dense_scores[valid], dense_ids[valid]
+        if not self.vector_store.higher_is_better:
+            # L2 거리는 부호를 바꿔 클수록 유사하도록 변환
+            dense_scores = -dense_scores
+
+        sparse_scores, sparse_ids = self.sparse_index.search(
+            query, k=fetch_k, mask=mask
+        )
+
+        candidates = np.union1d(dense_ids, sparse_ids)
+        if fusion == "rrf":
+            fused = self._rrf_scores(candidates, dense_ids, rrf_k) + self._rrf_scores(
+                candidates, sparse_ids, rrf_k
+            )
+        else:
+            fused = alpha * self._normalized_scores(
+                candidates, dense_ids, dense_scores
+            ) + (1 - alpha) * self._normalized_scores(
+                candidates, sparse_ids, sparse_scores
+            )
+
+        top = np.argsort(-fused, kind="stable")[:k]
+        documents = self.vector_store.get_documents(candidates[top])
+        results = list(zip(documents, fused[top].tolist()))
+        logging.info(f"검색 결과: {len(results)}개")
+        return results
+
+    @staticmethod
+    def _rrf_scores(
+        candidates: np.ndarray, ranked_ids: np.ndarray, rrf_k: int
+    ) -> np.ndarray:
+        """후보 문서별 역순위 점수 1 / (rrf_k + 순위)를 계산합니다."""
+        scores = np.zeros(len(candidates), dtype=np.float64)
+        positions = np.searchsorted(candidates, ranked_ids)
+        scores[positions] = 1.0 / (rrf_k + np.arange(1, len(ranked_ids) + 1))
+        return scores
+
+    @staticmethod
+    def _normalized_scores(
+        candidates: np.ndarray, ranked_ids: np.ndarray, ranked_scores: np.ndarray
+    ) -> np.ndarray:
+        """후보 문서별 점수를 min-max 정규화합니다. 검색되지 않은 후보는 0점입니다."""
+        scores = np.zeros(len(candidates), dtype=np.float64)
+        if len(ranked_ids) == 0:
+            return scores
+        low, high = float(ranked_scores.min()), float(ranked_scores.max())
+        normalized = (
+            (ranked_scores - low) / (high - low)
+            if high > low
+            else np.ones(len(ranked_scores))
+        )
+        scores[np.searchsorted(candidates, ranked_ids)] = normalized
+        return scores
@@ -0,0 +1,273 @@
+"""
+Micro Batcher
+짧은 시간 안에 도착한 비동기 요청들을 모아 하나의 배치 함수 호출로 처리하는 배처
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 배치 처리 함수: 요청 항목 리스트를 받아 같은 순서의 결과 리스트를 반환
+BatchFunction = Callable[[List[Any]], List[Any]]
+
+
+class QueueFullError(RuntimeError):
+    """대기 중인 요청 수가 max_queue_size에 도달하여 요청을 받을 수 없음"""
+
+
+class MetricWindow:
+    """
+    최근 window_size개 측정값의 백분위수를 계산하는 고정 크기 기록
+
+    오래된 측정값은 자동으로 버려지므로 장시간 실행해도 메모리가 일정합니다.
+    """
+
+    def __init__(self, window_size: int = 10000):
+        """
+        Args:
+            window_size: 보관할 최근 측정값 수
+        """
+        self._values: Deque[float] = deque(maxlen=window_size)
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        """측정값을 기록합니다."""
+        self._values.append(value)
+        self.count += 1
+
+    def percentiles(self, *percents: float) -> Dict[str, Optional[float]]:
+        """
+        최근 측정값의 백분위수를 반환합니다.
+
+        Args:
+            *percents: 계산할 백분위 (예: 50, 99)
+
+        Returns:
+            {"p50": 값, ...} (측정값이 없으면 None)
+        """
+        keys = [f"p{percent:g}" for percent in percents]
+        if not self._values:
+            return dict.fromkeys(keys)
+        values = np.percentile(np.fromiter(self._values, dtype=np.float64), percents)
+        return {key: float(value) for key, value in zip(keys, values)}
+
+    def mean(self) -> Optional[float]:
+        """최근 측정값의 평균 (측정값이 없으면 None)"""
+        return float(np.mean(self._values)) if self._values else None
+
+    def max(self) -> Optional[float]:
+        """최근 측정값의 최댓값 (측정값이 없으면 None)"""
+        return max(self._values, default=None)
+
+
+class MicroBatcher:
+    """
+    비동기 요청 마이크로 배처
+
+    submit()으로 들어온 요청은 큐에 쌓이고, 배치 작업이 첫 요청 도착 후 최대
+    max_wait_ms 동안(또는 max_batch_size개가 모일 때까지) 요청을 모아
+    batch_function을 한 번 호출합니다. batch_function은 이벤트 루프를 막지 않도록
+    전용 스레드 하나에서 실행되며, 배치를 처리하는 동안 도착한 요청은 다음 배치로
+    모이므로 부하가 높을수록 배치가 커집니다.
+
+    요청별 지연 시간(대기 + 처리), 배치 크기, 큐 길이를 기록하여 get_stats()로
+    제공합니다.
+    """
+
+    def __init__(
+        self,
+        batch_function: BatchFunction,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_queue_size: int = 1024,
+        window_size: int = 10000,
+    ):
+        """
+        Args:
+            batch_function: 요청 항목 리스트를 처리하는 함수 (결과는 입력 순서대로)
+            max_batch_size: 한 번에 처리할 최대 요청 수
+            max_wait_ms: 첫 요청 도착 후 배치를 더 모으기 위해 기다리는 최대 시간(밀리초)
+            max_queue_size: 대기할 수 있는 최대 요청 수 (초과 시 QueueFullError)
+            window_size: 백분위수 계산에 사용할 최근 측정값 수
+        """
+        if max_batch_size <= 0:
+            raise ValueError("max_batch_size는 1 이상이어야 합니다.")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms는 0 이상이어야 합니다.")
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size는 1 이상이어야 합니다.")
+
+        self.batch_function = batch_function
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.max_queue_size = max_queue_size
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        self.latency = MetricWindow(window_size)
+        self.batch_latency = MetricWindow(window_size)
+        self.batch_sizes = MetricWindow(window_size)
+        self.queue_depths = MetricWindow(window_size)
+        self.max_queue_depth = 0
+        self.rejected = 0
+        self.failed = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """현재 처리를 기다리는 요청 수"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def start(self) -> None:
+        """현재 이벤트 루프에서 배치 작업을 시작합니다."""
+        if self._worker is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="micro-batch"
+        )
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """배치 작업을 멈추고, 처리되지 않은 요청은 취소합니다."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        self._worker = None
+        self._executor = None
+
+    async def submit(self, item: Any) -> Any:
+        """
+        요청 하나를 큐에 넣고 배치 처리 결과를 기다립니다.
+
+        Args:
+            item: batch_function에 전달할 요청 항목
+
+        Returns:
+            해당 요청의 처리 결과
+        """
+        if self._worker is None:
+            raise RuntimeError(
+                "배치 작업이 시작되지 않았습니다. start()를 먼저 호출하세요."
+            )
+
+        future = asyncio.get_running_loop().create_future()
+        start = time.perf_counter()
+        try:
+            self._queue.put_nowait((item, future, start))
+        except asyncio.QueueFull:
+            self.rejected += 1
+            raise QueueFullError(
+                f"대기 중인 요청이 너무 많습니다: {self.max_queue_size}개"
+            ) from None
+        self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+
+        result = await future
+        self.latency.add(time.perf_counter() - start)
+        return result
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future, float]]:
+        """첫 요청을 기다린 뒤, 대기 시간 안에 도착한 요청을 최대 크기까지 모읍니다."""
+        batch = [await self._queue.get()]
+        # 첫 요청이 이전 배치 처리 중에 이미 기다렸다면 그만큼 덜 기다림
+        deadline = batch[0][2] + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        """요청을 배치로 모아 전용 스레드에서 처리하는 작업 루프"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            # 연결이 끊겨 이미 취소된 요청은 처리하지 않음
+            batch = [entry for entry in batch if not entry[1].done()]
+            if not batch:
+                continue
+
+            self.batch_sizes.add(len(batch))
+            self.queue_depths.add(self._queue.qsize())
+            start = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self.batch_function, [item for item, _, _ in batch]
+                )
+                if len(results) != len(batch):
+                    raise RuntimeError(
+                        f"배치 결과 수가 요청 수와 다릅니다: {len(results)} != {len(batch)}"
+                    )
+            except Exception as e:
+                self.failed += len(batch)
+                logging.exception(f"배치 처리 실패 ({len(batch)}개 요청)")
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            finally:
+                self.batch_latency.add(time.perf_counter() - start)
+
+            for (_, future, _), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        지연 시간, 배치 크기, 큐 길이 통계를 반환합니다.
+
+        Returns:
+            요청 지연 시간(대기 + 처리, 밀리초) p50/p99, 배치 처리 시간 p50/p99,
+            배치 크기 평균/최대, 현재/최대 큐 길이 등
+        """
+        latency = self.latency.percentiles(50, 99)
+        batch_latency = self.batch_latency.percentiles(50, 99)
+        return {
+            "requests": self.latency.count,
+            "rejected": self.rejected,
+            "failed": self.failed,
+            "batches": self.batch_sizes.count,
+            "latency_ms": {
+                key: value * 1000 if value is not None else None
+                for key, value in latency.items()
+            },
+            "batch_latency_ms": {
+                key: value * 1000 if value is not None else None
+                for key, value in batch_latency.items()
+            },
+            "batch_size": {
+                "mean": self.batch_sizes.mean(),
+                "max": self.batch_sizes.max(),
+            },
+            "queue_depth": {
+                "current": self.queue_depth,
+                "max": self.max_queue_depth,
+                "mean_at_dispatch": self.queue_depths.mean(),
+            },
+            "config": {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000,
+                "max_queue_size": self.max_queue_size,
+            },
+        }
@@ -0,0 +1,400 @@
+"""
+Search Server
+지식베이스를 한 번 로드하고 /search 요청을 마이크로 배치로 처리하는 로컬 HTTP 검색 서비스
+
+사용법:
+    python -m src.knowledge_base.serving.search_server
+    python -m src.knowledge_base.serving.search_server --port 8080 --max_wait_ms 3
+
+    curl -X POST localhost:8080/search -d '{"query": "맞춤법 규칙", "k": 3}'
+    curl "localhost:8080/search?query=맞춤법%20규칙&k=3"
+    curl -X POST localhost:8080/search \
+        -d '{"query": "맞춤법 규칙", "filter": {"title_prefix": "한글 맞춤법 제"}}'
+    curl localhost:8080/metrics
+    curl "localhost:8080/metrics?format=prometheus"   # --tracing 시 단계별 히스토그램 포함
+"""
+
+import argparse
+import json
+import logging
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import yaml
+from aiohttp import web
+from langchain_core.documents import Document
+
+from .. import tracing
+from ..embedding.sentence_transformers_embedding import SentenceTransformersEmbedding
+from ..retrieval.vector_store_retriever import VectorStoreRetriever
+from ..storage.faiss_vector_store import FAISSVectorStore
+from .micro_batcher import MicroBatcher, QueueFullError
+
+DEFAULT_SERVING_CONFIG = {
+    "host": "127.0.0.1",
+    "port": 8080,
+    "max_batch_size": 32,
+    "max_wait_ms": 5.0,
+    "max_queue_size": 1024,
+    "max_k": 100,
+    "tracing": False,
+}
+# 모델이 기록되지 않은 이전 지식베이스의 임베딩 모델 (파이프라인 구축 모델)
+DEFAULT_MODEL_NAME = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+# Prometheus 형식으로 내보낼 서버 누적 카운터 (MicroBatcher.get_stats() 키)
+PROMETHEUS_COUNTERS = ("requests", "rejected", "failed", "batches")
+
+# 한글이 \uXXXX로 바뀌지 않도록 응답 JSON을 그대로 기록 (메타데이터의 기타 타입은 문자열로)
+_dumps = partial(json.dumps, ensure_ascii=False, default=str)
+
+
+@dataclass
+class SearchRequest:
+    """검색 요청 하나"""
+
+    query: str
+    k: int = 5
+    score_threshold: Optional[float] = None
+    filter: Optional[Dict[str, Any]] = None
+
+
+class SearchService:
+    """
+    마이크로 배치 검색 서비스
+
+    동시에 들어온 /search 요청을 MicroBatcher로 모아, 한 번의 배치 쿼리 인코딩과
+    k 값별 한 번의 FAISS 검색으로 처리합니다. 모든 요청이 같은 검색기(같은 모델)를
+    공유하므로 프로세스당 모델을 한 번만 로드합니다.
+    """
+
+    def __init__(
+        self,
+        retriever: VectorStoreRetriever,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0,
+        max_queue_size: int = 1024,
+        max_k: int = 100,
+    ):
+        """
+        Args:
+            retriever: 로드된 검색기
+            max_batch_size: 한 번에 처리할 최대 요청 수
+            max_wait_ms: 첫 요청 도착 후 배치를 더 모으기 위해 기다리는 최대 시간(밀리초)
+            max_queue_size: 대기할 수 있는 최대 요청 수 (초과 시 503 응답)
+            max_k: 요청에 허용할 최대 k
+        """
+        self.retriever = retriever
+        self.max_k = max_k
+        self.batcher = MicroBatcher(
+            self.search_batch,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+            max_queue_size=max_queue_size,
+        )
+        self.started_at = time.time()
+
+    def search_batch(
+        self, requests: List[SearchRequest]
+    ) -> List[List[Tuple[Document, float]]]:
+        """
+        검색 요청 묶음을 한 번에 처리합니다. (배치 작업 스레드에서 호출)
+
+        쿼리는 한 번의 배치 인코딩으로 임베딩하고, FAISS 검색은 요청된 (k, 필터)별로
+        한 번씩 수행하므로 요청별 결과는 retriever.search_with_scores()와 같습니다.
+
+        Args:
+            requests: 검색 요청 리스트
+
+        Returns:
+            요청 순서대로의 (문서, 점수) 튜플 리스트
+        """
+        vector_store = self.retriever.vector_store
+        embeddings = self.retriever.embedding_model.embed_queries(
+            [request.query for request in requests]
+        )
+
+        positions_by_group: Dict[Tuple[int, Optional[str]], List[int]] = {}
+        for position, request in enumerate(requests):
+            filter_key = (
+                _dumps(request.filter, sort_keys=True)
+                if request.filter is not None
+                else None
+            )
+            positions_by_group.setdefault((request.k, filter_key), []).append(position)
+
+        results: List[List[Tuple[Document, float]]] = [[] for _ in requests]
+        for (k, _), positions in positions_by_group.items():
+            hits_per_query = vector_store.search_by_vectors(
+                embeddings[positions], k=k, filter=requests[positions[0]].filter
+            )
+            for position, hits in zip(positions, hits_per_query):
+                threshold = requests[position].score_threshold
+                if threshold is not None:
+                    hits = [
+                        (doc, score)
+                        for doc, score in hits
+                        if vector_store.passes_threshold(score, threshold)
+                    ]
+                results[position] = hits
+        return results
+
+    def parse_request(self, params: Mapping[str, Any]) -> SearchRequest:
+        """
+        JSON 본문이나 쿼리 문자열의 검색 파라미터를 검증합니다.
+
+        Args:
+            params: query, k, score_threshold, filter(JSON 본문만) 항목
+
+        Returns:
+            SearchRequest
+        """
+        query = params.get("query")
+        if not isinstance(query, str) or not query.strip():
+            raise ValueError("query는 비어있지 않은 문자열이어야 합니다.")
+        try:
+            k = int(params.get("k", 5))
+            threshold = params.get("score_threshold")
+            threshold = float(threshold) if threshold is not None else None
+        except (TypeError, ValueError):
+            raise ValueError("k는 정수, score_threshold는 실수여야 합니다.") from None
+        if not 1 <= k <= self.max_k:
+            raise ValueError(f"k는 1 이상 {self.max_k} 이하여야 합니다: {k}")
+
+        filter = params.get("filter") if isinstance(params, dict) else None
+        if filter is not None:
+            if not isinstance(filter, dict):
+                raise ValueError("filter는 JSON 객체여야 합니다.")
+            # 잘못된 필터는 배치에 넣기 전에 400으로 응답
+            self.retriever.vector_store.filter_mask(filter)
+        return SearchRequest(query=query, k=k, score_threshold=threshold, filter=filter)
+
+    async def handle_search(self, request: web.Request) -> web.Response:
+        """GET/POST /search"""
+        start = time.perf_counter()
+        try:
+            if request.method == "POST":
+                params = await request.json()
+                if not isinstance(params, dict):
+                    raise ValueError("요청 본문은 JSON 객체여야 합니다.")
+            else:
+                params = request.query
+            search_request = self.parse_request(params)
+        except ValueError as e:
+            # 잘못된 JSON(json.JSONDecodeError)도 ValueError
+            return web.json_response({"error": str(e)}, status=400, dumps=_dumps)
+
+        try:
+            hits = await self.batcher.submit(search_request)
+        except QueueFullError as e:
+            return web.json_response({"error": str(e)}, status=503, dumps=_dumps)
+
+        return web.json_response(
+            {
+                "query": search_request.query,
+                "k": search_request.k,
+                "results": [
+                    {
+                        "content": doc.page_content,
+                        "metadata": doc.metadata,
+                        "score": score,
+                    }
+                    for doc, score in hits
+                ],
+                "latency_ms": (time.perf_counter() - start) * 1000,
+            },
+            dumps=_dumps,
+        )
+
+    async def handle_metrics(self, request: web.Request) -> web.Response:
+        """
+        GET /metrics: 지연 시간 p50/p99, 배치 크기, 큐 길이, 쿼리 캐시 통계와
+        (추적 활성화 시) 인코딩/FAISS 검색/문서 조회 등 단계별 소요 시간
+
+        ?format=prometheus이면 Prometheus 텍스트 형식으로 반환합니다.
+        """
+        batcher_stats = self.batcher.get_stats()
+        if request.query.get("format") == "prometheus":
+            return web.Response(
+                text=self.prometheus_metrics(batcher_stats),
+                content_type="text/plain",
+                headers={"X-Prometheus-Format": "0.0.4"},
+            )
+
+        query_cache = self.retriever.embedding_model.query_cache
+        metrics = {
+            "uptime_seconds": time.time() - self.started_at,
+            **batcher_stats,
+            "query_cache": (
+                query_cache.get_stats() if query_cache is not None else None
+            ),
+            "stages": tracing.get_stats() if tracing.is_enabled() else None,
+        }
+        return web.json_response(metrics, dumps=_dumps)
+
+    def prometheus_metrics(self, batcher_stats: Dict[str, Any]) -> str:
+        """
+        서버 카운터/게이지와 단계별 소요 시간 히스토그램을 Prometheus 텍스트로 만듭니다.
+
+        Args:
+            batcher_stats: MicroBatcher.get_stats() 결과
+
+        Returns:
+            Prometheus 텍스트 노출 형식 문자열
+        """
+        lines = []
+        for key in PROMETHEUS_COUNTERS:
+            lines.append(f"# TYPE kb_search_{key}_total counter")
+            lines.append(f"kb_search_{key}_total {batcher_stats[key]}")
+        lines.append("# TYPE kb_search_queue_depth gauge")
+        lines.append(f"kb_search_queue_depth {batcher_stats['queue_depth']['current']}")
+        return "\n".join(lines) + "\n" + tracing.prometheus_text()
+
+    async def handle_health(self, request: web.Request) -> web.Response:
+        """GET /health"""
+        return web.json_response(
+            {"status": "ok", "documents": self.retriever.vector_store.db.index.ntotal}
+        )
+
+    def create_app(self) -> web.Application:
+        """
+        검색 서비스 aiohttp 애플리케이션을 생성합니다.
+
+        Returns:
+            배치 작업의 시작/종료가 등록된 web.Application
+        """
+        app = web.Application()
+        app.router.add_get("/search", self.handle_search)
+        app.router.add_post("/search", self.handle_search)
+        app.router.add_get("/metrics", self.handle_metrics)
+        app.router.add_get("/health", self.handle_health)
+
+        async def start_batcher(_: web.Application) -> None:
+            await self.batcher.start()
+
+        async def stop_batcher(_: web.Application) -> None:
+            await self.batcher.stop()
+
+        app.on_startup.append(start_batcher)
+        app.on_cleanup.append(stop_batcher)
+        return app
+
+
+def load_serving_config(config_path: str) -> Dict[str, Any]:
+    """
+    설정 파일의 serving 항목을 기본값과 합쳐 반환합니다.
+
+    Args:
+        config_path: 모델 설정 파일 경로
+
+    Returns:
+        host, port, max_batch_size, max_wait_ms, max_queue_size, max_k, tracing
+    """
+    with open(config_path, "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f) or {}
+    return {**DEFAULT_SERVING_CONFIG, **(config.get("serving") or {})}
+
+
+def main() -> None:
+    """메인 실행 함수"""
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+
+    parser = argparse.ArgumentParser(description="지식베이스 로컬 검색 서버")
+    parser.add_argument(
+        "--vector_store_path",
+        type=str,
+        default="data/knowledge_base/korean_rag_reference",
+        help="FAISS 벡터 저장소 경로",
+    )
+    parser.add_argument(
+        "--config_path",
+        type=str,
+        default="config/model_config.yaml",
+        help="embedding, serving 설정을 읽을 모델 설정 파일 경로",
+    )
+    parser.add_argument(
+        "--model_name",
+        type=str,
+        default=None,
+        help="임베딩 모델 이름 (기본값: 지식베이스 index.json에 기록된 구축 모델, "
+        "기록이 없으면 파이프라인 기본 모델)",
+    )
+    parser.add_argument("--host", type=str, default=None, help="바인딩 주소")
+    parser.add_argument("--port", type=int, default=None, help="포트")
+    parser.add_argument(
+        "--max_batch_size", type=int, default=None, help="한 번에 처리할 최대 요청 수"
+    )
+    parser.add_argument(
+        "--max_wait_ms",
+        type=float,
+        default=None,
+        help="첫 요청 도착 후 배치를 모으기 위해 기다리는 최대 시간(밀리초)",
+    )
+    parser.add_argument(
+        "--max_queue_size",
+        type=int,
+        default=None,
+        help="대기할 수 있는 최대 요청 수 (초과 시 503 응답)",
+    )
+    parser.add_argument(
+        "--tracing",
+        action="store_true",
+        default=None,
+        help="단계별 소요 시간 히스토그램을 기록하여 /metrics에 포함",
+    )
+    args = parser.parse_args()
+
+    # 명령행 인자가 설정 파일보다 우선
+    serving_config = load_serving_config(args.config_path)
+    for key in DEFAULT_SERVING_CONFIG:
+        value = getattr(args, key, None)
+        if value is not None:
+            serving_config[key] = value
+
+    if serving_config["tracing"]:
+        tracing.enable()
+
+    # 지식베이스를 구축한 모델로 검색해야 하므로 설정 파일의 embedding.model_name을
+    # 사용하지 않음 (다른 모델이 지정되면 로드 시 ValueError)
+    model_name = (
+        args.model_name
+        or FAISSVectorStore.saved_model_name(args.vector_store_path)
+        or DEFAULT_MODEL_NAME
+    )
+    embedding_model = SentenceTransformersEmbedding.from_config(
+        args.config_path, model_name=model_name
+    )
+    retriever = VectorStoreRetriever(
+        vector_store_path=args.vector_store_path, embedding_model=embedding_model
+    )
+    # 첫 요청이 모델 로딩 시간을 기다리지 않도록 시작 시 로드
+    logging.info(f"임베딩 모델 준비 완료 ({embedding_model.warmup():.2f}초)")
+
+    service = SearchService(
+        retriever,
+        max_batch_size=serving_config["max_batch_size"],
+        max_wait_ms=serving_config["max_wait_ms"],
+        max_queue_size=serving_config["max_queue_size"],
+        max_k=serving_config["max_k"],
+    )
+    logging.info(
+        f"검색 서버 시작: http://{serving_config['host']}:{serving_config['port']} "
+        f"(최대 배치 {serving_config['max_batch_size']}개, "
+        f"최대 대기 {serving_config['max_wait_ms']}ms)"
+    )
+    try:
+        web.run_app(
+            service.create_app(),
+            host=serving_config["host"],
+            port=serving_config["port"],
+            print=None,
+        )
+    finally:
+        embedding_model.close()
+
+
+if __name__ == "__main__":
+    main()
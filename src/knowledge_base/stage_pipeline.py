@@ -0,0 +1,241 @@
+"""
+Stage Pipeline
+크기가 제한된 큐로 연결된 단계들을 동시에 실행하는 스트리밍 처리기
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+# 단계 변환 함수: 이전 단계 출력 이터레이터를 받아 출력 이터러블을 반환
+StageFunction = Callable[[Iterator[Any]], Iterable[Any]]
+
+_DONE = object()
+# 중단 여부를 확인하는 큐 대기 간격(초)
+_POLL_SECONDS = 0.1
+
+
+class _Stopped(Exception):
+    """다른 단계의 실패로 파이프라인이 중단되었음을 알리는 내부 예외"""
+
+
+class _Failure:
+    """이전 단계에서 발생한 예외를 다음 단계로 전달하는 큐 항목"""
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+@dataclass
+class StageStats:
+    """
+    단계별 처리량 통계
+
+    input_wait는 이전 단계의 출력을 기다린 시간(상류 병목), output_wait는 다음
+    단계의 큐가 가득 차 기다린 시간(역압)이며, 나머지가 실제 처리 시간입니다.
+    """
+
+    name: str
+    items: int = 0
+    elapsed: float = 0.0
+    input_wait: float = 0.0
+    output_wait: float = 0.0
+
+    @property
+    def busy(self) -> float:
+        """큐 대기를 제외한 처리 시간(초)"""
+        return max(self.elapsed - self.input_wait - self.output_wait, 0.0)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """통계를 dict로 반환합니다."""
+        return {
+            "items": self.items,
+            "busy_seconds": self.busy,
+            "items_per_second": self.items / self.busy if self.busy else None,
+            "input_wait_seconds": self.input_wait,
+            "output_wait_seconds": self.output_wait,
+        }
+
+
+class StagePipeline:
+    """
+    단계 파이프라인 실행기
+
+    각 단계는 별도 스레드에서 실행되고, 단계 사이는 크기가 queue_size로 제한된
+    큐로 연결됩니다. 다음 단계가 느리면 큐가 가득 차 이전 단계가 대기하므로(역압)
+    메모리 사용량이 큐 크기로 제한되며, 전체 소요 시간은 단계별 시간의 합이 아니라
+    가장 느린 단계의 시간에 가까워집니다. 마지막 단계는 호출한 스레드에서 실행됩니다.
+
+    어느 단계에서든 예외가 발생하면 나머지 단계를 중단하고 run()에서 같은 예외를
+    다시 발생시킵니다.
+    """
+
+    def __init__(self, queue_size: int = 4):
+        """
+        Args:
+            queue_size: 단계 사이 큐에 보관할 최대 항목 수
+        """
+        if queue_size <= 0:
+            raise ValueError("queue_size는 1 이상이어야 합니다.")
+        self.queue_size = queue_size
+        self.stats: List[StageStats] = []
+        self.wall_seconds = 0.0
+        self._stop = threading.Event()
+
+    def run(
+        self,
+        source: Iterable[Any],
+        stages: Sequence[Sequence[Any]],
+        source_name: str = "source",
+    ) -> List[Any]:
+        """
+        원본 이터러블을 단계 순서대로 처리합니다.
+
+        Args:
+            source: 첫 단계의 입력 (별도 스레드에서 순회)
+            stages: (단계명, 단계 변환 함수) 리스트
+            source_name: 원본 순회 단계의 이름
+
+        Returns:
+            마지막 단계의 출력 리스트
+        """
+        if not stages:
+            raise ValueError("단계가 비어있습니다.")
+
+        self._stop.clear()
+        self.stats = [StageStats(source_name)] + [
+            StageStats(name) for name, _ in stages
+        ]
+        start = time.perf_counter()
+
+        threads = []
+        upstream: Optional[queue.Queue] = None
+        for stats, function in zip(
+            self.stats[:-1], [None] + [function for _, function in stages[:-1]]
+        ):
+            output: queue.Queue = queue.Queue(maxsize=self.queue_size)
+            thread = threading.Thread(
+                target=self._run_stage,
+                args=(stats, function, upstream, source, output),
+                name=f"stage-{stats.name}",
+                daemon=True,
+            )
+            thread.start()
+            threads.append(thread)
+            upstream = output
+
+        # 마지막 단계는 현재 스레드에서 실행
+        last_stats, (_, last_function) = self.stats[-1], stages[-1]
+        results = []
+        last_start = time.perf_counter()
+        try:
+            for item in last_function(self._iter_queue(upstream, last_stats)):
+                last_stats.items += 1
+                results.append(item)
+        finally:
+            last_stats.elapsed = time.perf_counter() - last_start
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+            self.wall_seconds = time.perf_counter() - start
+
+        return results
+
+    def _run_stage(
+        self,
+        stats: StageStats,
+        function: Optional[StageFunction],
+        upstream: Optional[queue.Queue],
+        source: Iterable[Any],
+        output: queue.Queue,
+    ) -> None:
+        """작업 스레드에서 단계 하나를 실행하고 출력을 다음 큐에 넣습니다."""
+        start = time.perf_counter()
+        outputs: Iterable[Any] = ()
+        try:
+            outputs = (
+                source
+                if function is None
+                else function(self._iter_queue(upstream, stats))
+            )
+            for item in outputs:
+                stats.items += 1
+                wait_start = time.perf_counter()
+                self._put(output, item)
+                stats.output_wait += time.perf_counter() - wait_start
+            self._put(output, _DONE)
+        except _Stopped:
+            pass
+        except BaseException as e:
+            try:
+                self._put(output, _Failure(e))
+            except _Stopped:
+                pass
+        finally:
+            close = getattr(outputs, "close", None)
+            if close is not None:
+                close()
+            stats.elapsed = time.perf_counter() - start
+
+    def _iter_queue(self, upstream: queue.Queue, stats: StageStats) -> Iterator[Any]:
+        """이전 단계의 큐를 순회하며, 이전 단계의 예외는 그대로 다시 발생시킵니다."""
+        while True:
+            wait_start = time.perf_counter()
+            item = self._get(upstream)
+            stats.input_wait += time.perf_counter() - wait_start
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+
+    def _put(self, output: queue.Queue, item: Any) -> None:
+        """큐에 자리가 날 때까지 기다리며, 파이프라인이 중단되면 대기를 멈춥니다."""
+        while True:
+            if self._stop.is_set():
+                raise _Stopped()
+            try:
+                output.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                continue
+
+    def _get(self, upstream: queue.Queue) -> Any:
+        """큐에 항목이 들어올 때까지 기다리며, 파이프라인이 중단되면 대기를 멈춥니다."""
+        while True:
+            if self._stop.is_set():
+                raise _Stopped()
+            try:
+                return upstream.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        마지막 실행의 단계별 통계를 반환합니다.
+
+        Returns:
+            전체 소요 시간, 처리 시간이 가장 긴 단계(병목), 단계별 통계
+        """
+        bottleneck = max(self.stats, key=lambda s: s.busy, default=None)
+        return {
+            "wall_seconds": self.wall_seconds,
+            "bottleneck": bottleneck.name if bottleneck else None,
+            "stages": {stats.name: stats.as_dict() for stats in self.stats},
+        }
+
+    def log_stats(self) -> None:
+        """마지막 실행의 단계별 통계를 로그로 남깁니다."""
+        for stats in self.stats:
+            rate = f"{stats.items / stats.busy:.1f}개/초" if stats.busy else "-"
+            logging.info(
+                f"[{stats.name}] {stats.items}개, 처리 {stats.busy:.2f}초 ({rate}), "
+                f"입력 대기 {stats.input_wait:.2f}초, 출력 대기 {stats.output_wait:.2f}초"
+            )
+        logging.info(
+            f"파이프라인 소요 시간: {self.wall_seconds:.2f}초 "
+            f"(병목 단계: {self.get_stats()['bottleneck']})"
+        )
@@ -0,0 +1,295 @@
+"""
+BM25 Index
+형태소 분석기 없이 문자 n-gram(또는 자모 n-gram)으로 동작하는 희소 역색인
+"""
+
+import json
+import os
+import re
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.documents import Document
+
+from ..tracing import traced
+
+ANALYZERS = ("char", "jamo")
+
+
+class BM25Index:
+    """
+    문자 n-gram 기반 BM25 역색인
+
+    한국어 어절의 표면형(예: '오똑한', '외출 시에는')을 그대로 매칭할 수 있도록
+    공백을 포함한 문자 n-gram을 색인어로 사용합니다. 포스팅은 정수 배열(CSR 형식)로
+    저장하고, 문서 길이에 따른 BM25 가중치를 구축 시점에 미리 계산하여
+    검색 시에는 포스팅 가중치의 합산(np.bincount)만 수행합니다.
+
+    문서 번호는 색인 구축 시 입력 순서이며, 벡터 저장소의 FAISS 인덱스 위치와
+    같은 순서로 구축하여 사용합니다.
+    """
+
+    VOCAB_FILE = "bm25_vocab.json"
+    ARRAYS_FILE = "bm25_index.npz"
+
+    def __init__(
+        self,
+        analyzer: str = "char",
+        ngram_range: Tuple[int, int] = (2, 3),
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        """
+        BM25 색인 초기화
+
+        Args:
+            analyzer: 색인어 단위 ("char": 음절, "jamo": 자모)
+            ngram_range: n-gram 길이 범위 (최소, 최대)
+            k1: BM25 단어 빈도 포화 파라미터
+            b: BM25 문서 길이 정규화 파라미터
+        """
+        if analyzer not in ANALYZERS:
+            raise ValueError(
+                f"지원하지 않는 분석기입니다: {analyzer} (지원: {ANALYZERS})"
+            )
+        if not 1 <= ngram_range[0] <= ngram_range[1]:
+            raise ValueError(f"잘못된 n-gram 범위입니다: {ngram_range}")
+
+        self.analyzer = analyzer
+        self.ngram_range = tuple(ngram_range)
+        self.k1 = k1
+        self.b = b
+
+        self.vocab: Dict[str, int] = {}
+        self.num_docs = 0
+        # CSR 형식 포스팅: 색인어 t의 포스팅은 offsets[t]:offsets[t + 1]
+        self.postings_offsets = np.zeros(1, dtype=np.int64)
+        self.postings_docs = np.zeros(0, dtype=np.int32)
+        self.postings_weights = np.zeros(0, dtype=np.float32)
+
+    def tokenize(self, text: str) -> List[str]:
+        """
+        텍스트를 n-gram 색인어로 분리합니다.
+
+        Args:
+            text: 원본 텍스트
+
+        Returns:
+            n-gram 색인어 리스트 (중복 포함)
+        """
+        text = re.sub(r"\s+", " ", text.lower()).strip()
+        if self.analyzer == "jamo":
+            # 한글 음절을 초성/중성/종성 자모로 분해
+            text = unicodedata.normalize("NFD", text)
+
+        min_n, max_n = self.ngram_range
+        tokens = []
+        for n in range(min_n, max_n + 1):
+            for i in range(len(text) - n + 1):
+                gram = text[i : i + n]
+                if not gram.isspace():
+                    tokens.append(gram)
+        return tokens
+
+    @classmethod
+    def build(cls, texts: Iterable[str], **kwargs) -> "BM25Index":
+        """
+        텍스트 목록으로 BM25 색인을 구축합니다.
+
+        Args:
+            texts: 색인할 텍스트 (입력 순서가 문서 번호)
+            **kwargs: BM25Index 생성자 인자
+
+        Returns:
+            구축된 BM25Index
+        """
+        index = cls(**kwargs)
+
+        term_ids: List[np.ndarray] = []
+        term_counts: List[np.ndarray] = []
+        doc_lengths = []
+        for text in texts:
+            counts = Counter(index.tokenize(text))
+            ids = [index.vocab.setdefault(term, len(index.vocab)) for term in counts]
+            term_ids.append(np.asarray(ids, dtype=np.int64))
+            term_counts.append(np.fromiter(counts.values(), dtype=np.float32))
+            doc_lengths.append(sum(counts.values()))
+
+        index.num_docs = len(doc_lengths)
+        if index.num_docs == 0:
+            return index
+
+        lengths = np.asarray(doc_lengths, dtype=np.float32)
+        docs = np.repeat(
+            np.arange(index.num_docs, dtype=np.int32), [len(t) for t in term_ids]
+        )
+        terms = np.concatenate(term_ids)
+        tf = np.concatenate(term_counts)
+
+        # 색인어 순으로 정렬하여 CSR 포스팅 구성 (같은 색인어 안에서는 문서 순)
+        order = np.lexsort((docs, terms))
+        terms, docs, tf = terms[order], docs[order], tf[order]
+        doc_freq = np.bincount(terms, minlength=len(index.vocab))
+
+        idf = np.log1p((index.num_docs - doc_freq + 0.5) / (doc_freq + 0.5)).astype(
+            np.float32
+        )
+        avg_length = max(float(lengths.mean()), 1.0)
+        norm = index.k1 * (1 - index.b + index.b * lengths[docs] / avg_length)
+
+        index.postings_offsets = np.concatenate(([0], np.cumsum(doc_freq))).astype(
+            np.int64
+        )
+        index.postings_docs = docs
+        index.postings_weights = (
+            idf[terms] * tf * (index.k1 + 1) / (tf + norm)
+        ).astype(np.float32)
+        return index
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[Document], **kwargs) -> "BM25Index":
+        """
+        청크 문서 목록으로 BM25 색인을 구축합니다. 조항 제목도 함께 색인합니다.
+
+        Args:
+            documents: 색인할 문서 (입력 순서가 문서 번호)
+            **kwargs: BM25Index 생성자 인자
+
+        Returns:
+            구축된 BM25Index
+        """
+        return cls.build(
+            (
+                f"{doc.metadata.get('title', '')}\n{doc.page_content}"
+                for doc in documents
+            ),
+            **kwargs,
+        )
+
+    def get_scores(self, query: str) -> np.ndarray:
+        """
+        모든 문서에 대한 쿼리의 BM25 점수를 계산합니다.
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            문서별 BM25 점수 배열 (shape: [num_docs])
+        """
+        query_terms = Counter(
+            self.vocab[term] for term in self.tokenize(query) if term in self.vocab
+        )
+        if not query_terms:
+            return np.zeros(self.num_docs, dtype=np.float32)
+
+        term_ids = np.fromiter(query_terms.keys(), dtype=np.int64)
+        query_tf = np.fromiter(query_terms.values(), dtype=np.float32)
+        starts = self.postings_offsets[term_ids]
+        ends = self.postings_offsets[term_ids + 1]
+
+        # 쿼리 색인어들의 포스팅 구간을 한 번에 모아 문서별로 합산
+        lengths = ends - starts
+        positions = np.repeat(ends - np.cumsum(lengths), lengths) + np.arange(
+            lengths.sum()
+        )
+        weights = self.postings_weights[positions] * np.repeat(query_tf, lengths)
+        return np.bincount(
+            self.postings_docs[positions], weights=weights, minlength=self.num_docs
+        ).astype(np.float32)
+
+    @traced("bm25.search")
+    def search(
+        self, query: str, k: int = 10, mask: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        BM25 점수 상위 k개 문서를 검색합니다.
+
+        Args:
+            query: 검색 쿼리
+            k: 반환할 문서 수
+            mask: 문서 번호별 선택 여부 (선택사항, 선택된 문서 중에서만 상위 k개를 검색)
+
+        Returns:
+            (점수 배열, 문서 번호 배열) - 점수 내림차순, 점수가 0인 문서는 제외
+        """
+        scores = self.get_scores(query)
+        if mask is not None:
+            scores[~mask] = 0
+        k = min(k, self.num_docs)
+        if k == 0:
+            return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.int64)
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        top = top[scores[top] > 0]
+        return scores[top], top
+
+    @classmethod
+    def exists(cls, path: str) -> bool:
+        """
+        경로에 저장된 BM25 색인이 있는지 확인합니다.
+
+        Args:
+            path: 색인 디렉토리 경로
+        """
+        return os.path.exists(os.path.join(path, cls.ARRAYS_FILE))
+
+    def save(self, path: str) -> None:
+        """
+        BM25 색인을 디렉토리에 저장합니다.
+
+        Args:
+            path: 저장할 디렉토리 경로
+        """
+        os.makedirs(path, exist_ok=True)
+        terms = sorted(self.vocab, key=self.vocab.__getitem__)
+        with open(os.path.join(path, self.VOCAB_FILE), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "analyzer": self.analyzer,
+                    "ngram_range": list(self.ngram_range),
+                    "k1": self.k1,
+                    "b": self.b,
+                    "num_docs": self.num_docs,
+                    "terms": terms,
+                },
+                f,
+                ensure_ascii=False,
+            )
+        np.savez(
+            os.path.join(path, self.ARRAYS_FILE),
+            postings_offsets=self.postings_offsets,
+            postings_docs=self.postings_docs,
+            postings_weights=self.postings_weights,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "BM25Index":
+        """
+        저장된 BM25 색인을 로드합니다.
+
+        Args:
+            path: 색인 디렉토리 경로
+
+        Returns:
+            로드된 BM25Index
+        """
+        with open(os.path.join(path, cls.VOCAB_FILE), "r", encoding="utf-8") as f:
+            config = json.load(f)
+
+        index = cls(
+            analyzer=config["analyzer"],
+            ngram_range=tuple(config["ngram_range"]),
+            k1=config["k1"],
+            b=config["b"],
+        )
+        index.num_docs = config["num_docs"]
+        index.vocab = {term: i for i, term in enumerate(config["terms"])}
+
+        with np.load(os.path.join(path, cls.ARRAYS_FILE)) as arrays:
+            index.postings_offsets = arrays["postings_offsets"]
+            index.postings_docs = arrays["postings_docs"]
+            index.postings_weights = arrays["postings_weights"]
+        return index
@@ -0,0 +1,313 @@
+"""
+Chunk Store
+청크 텍스트와 메타데이터를 컬럼 단위로 저장하고 메모리 매핑으로 조회하는 문서 저장소
+"""
+
+import json
+import mmap
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from langchain_community.docstore.base import AddableMixin, Docstore
+from langchain_core.documents import Document
+
+from ..tracing import traced
+
+# 문자열 컬럼 (id는 LangChain 문서 ID, extra는 기타 메타데이터의 JSON)
+STRING_COLUMNS = ("id", "page_content", "title", "chunk_id", "source", "extra")
+# 전용 컬럼으로 저장되는 메타데이터 키와 존재 여부 플래그 비트
+METADATA_FLAGS = {"title": 1, "page": 2, "chunk_id": 4, "source": 8}
+
+ROW_DTYPE = np.dtype([("page", "<i8"), ("flags", "u1")])
+
+
+class ChunkStore(Docstore, AddableMixin):
+    """
+    메모리 매핑 기반 컬럼형 청크 저장소
+
+    청크 텍스트와 메타데이터(title, page, chunk_id, source)를 다음 파일로 저장합니다.
+
+    - chunks.bin: 모든 문자열 컬럼의 UTF-8 바이트 (컬럼 순서대로 연속 배치)
+    - chunks_offsets.npy: 컬럼별 행 시작 오프셋 (shape: [컬럼 수, 행 수 + 1])
+    - chunks_rows.npy: 행별 page 값과 메타데이터 존재 플래그
+    - chunks.json: 저장 형식 정보
+
+    로드 시에는 파일을 메모리 매핑만 하고, Document 객체는 조회된 행에 대해서만
+    생성합니다. 로드 이후 추가된 문서는 메모리에 보관되며 저장 시 함께 기록됩니다.
+    """
+
+    FORMAT_VERSION = 1
+    DATA_FILE = "chunks.bin"
+    OFFSETS_FILE = "chunks_offsets.npy"
+    ROWS_FILE = "chunks_rows.npy"
+    MANIFEST_FILE = "chunks.json"
+
+    def __init__(self) -> None:
+        """빈 청크 저장소를 생성합니다. 저장된 파일은 open()으로 엽니다."""
+        self._data: Union[mmap.mmap, bytes] = b""
+        self._offsets = np.zeros((len(STRING_COLUMNS), 1), dtype=np.int64)
+        self._rows = np.zeros(0, dtype=ROW_DTYPE)
+        self._row_by_id: Dict[str, int] = {}
+        self._added: Dict[str, Document] = {}
+        self._deleted: set = set()
+
+    @classmethod
+    def exists(cls, path: str) -> bool:
+        """
+        경로에 저장된 청크 저장소가 있는지 확인합니다.
+
+        Args:
+            path: 저장소 디렉토리 경로
+        """
+        return os.path.exists(os.path.join(path, cls.MANIFEST_FILE))
+
+    @classmethod
+    def open(cls, path: str) -> "ChunkStore":
+        """
+        저장된 청크 저장소를 메모리 매핑으로 엽니다.
+
+        Args:
+            path: 저장소 디렉토리 경로
+
+        Returns:
+            ChunkStore 인스턴스
+        """
+        with open(os.path.join(path, cls.MANIFEST_FILE), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("format_version") != cls.FORMAT_VERSION:
+            raise ValueError(
+                f"지원하지 않는 청크 저장소 형식입니다: {manifest.get('format_version')}"
+            )
+        if tuple(manifest.get("columns", ())) != STRING_COLUMNS:
+            raise ValueError(f"청크 저장소 컬럼이 일치하지 않습니다: {path}")
+
+        store = cls()
+        store._offsets = np.load(os.path.join(path, cls.OFFSETS_FILE), mmap_mode="r")
+        store._rows = np.load(os.path.join(path, cls.ROWS_FILE), mmap_mode="r")
+
+        data_file = os.path.join(path, cls.DATA_FILE)
+        if os.path.getsize(data_file) > 0:
+            with open(data_file, "rb") as f:
+                store._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(store._rows) != manifest["count"]:
+            raise ValueError(f"청크 저장소가 손상되었습니다: {path}")
+
+        store._row_by_id = {
+            store._read_string(0, row): row for row in range(len(store._rows))
+        }
+        return store
+
+    @classmethod
+    def write(cls, path: str, documents: Sequence[Tuple[str, Document]]) -> None:
+        """
+        (문서 ID, 문서) 목록을 청크 저장소 파일로 기록합니다.
+
+        Args:
+            path: 저장소 디렉토리 경로
+            documents: 행 순서대로 정렬된 (문서 ID, 문서) 리스트
+        """
+        os.makedirs(path, exist_ok=True)
+        num_rows = len(documents)
+
+        columns: List[List[bytes]] = [[] for _ in STRING_COLUMNS]
+        rows = np.zeros(num_rows, dtype=ROW_DTYPE)
+        for row, (doc_id, doc) in enumerate(documents):
+            values, page, flags = cls._encode_row(doc_id, doc)
+            for column, value in zip(columns, values):
+                column.append(value)
+            rows[row] = (page, flags)
+
+        offsets = np.zeros((len(STRING_COLUMNS), num_rows + 1), dtype=np.int64)
+        position = 0
+        for col, values in enumerate(columns):
+            offsets[col, 0] = position
+            if values:
+                lengths = np.fromiter((len(v) for v in values), dtype=np.int64)
+                offsets[col, 1:] = position + np.cumsum(lengths)
+                position = int(offsets[col, -1])
+            else:
+                offsets[col, 1:] = position
+
+        # 임시 파일에 기록한 뒤 교체하며, 형식 정보 파일을 마지막에 교체
+        cls._replace(
+            path,
+            cls.DATA_FILE,
+            lambda f: f.writelines(value for column in columns for value in column),
+        )
+        cls._replace(path, cls.OFFSETS_FILE, lambda f: np.save(f, offsets))
+        cls._replace(path, cls.ROWS_FILE, lambda f: np.save(f, rows))
+        manifest = {
+            "format_version": cls.FORMAT_VERSION,
+            "count": num_rows,
+            "columns": list(STRING_COLUMNS),
+        }
+        cls._replace(
+            path,
+            cls.MANIFEST_FILE,
+            lambda f: f.write(json.dumps(manifest, ensure_ascii=False).encode("utf-8")),
+        )
+
+    @staticmethod
+    def _replace(path: str, file_name: str, writer: Any) -> None:
+        """임시 파일에 기록한 뒤 원래 파일과 교체합니다."""
+        target = os.path.join(path, file_name)
+        with open(target + ".tmp", "wb") as f:
+            writer(f)
+        os.replace(target + ".tmp", target)
+
+    @staticmethod
+    def _encode_row(doc_id: str, doc: Document) -> Tuple[List[bytes], int, int]:
+        """문서 하나를 문자열 컬럼 값, page 값, 플래그로 변환합니다."""
+        metadata = dict(doc.metadata)
+        flags = 0
+        strings = {}
+        for key in ("title", "chunk_id", "source"):
+            if isinstance(metadata.get(key), str):
+                strings[key] = metadata.pop(key)
+                flags |= METADATA_FLAGS[key]
+
+        page = -1
+        value = metadata.get("page")
+        if isinstance(value, int) and not isinstance(value, bool):
+            page = metadata.pop("page")
+            flags |= METADATA_FLAGS["page"]
+
+        extra = json.dumps(metadata, ensure_ascii=False) if metadata else ""
+        values = [
+            doc_id,
+            doc.page_content,
+            strings.get("title", ""),
+            strings.get("chunk_id", ""),
+            strings.get("source", ""),
+            extra,
+        ]
+        return [v.encode("utf-8") for v in values], page, flags
+
+    def _read_string(self, col: int, row: int) -> str:
+        """매핑된 파일에서 문자열 컬럼 값 하나를 읽습니다."""
+        start = int(self._offsets[col, row])
+        end = int(self._offsets[col, row + 1])
+        return self._data[start:end].decode("utf-8")
+
+    def _read_row(self, row: int) -> Document:
+        """매핑된 파일의 한 행으로 Document를 생성합니다."""
+        doc_id, page_content, title, chunk_id, source, extra = (
+            self._read_string(col, row) for col in range(len(STRING_COLUMNS))
+        )
+        page, flags = self._rows[row]
+
+        values = {
+            "title": title,
+            "page": int(page),
+            "chunk_id": chunk_id,
+            "source": source,
+        }
+        metadata: Dict[str, Any] = {
+            key: values[key] for key, flag in METADATA_FLAGS.items() if flags & flag
+        }
+        if extra:
+            metadata.update(json.loads(extra))
+
+        return Document(id=doc_id, page_content=page_content, metadata=metadata)
+
+    def read_metadata_values(self, ids: Sequence[str], key: str) -> List[Any]:
+        """
+        여러 문서의 메타데이터 값 하나를 Document 생성 없이 읽습니다.
+
+        Args:
+            ids: 문서 ID 리스트
+            key: 메타데이터 키
+
+        Returns:
+            ID 순서대로의 메타데이터 값 (없으면 None)
+        """
+        values = []
+        if key not in METADATA_FLAGS:
+            # 기타 메타데이터(page_start 등)는 extra 컬럼의 JSON만 읽음
+            extra_col = STRING_COLUMNS.index("extra")
+            for doc_id in ids:
+                if doc_id in self._added:
+                    values.append(self._added[doc_id].metadata.get(key))
+                    continue
+                extra = self._read_string(extra_col, self._row_by_id[doc_id])
+                values.append(json.loads(extra).get(key) if extra else None)
+            return values
+
+        col = STRING_COLUMNS.index(key) if key != "page" else None
+        flag = METADATA_FLAGS[key]
+        for doc_id in ids:
+            if doc_id in self._added:
+                values.append(self._added[doc_id].metadata.get(key))
+                continue
+            row = self._row_by_id[doc_id]
+            page, flags = self._rows[row]
+            if not flags & flag:
+                values.append(None)
+            elif col is None:
+                values.append(int(page))
+            else:
+                values.append(self._read_string(col, row))
+        return values
+
+    @property
+    def ids(self) -> List[str]:
+        """저장된 행 순서대로의 문서 ID (로드 이후 추가된 문서 포함)"""
+        stored = sorted(self._row_by_id, key=self._row_by_id.__getitem__)
+        return [doc_id for doc_id in stored if doc_id not in self._deleted] + list(
+            self._added
+        )
+
+    @traced("chunk_store.lookup")
+    def search(self, search: str) -> Union[str, Document]:
+        """
+        문서 ID로 문서를 조회합니다.
+
+        Args:
+            search: 조회할 문서 ID
+
+        Returns:
+            Document (없으면 오류 메시지 문자열)
+        """
+        if search in self._added:
+            return self._added[search]
+        row: Optional[int] = self._row_by_id.get(search)
+        if row is None or search in self._deleted:
+            return f"ID {search} not found."
+        return self._read_row(row)
+
+    def add(self, texts: Dict[str, Document]) -> None:
+        """
+        문서를 추가합니다. 추가된 문서는 다음 저장 시 파일에 기록됩니다.
+
+        Args:
+            texts: 문서 ID -> 문서 dict
+        """
+        overlapping = {
+            doc_id
+            for doc_id in texts
+            if doc_id in self._added
+            or (doc_id in self._row_by_id and doc_id not in self._deleted)
+        }
+        if overlapping:
+            raise ValueError(f"이미 존재하는 문서 ID입니다: {overlapping}")
+        self._added.update(texts)
+
+    def delete(self, ids: List) -> None:
+        """
+        문서를 삭제합니다.
+
+        Args:
+            ids: 삭제할 문서 ID 리스트
+        """
+        for doc_id in ids:
+            if doc_id in self._added:
+                del self._added[doc_id]
+            elif doc_id in self._row_by_id and doc_id not in self._deleted:
+                self._deleted.add(doc_id)
+            else:
+                raise ValueError(f"존재하지 않는 문서 ID입니다: {doc_id}")
+
+    def __len__(self) -> int:
+        return len(self._row_by_id) - len(self._deleted) + len(self._added)
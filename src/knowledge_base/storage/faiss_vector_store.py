@@ -1,11 +1,44 @@
-from typing import List
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import faiss
+import numpy as np
+import yaml
 from langchain_community.docstore import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain_core.documents import Document
 
 from ..embedding.sentence_transformers_embedding import SentenceTransformersEmbedding
+from ..tracing import traced
+from .chunk_store import ChunkStore
+from .metadata_index import MetadataFilter, MetadataIndex
+
+INDEX_TYPES = ("flat", "ivf_flat", "ivf_pq", "hnsw")
+
+# cosine: 저장/검색 시 벡터를 L2 정규화한 뒤 내적으로 비교 (점수 = 코사인 유사도)
+METRICS = ("l2", "cosine", "inner_product")
+
+DEFAULT_INDEX_PARAMS: Dict[str, int] = {
+    # IVF 계열
+    "nlist": 100,
+    "nprobe": 10,
+    # Product Quantization
+    "pq_m": 16,
+    "pq_nbits": 8,
+    # HNSW
+    "hnsw_m": 32,
+    "ef_construction": 200,
+    "ef_search": 64,
+    # 메타데이터 필터로 선택된 위치 수가 이 값 이하이면 선택된 벡터만 완전 탐색
+    # (flat/hnsw, 그 외에는 ID 선택자로 인덱스 검색 중에 제외)
+    "filter_exact_max": 4096,
+}
+# 메타데이터 필터 색인에 읽어 둘 메타데이터 키
+FILTER_METADATA_KEYS = ("source", "title", "chunk_id", "page", "page_start", "page_end")
 
 
 class FAISSVectorStore:
@@ -13,52 +46,744 @@ class FAISSVectorStore:
     FAISS 기반 벡터 저장소
 
     SentenceTransformersEmbedding과 연동하여 문서를 저장하고 관리합니다.
+    index_type으로 완전 탐색(flat) 또는 근사 탐색(ivf_flat, ivf_pq, hnsw)
+    인덱스를, metric으로 L2 거리 또는 코사인/내적 유사도를 선택할 수 있습니다.
     """
 
-    def __init__(self, embedding_model: SentenceTransformersEmbedding):
+    INDEX_FILE = "index.faiss"
+    CONFIG_FILE = "index.json"
+
+    def __init__(
+        self,
+        embedding_model: SentenceTransformersEmbedding,
+        index_type: str = "flat",
+        index_params: Optional[Dict[str, Any]] = None,
+        metric: str = "l2",
+    ):
         """
         FAISS 벡터 저장소 초기화
 
         Args:
             embedding_model: SentenceTransformersEmbedding 인스턴스
+            index_type: 인덱스 종류 ("flat", "ivf_flat", "ivf_pq", "hnsw")
+            index_params: 인덱스 생성/검색 파라미터 (DEFAULT_INDEX_PARAMS 참고,
+                load() 시 저장된 값보다 우선)
+            metric: 유사도 척도 ("l2", "cosine", "inner_product")
         """
+        if index_type not in INDEX_TYPES:
+            raise ValueError(
+                f"지원하지 않는 인덱스 종류입니다: {index_type} (지원: {INDEX_TYPES})"
+            )
+        if metric not in METRICS:
+            raise ValueError(
+                f"지원하지 않는 유사도 척도입니다: {metric} (지원: {METRICS})"
+            )
+
         self.embedding_model = embedding_model
-        dimension_size = embedding_model.get_embedding_dim()
+        self.index_type = index_type
+        self.index_params = {**DEFAULT_INDEX_PARAMS, **(index_params or {})}
+        # load()가 저장된 파라미터로 덮어쓰지 않을 명시적 인자
+        self._explicit_index_params = dict(index_params or {})
+        self.metric = metric
 
-        self.db = FAISS(
-            embedding_function=embedding_model,
-            index=faiss.IndexFlatL2(dimension_size),
-            docstore=InMemoryDocstore(),
-            index_to_docstore_id={},
+        # 빈 인덱스는 임베딩 차원이 필요하므로 처음 사용할 때 생성 (load()는 바로 교체)
+        self._db: Optional[FAISS] = None
+        # 메타데이터 필터 색인 (처음 필터 검색할 때 생성, 문서가 바뀌면 다시 생성)
+        self._metadata_index: Optional[MetadataIndex] = None
+
+    @property
+    def db(self) -> FAISS:
+        """LangChain FAISS 래퍼 (빈 저장소는 처음 사용할 때 생성)"""
+        if self._db is None:
+            self._db = FAISS(
+                embedding_function=self.embedding_model,
+                index=self._create_index(),
+                docstore=InMemoryDocstore(),
+                index_to_docstore_id={},
+            )
+            self._configure_db_metric()
+        return self._db
+
+    @db.setter
+    def db(self, db: FAISS) -> None:
+        self._db = db
+        self._metadata_index = None
+
+    @property
+    def metadata_index(self) -> MetadataIndex:
+        """
+        메타데이터 필터 색인
+
+        청크 저장소의 메타데이터 컬럼을 인덱스 위치 순서로 한 번 읽어 생성하고,
+        문서가 추가/삭제/갱신되면 다음 필터 검색에서 다시 생성합니다.
+        """
+        if self._metadata_index is None:
+            self._metadata_index = MetadataIndex.from_values(
+                self.db.index.ntotal,
+                {key: self.get_metadata_values(key) for key in FILTER_METADATA_KEYS},
+            )
+        return self._metadata_index
+
+    @property
+    def higher_is_better(self) -> bool:
+        """점수가 클수록 유사한 척도(코사인/내적)인지 여부"""
+        return self.metric != "l2"
+
+    def passes_threshold(self, score: float, threshold: float) -> bool:
+        """
+        검색 점수가 임계값을 만족하는지 확인합니다.
+
+        Args:
+            score: 검색 점수 (L2 거리 또는 유사도)
+            threshold: 임계값 (L2는 최대 거리, 코사인/내적은 최소 유사도)
+
+        Returns:
+            임계값 만족 여부
+        """
+        return score >= threshold if self.higher_is_better else score <= threshold
+
+    def _faiss_metric(self) -> int:
+        """FAISS 인덱스에 사용할 척도 상수를 반환합니다."""
+        if self.metric == "l2":
+            return faiss.METRIC_L2
+        return faiss.METRIC_INNER_PRODUCT
+
+    def _configure_db_metric(self) -> None:
+        """
+        LangChain FAISS 래퍼의 쿼리 정규화 및 점수 해석 방식을 척도에 맞춥니다.
+
+        생성자 인자로 normalize_L2와 내적 척도를 함께 넘기면 LangChain이 불필요한
+        경고를 내므로, 생성 후 속성을 직접 설정합니다.
+        """
+        if self.metric == "l2":
+            self.db.distance_strategy = DistanceStrategy.EUCLIDEAN_DISTANCE
+        else:
+            self.db.distance_strategy = DistanceStrategy.MAX_INNER_PRODUCT
+        self.db._normalize_L2 = self.metric == "cosine"
+
+    def _prepare_vectors(self, embeddings: Any) -> np.ndarray:
+        """
+        임베딩을 float32 행렬로 변환하고, 코사인 척도이면 일괄 L2 정규화합니다.
+
+        Args:
+            embeddings: 임베딩 벡터 또는 행렬
+
+        Returns:
+            검색/저장에 사용할 float32 행렬
+        """
+        vectors = np.array(embeddings, dtype=np.float32)
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        if self.metric == "cosine":
+            faiss.normalize_L2(vectors)
+        return vectors
+
+    @classmethod
+    def from_config(
+        cls,
+        embedding_model: SentenceTransformersEmbedding,
+        config_path: str = "config/model_config.yaml",
+    ) -> "FAISSVectorStore":
+        """
+        설정 파일의 vector_db 항목으로 벡터 저장소를 생성합니다.
+
+        Args:
+            embedding_model: SentenceTransformersEmbedding 인스턴스
+            config_path: 모델 설정 파일 경로
+
+        Returns:
+            FAISSVectorStore 인스턴스
+        """
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+
+        vector_db_config = dict(config.get("vector_db", {}))
+        index_type = vector_db_config.pop("index_type", "flat")
+        metric = vector_db_config.pop("similarity_metric", "l2")
+        index_params = {
+            key: value
+            for key, value in vector_db_config.items()
+            if key in DEFAULT_INDEX_PARAMS
+        }
+        return cls(
+            embedding_model,
+            index_type=index_type,
+            index_params=index_params,
+            metric=metric,
         )
 
+    def _create_index(self, num_train: Optional[int] = None) -> faiss.Index:
+        """
+        설정된 종류의 FAISS 인덱스를 생성합니다.
+
+        Args:
+            num_train: 학습 벡터 수. 주어지면 nlist와 pq_nbits를
+                학습 가능한 범위로 줄입니다.
+
+        Returns:
+            생성된 FAISS 인덱스
+        """
+        dimension_size = self.embedding_model.get_embedding_dim()
+        params = self.index_params
+        metric = self._faiss_metric()
+
+        if self.index_type == "flat":
+            return faiss.IndexFlat(dimension_size, metric)
+
+        if self.index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(dimension_size, params["hnsw_m"], metric)
+            index.hnsw.efConstruction = params["ef_construction"]
+            index.hnsw.efSearch = params["ef_search"]
+            return index
+
+        # IVF 계열: 클러스터 수는 학습 벡터 수를 넘을 수 없음
+        nlist = params["nlist"]
+        if num_train is not None:
+            nlist = max(1, min(nlist, num_train))
+        quantizer = faiss.IndexFlat(dimension_size, metric)
+
+        if self.index_type == "ivf_flat":
+            index = faiss.IndexIVFFlat(quantizer, dimension_size, nlist, metric)
+        else:
+            pq_m = params["pq_m"]
+            if dimension_size % pq_m != 0:
+                raise ValueError(
+                    f"임베딩 차원({dimension_size})이 pq_m({pq_m})으로 "
+                    "나누어떨어지지 않습니다."
+                )
+            # PQ 코드북 크기(2^nbits)도 학습 벡터 수를 넘을 수 없음
+            pq_nbits = params["pq_nbits"]
+            while num_train is not None and pq_nbits > 1 and 2**pq_nbits > num_train:
+                pq_nbits -= 1
+            index = faiss.IndexIVFPQ(
+                quantizer, dimension_size, nlist, pq_m, pq_nbits, metric
+            )
+
+        index.nprobe = min(params["nprobe"], nlist)
+        return index
+
+    def set_search_params(
+        self, nprobe: Optional[int] = None, ef_search: Optional[int] = None
+    ) -> None:
+        """
+        검색 시점 파라미터를 변경합니다.
+
+        Args:
+            nprobe: IVF 인덱스에서 탐색할 클러스터 수
+            ef_search: HNSW 인덱스의 탐색 후보 리스트 크기
+        """
+        if nprobe is not None:
+            self.index_params["nprobe"] = nprobe
+        if ef_search is not None:
+            self.index_params["ef_search"] = ef_search
+        self._apply_search_params()
+
+    def _apply_search_params(self) -> None:
+        """현재 인덱스에 검색 시점 파라미터를 적용합니다."""
+        index = self.db.index
+        ivf_index = faiss.try_extract_index_ivf(index)
+        if ivf_index is not None:
+            ivf_index.nprobe = min(self.index_params["nprobe"], ivf_index.nlist)
+        if isinstance(index, faiss.IndexHNSW):
+            index.hnsw.efSearch = self.index_params["ef_search"]
+
+    def _train(self, embeddings: np.ndarray) -> None:
+        """
+        학습이 필요한 인덱스(IVF 계열)를 문서 임베딩으로 학습합니다.
+
+        Args:
+            embeddings: 학습에 사용할 임베딩 배열
+        """
+        logging.info(
+            f"FAISS 인덱스 학습 중: {self.index_type} (학습 벡터 {len(embeddings)}개)"
+        )
+        self.db.index = self._create_index(num_train=len(embeddings))
+        self.db.index.train(embeddings)
+        self._apply_search_params()
+
+    @traced("vector_store.add_documents")
     def add_documents(self, documents: List[Document]) -> None:
         """
         문서를 저장소에 추가합니다.
 
+        학습이 필요한 인덱스는 처음 추가되는 문서의 임베딩으로 학습합니다.
+
+        Args:
+            documents: 저장할 문서 리스트
+        """
+        if self.db.index.is_trained:
+            self.db.add_documents(documents)
+            self._metadata_index = None
+            return
+
+        texts = [doc.page_content for doc in documents]
+        self.add_embeddings(documents, self.embedding_model.embed_documents(texts))
+
+    @traced("vector_store.add_embeddings")
+    def add_embeddings(self, documents: List[Document], embeddings: Any) -> None:
+        """
+        미리 계산된 임베딩으로 문서를 저장소에 추가합니다.
+
+        학습이 필요한 인덱스는 처음 추가되는 임베딩으로 학습합니다.
+
         Args:
             documents: 저장할 문서 리스트
+            embeddings: 문서 순서대로의 임베딩 (shape: [len(documents), embedding_dim])
+        """
+        vectors = self._prepare_vectors(embeddings)
+        if len(vectors) != len(documents):
+            raise ValueError(
+                f"문서 수({len(documents)})와 임베딩 수({len(vectors)})가 다릅니다."
+            )
+        if not self.db.index.is_trained:
+            self._train(vectors)
+
+        ids = [doc.id for doc in documents]
+        self.db.add_embeddings(
+            list(zip([doc.page_content for doc in documents], vectors.tolist())),
+            metadatas=[doc.metadata for doc in documents],
+            ids=ids if any(ids) else None,
+        )
+        self._metadata_index = None
+
+    def remove_positions(self, positions: Iterable[int]) -> None:
+        """
+        인덱스 위치의 벡터와 문서를 삭제합니다.
+
+        남은 벡터는 기존 순서를 유지한 채 0부터 다시 번호가 매겨지므로 인덱스 위치와
+        청크 저장소 행 번호(및 BM25 문서 번호)의 대응 관계가 유지됩니다. flat 인덱스는
+        ID 선택자로 바로 삭제하고, 삭제 후 번호를 다시 매길 수 없는 근사 인덱스
+        (IVF, HNSW)는 남은 벡터를 복원하여 학습된 인덱스 사본에 다시 추가합니다.
+
+        Args:
+            positions: 삭제할 FAISS 인덱스 위치 목록
+        """
+        index = self.db.index
+        remove = np.unique(np.fromiter(positions, dtype=np.int64))
+        if len(remove) == 0:
+            return
+
+        keep = np.setdiff1d(np.arange(index.ntotal, dtype=np.int64), remove)
+        removed_ids = [self.db.index_to_docstore_id[int(i)] for i in remove]
+        kept_ids = [self.db.index_to_docstore_id[int(i)] for i in keep]
+
+        if isinstance(index, faiss.IndexFlat):
+            index.remove_ids(faiss.IDSelectorBatch(remove))
+        else:
+            ivf_index = faiss.try_extract_index_ivf(index)
+            if ivf_index is not None:
+                # IVF 인덱스는 위치로 벡터를 복원하려면 직접 매핑이 필요
+                ivf_index.make_direct_map()
+            vectors = (
+                index.reconstruct_batch(keep)
+                if len(keep)
+                else np.zeros((0, index.d), dtype=np.float32)
+            )
+
+            compacted = faiss.clone_index(index)
+            compacted.reset()
+            compacted_ivf = faiss.try_extract_index_ivf(compacted)
+            if compacted_ivf is not None:
+                compacted_ivf.set_direct_map_type(faiss.DirectMap.NoMap)
+            compacted.add(vectors)
+            self.db.index = compacted
+            self._apply_search_params()
+
+        self.db.docstore.delete(removed_ids)
+        self.db.index_to_docstore_id = dict(enumerate(kept_ids))
+        self._metadata_index = None
+        logging.info(f"벡터 삭제 완료: {len(remove)}개 (남은 벡터 {len(keep)}개)")
+
+    @traced("vector_store.update_documents")
+    def update_documents(self, documents: List[Document]) -> Dict[str, int]:
+        """
+        저장소를 주어진 문서 집합으로 갱신합니다.
+
+        문서 ID(doc.id)로 현재 저장소와 비교하여 새 문서만 임베딩하여 추가하고,
+        더 이상 없는 문서의 벡터는 삭제합니다. ID가 같은 문서는 벡터를 재사용하고
+        메타데이터(chunk_id, page 등)만 새 문서의 값으로 교체합니다.
+
+        Args:
+            documents: 문서 ID가 지정된 문서 리스트 (예: 내용 지문)
+
+        Returns:
+            유지(kept), 추가(added), 삭제(removed)된 문서 수
+        """
+        if any(not doc.id for doc in documents):
+            raise ValueError("문서 ID(doc.id)가 없는 문서가 있습니다.")
+        new_ids = {doc.id for doc in documents}
+        if len(new_ids) != len(documents):
+            raise ValueError("중복된 문서 ID가 있습니다.")
+
+        stale = [
+            position
+            for position, doc_id in self.db.index_to_docstore_id.items()
+            if doc_id not in new_ids
+        ]
+        self.remove_positions(stale)
+
+        existing = set(self.db.index_to_docstore_id.values())
+        kept = [doc for doc in documents if doc.id in existing]
+        added = [doc for doc in documents if doc.id not in existing]
+
+        if kept:
+            self.db.docstore.delete([doc.id for doc in kept])
+            self.db.docstore.add({doc.id: doc for doc in kept})
+            self._metadata_index = None
+        if added:
+            self.add_documents(added)
+
+        report = {"kept": len(kept), "added": len(added), "removed": len(stale)}
+        logging.info(f"벡터 저장소 갱신 완료: {report}")
+        return report
+
+    def evaluate_recall(self, queries: List[str], k: int = 10) -> Dict[str, Any]:
+        """
+        현재 인덱스의 검색 결과를 완전 탐색(flat) 결과와 비교하여 재현율을 측정합니다.
+
+        Args:
+            queries: 측정에 사용할 쿼리 리스트
+            k: 비교할 상위 문서 수
+
+        Returns:
+            인덱스 종류, recall@k, 쿼리당 평균 검색 시간(ms) 정보
         """
-        self.db.add_documents(documents)
+        if not queries:
+            raise ValueError("입력 쿼리 리스트가 비어있습니다.")
+
+        num_docs = self.db.index.ntotal
+        texts = [doc.page_content for doc in self.get_documents(range(num_docs))]
+        corpus = self._prepare_vectors(self.embedding_model.embed_documents(texts))
+        flat_index = faiss.IndexFlat(corpus.shape[1], self._faiss_metric())
+        flat_index.add(corpus)
+
+        query_embeddings = self._prepare_vectors(
+            self.embedding_model.embed_texts(queries, show_progress_bar=False)
+        )
+        k = min(k, num_docs)
+
+        start = time.perf_counter()
+        _, exact_ids = flat_index.search(query_embeddings, k)
+        flat_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        _, approx_ids = self.db.index.search(query_embeddings, k)
+        index_ms = (time.perf_counter() - start) * 1000
+
+        hits = sum(
+            len(set(exact_row) & set(approx_row))
+            for exact_row, approx_row in zip(exact_ids, approx_ids)
+        )
+        report = {
+            "index_type": self.index_type,
+            "k": k,
+            "recall": hits / (len(queries) * k),
+            "flat_ms_per_query": flat_ms / len(queries),
+            "index_ms_per_query": index_ms / len(queries),
+        }
+        logging.info(f"인덱스 재현율 측정 결과: {report}")
+        return report
+
+    @traced("vector_store.search_by_vectors")
+    def search_by_vectors(
+        self,
+        embeddings: np.ndarray,
+        k: int = 5,
+        filter: Optional[MetadataFilter] = None,
+    ) -> List[List[Tuple[Document, float]]]:
+        """
+        여러 쿼리 벡터를 한 번의 FAISS 검색으로 처리합니다.
+
+        Args:
+            embeddings: 쿼리 임베딩 행렬 (shape: [num_queries, embedding_dim])
+            k: 쿼리별 반환할 문서 수
+            filter: 메타데이터 필터 (MetadataIndex.compile() 참고, 모든 쿼리에 적용)
+
+        Returns:
+            쿼리별 (문서, 점수) 튜플 리스트 (L2는 거리, 코사인/내적은 유사도)
+        """
+        scores, indices = self.search_positions(embeddings, k=k, filter=filter)
+
+        results = []
+        for row_scores, row_indices in zip(scores, indices):
+            # 저장된 문서 수가 k보다 적으면 인덱스 위치가 -1로 채워짐
+            valid = row_indices != -1
+            docs = self.get_documents(row_indices[valid])
+            results.append(
+                [(doc, float(score)) for doc, score in zip(docs, row_scores[valid])]
+            )
+        return results
+
+    def filter_mask(self, filter: Optional[MetadataFilter]) -> Optional[np.ndarray]:
+        """
+        메타데이터 필터를 인덱스 위치별 선택 여부 비트맵으로 변환합니다.
+
+        Args:
+            filter: 메타데이터 필터 (예: {"title_prefix": "한글 맞춤법"},
+                {"source": [...], "page_range": (10, 20)})
+
+        Returns:
+            shape [ntotal]의 불리언 배열 (필터가 없으면 None)
+        """
+        if filter is None:
+            return None
+        return self.metadata_index.compile(filter)
+
+    @traced("vector_store.faiss_search")
+    def search_positions(
+        self,
+        embeddings: np.ndarray,
+        k: int = 5,
+        filter: Optional[MetadataFilter] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        쿼리 벡터로 FAISS 검색을 수행하고 인덱스 위치를 반환합니다.
+
+        필터가 주어지면 검색 후에 걸러내지 않고 검색 중에 선택된 위치만 후보로
+        사용합니다. flat 인덱스와 선택된 위치만 완전 탐색하는 경우에는 조건을 만족하는
+        문서가 k개 이상이면 항상 k개를 반환하며, HNSW는 ID 선택자 검색 결과가 모자란
+        쿼리만 선택된 위치의 완전 탐색으로 다시 검색합니다. IVF 계열은 nprobe개
+        클러스터 안의 선택된 문서만 후보이므로 k개보다 적게 반환될 수 있습니다.
+
+        Args:
+            embeddings: 쿼리 임베딩 (벡터 또는 행렬)
+            k: 쿼리별 반환할 위치 수
+            filter: 메타데이터 필터 (MetadataIndex.compile() 참고)
+
+        Returns:
+            (점수 행렬, 인덱스 위치 행렬) - shape: [num_queries, k]
+            (결과가 k개보다 적으면 위치 -1로 채움)
+        """
+        vectors = self._prepare_vectors(embeddings)
+        mask = self.filter_mask(filter)
+        if mask is None:
+            return self.db.index.search(vectors, k)
+
+        selected = np.flatnonzero(mask)
+        index = self.db.index
+        if len(selected) <= self.index_params["filter_exact_max"] and isinstance(
+            index, (faiss.IndexFlat, faiss.IndexHNSWFlat)
+        ):
+            return self._search_subset(vectors, selected, k)
+
+        # 선택된 위치의 비트맵을 ID 선택자로 넘겨 인덱스 검색 중에 나머지를 제외
+        selector = faiss.IDSelectorBitmap(np.packbits(mask, bitorder="little"))
+        if isinstance(index, faiss.IndexHNSW):
+            params = faiss.SearchParametersHNSW(
+                sel=selector, efSearch=self.index_params["ef_search"]
+            )
+        else:
+            ivf_index = faiss.try_extract_index_ivf(index)
+            if ivf_index is not None:
+                params = faiss.SearchParametersIVF(
+                    sel=selector, nprobe=ivf_index.nprobe
+                )
+            else:
+                params = faiss.SearchParameters(sel=selector)
+        scores, positions = index.search(vectors, k, params=params)
 
+        if isinstance(index, faiss.IndexHNSWFlat):
+            # efSearch 안에서 선택된 이웃을 충분히 찾지 못한 쿼리는 완전 탐색으로 보완
+            short = np.flatnonzero(
+                (positions != -1).sum(axis=1) < min(k, len(selected))
+            )
+            if len(short):
+                scores[short], positions[short] = self._search_subset(
+                    vectors[short], selected, k
+                )
+        return scores, positions
+
+    def _search_subset(
+        self, vectors: np.ndarray, selected: np.ndarray, k: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        선택된 위치의 벡터만 복원하여 완전 탐색합니다.
+
+        선택된 문서가 적으면 전체 인덱스를 선택자로 훑는 것보다 빠르고, HNSW에서
+        선택되지 않은 이웃 때문에 결과가 모자라거나 재현율이 떨어지지 않습니다.
+
+        Args:
+            vectors: 준비된 쿼리 벡터 행렬
+            selected: 선택된 인덱스 위치 배열 (오름차순)
+            k: 쿼리별 반환할 위치 수
+
+        Returns:
+            (점수 행렬, 인덱스 위치 행렬) - search_positions()와 같은 형식
+        """
+        num_queries = len(vectors)
+        fill = np.inf if self.metric == "l2" else -np.inf
+        scores = np.full((num_queries, k), fill, dtype=np.float32)
+        positions = np.full((num_queries, k), -1, dtype=np.int64)
+        if len(selected) == 0:
+            return scores, positions
+
+        subset = self.db.index.reconstruct_batch(selected)
+        found = min(k, len(selected))
+        subset_scores, subset_ids = faiss.knn(
+            vectors, subset, found, metric=self._faiss_metric()
+        )
+        scores[:, :found] = subset_scores
+        positions[:, :found] = selected[subset_ids]
+        return scores, positions
+
+    @traced("vector_store.get_documents")
+    def get_documents(self, positions: Iterable[int]) -> List[Document]:
+        """
+        FAISS 인덱스 위치에 해당하는 문서를 조회합니다.
+
+        Args:
+            positions: FAISS 인덱스 위치 목록
+
+        Returns:
+            위치 순서대로의 문서 리스트
+        """
+        documents = []
+        for i in positions:
+            _id = self.db.index_to_docstore_id[int(i)]
+            doc = self.db.docstore.search(_id)
+            if not isinstance(doc, Document):
+                raise ValueError(f"문서를 찾을 수 없습니다: {_id}")
+            documents.append(doc)
+        return documents
+
+    def get_metadata_values(self, key: str) -> List[Any]:
+        """
+        FAISS 인덱스 위치 순서대로 모든 문서의 메타데이터 값 하나를 조회합니다.
+
+        청크 저장소에서 로드된 경우 Document를 생성하지 않고 컬럼을 직접 읽습니다.
+
+        Args:
+            key: 메타데이터 키 (예: "chunk_id", "title")
+
+        Returns:
+            인덱스 위치 순서대로의 메타데이터 값 (없으면 None)
+        """
+        ids = [self.db.index_to_docstore_id[i] for i in range(self.db.index.ntotal)]
+        if isinstance(self.db.docstore, ChunkStore):
+            return self.db.docstore.read_metadata_values(ids, key)
+        return [doc.metadata.get(key) for doc in self.get_documents(range(len(ids)))]
+
+    @traced("vector_store.save")
     def save(self, path: str) -> None:
         """
         벡터 저장소를 로컬 파일에 저장합니다.
 
+        FAISS 인덱스(index.faiss), 인덱스 설정(index.json), 청크 저장소
+        (ChunkStore 파일)를 같은 디렉토리에 기록합니다.
+
         Args:
             path: 저장할 디렉토리 경로
         """
-        self.db.save_local(path)
+        os.makedirs(path, exist_ok=True)
+
+        # FAISS 인덱스 위치 순서대로 청크를 기록하여 행 번호와 인덱스 위치를 일치시킴
+        positions = range(self.db.index.ntotal)
+        documents = self.get_documents(positions)
+        ChunkStore.write(
+            path,
+            [
+                (self.db.index_to_docstore_id[i], doc)
+                for i, doc in zip(positions, documents)
+            ],
+        )
 
+        faiss.write_index(self.db.index, os.path.join(path, self.INDEX_FILE))
+        with open(os.path.join(path, self.CONFIG_FILE), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "index_type": self.index_type,
+                    "metric": self.metric,
+                    "index_params": self.index_params,
+                    # 같은 차원의 다른 모델로 검색하는 실수를 막기 위해 구축 모델을 기록
+                    "model_name": self.embedding_model.model_name,
+                },
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+
+    @traced("vector_store.load")
     def load(self, path: str) -> None:
         """
         저장된 벡터 저장소를 로드합니다.
 
+        청크는 메모리 매핑으로만 열리며, 검색 결과로 반환되는 청크만
+        Document로 생성됩니다.
+
         Args:
             path: 로드할 디렉토리 경로
         """
-        self.db = FAISS.load_local(
-            path,
-            embeddings=self.embedding_model,
-            allow_dangerous_deserialization=True,
+        if not ChunkStore.exists(path):
+            raise FileNotFoundError(
+                f"청크 저장소를 찾을 수 없습니다: {path} "
+                "(이전 형식의 저장소는 파이프라인으로 다시 구축해야 합니다)"
+            )
+
+        index = faiss.read_index(os.path.join(path, self.INDEX_FILE))
+        docstore = ChunkStore.open(path)
+        if index.ntotal != len(docstore):
+            raise ValueError(
+                f"인덱스({index.ntotal})와 청크 수({len(docstore)})가 일치하지 않습니다."
+            )
+
+        self.db = FAISS(
+            embedding_function=self.embedding_model,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id=dict(enumerate(docstore.ids)),
         )
+        self.index_type = self._infer_index_type(index)
+
+        config_file = os.path.join(path, self.CONFIG_FILE)
+        if os.path.exists(config_file):
+            with open(config_file, "r", encoding="utf-8") as f:
+                config = json.load(f)
+            model_name = config.get("model_name")
+            if model_name is not None and model_name != self.embedding_model.model_name:
+                raise ValueError(
+                    f"지식베이스를 구축한 임베딩 모델({model_name})과 검색에 사용할 "
+                    f"모델({self.embedding_model.model_name})이 다릅니다: {path}"
+                )
+            self.metric = config.get("metric", self.metric)
+            # 저장된 검색 파라미터(nprobe, ef_search 등)를 복원 (명시적 인자가 우선)
+            self.index_params = {
+                **DEFAULT_INDEX_PARAMS,
+                **config.get("index_params", {}),
+                **self._explicit_index_params,
+            }
+        elif index.metric_type == faiss.METRIC_L2:
+            self.metric = "l2"
+        else:
+            self.metric = "cosine"
+
+        self._configure_db_metric()
+        self._apply_search_params()
+
+    @classmethod
+    def saved_model_name(cls, path: str) -> Optional[str]:
+        """
+        저장된 벡터 저장소를 구축한 임베딩 모델 이름을 조회합니다.
+
+        Args:
+            path: 벡터 저장소 디렉토리 경로
+
+        Returns:
+            모델 이름 (기록되지 않은 이전 저장소면 None)
+        """
+        config_file = os.path.join(path, cls.CONFIG_FILE)
+        if not os.path.exists(config_file):
+            return None
+        with open(config_file, "r", encoding="utf-8") as f:
+            return json.load(f).get("model_name")
+
+    @staticmethod
+    def _infer_index_type(index: faiss.Index) -> str:
+        """로드된 FAISS 인덱스의 종류를 판별합니다."""
+        if isinstance(index, faiss.IndexHNSW):
+            return "hnsw"
+        ivf_index = faiss.try_extract_index_ivf(index)
+        if ivf_index is None:
+            return "flat"
+        if isinstance(faiss.downcast_index(ivf_index), faiss.IndexIVFPQ):
+            return "ivf_pq"
+        return "ivf_flat"
@@ -0,0 +1,199 @@
+"""
+Metadata Index
+청크 메타데이터(source, title, page, chunk_id)를 FAISS 인덱스 위치 순서의 배열로 미리 색인하여
+검색 필터를 위치 비트맵으로 변환하는 모듈
+"""
+
+import bisect
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .title_index import normalize_title
+
+# 필터 키: 값이 리스트/튜플/집합이면 그중 하나와 일치(in), 여러 키는 모두 만족(and)
+FILTER_KEYS = ("source", "title", "title_prefix", "chunk_id", "page", "page_range")
+
+MetadataFilter = Union[Dict[str, Any], np.ndarray]
+
+
+class MetadataIndex:
+    """
+    필터 조회용 메타데이터 색인
+
+    문자열 메타데이터는 값별 위치 배열로, 페이지는 정수 배열(page_start, page_end)로
+    보관하여 필터를 Document 생성 없이 NumPy 연산만으로 불리언 비트맵으로 변환합니다.
+    제목은 TitleIndex와 같은 방식으로 정규화하며, 전체 제목과 '분류 - ' 뒤의
+    '규범명 + 조항' 부분을 모두 접두 조회 키로 등록합니다.
+
+        index = MetadataIndex.from_values(num_positions, values)
+        mask = index.compile({"title_prefix": "한글 맞춤법", "page_range": (10, 20)})
+    """
+
+    def __init__(
+        self,
+        num_positions: int,
+        strings: Dict[str, Dict[str, np.ndarray]],
+        title_keys: List[Tuple[str, np.ndarray]],
+        page_start: np.ndarray,
+        page_end: np.ndarray,
+    ):
+        """
+        메타데이터 색인 초기화 (일반적으로 from_values()로 생성)
+
+        Args:
+            num_positions: FAISS 인덱스 위치 수
+            strings: 키(source, title, chunk_id) -> 값 -> 위치 배열
+            title_keys: 정렬된 (정규화된 제목 키, 위치 배열) 리스트
+            page_start: 위치별 첫 페이지 (없으면 -1)
+            page_end: 위치별 마지막 페이지 (없으면 -1)
+        """
+        self.num_positions = num_positions
+        self._strings = strings
+        self._title_keys = [key for key, _ in title_keys]
+        self._title_positions = [positions for _, positions in title_keys]
+        self._page_start = page_start
+        self._page_end = page_end
+
+    @classmethod
+    def from_values(
+        cls, num_positions: int, values: Dict[str, Sequence[Any]]
+    ) -> "MetadataIndex":
+        """
+        위치 순서대로의 메타데이터 컬럼으로 색인을 구축합니다.
+
+        Args:
+            num_positions: FAISS 인덱스 위치 수
+            values: 메타데이터 키 -> 위치 순서대로의 값
+                (source, title, chunk_id, page, page_start, page_end; 없는 키는 생략 가능)
+
+        Returns:
+            구축된 MetadataIndex
+        """
+        strings: Dict[str, Dict[str, np.ndarray]] = {}
+        for key in ("source", "title", "chunk_id"):
+            groups: Dict[str, List[int]] = {}
+            for position, value in enumerate(values.get(key, ())):
+                if isinstance(value, str):
+                    groups.setdefault(value, []).append(position)
+            strings[key] = {
+                value: np.array(positions, dtype=np.int64)
+                for value, positions in groups.items()
+            }
+
+        title_groups: Dict[str, List[np.ndarray]] = {}
+        for title, positions in strings["title"].items():
+            for key in {
+                normalize_title(title),
+                normalize_title(title.split(" - ")[-1]),
+            }:
+                title_groups.setdefault(key, []).append(positions)
+        title_keys = [
+            (key, np.unique(np.concatenate(title_groups[key])))
+            for key in sorted(title_groups)
+        ]
+
+        def page_column(key: str, fallback: np.ndarray) -> np.ndarray:
+            column = fallback.copy()
+            for position, value in enumerate(values.get(key, ())):
+                if isinstance(value, int) and not isinstance(value, bool):
+                    column[position] = value
+            return column
+
+        page = page_column("page", np.full(num_positions, -1, dtype=np.int64))
+        page_start = page_column("page_start", page)
+        page_end = page_column("page_end", page_start)
+        return cls(num_positions, strings, title_keys, page_start, page_end)
+
+    def compile(self, filter: Optional[MetadataFilter]) -> Optional[np.ndarray]:
+        """
+        필터를 위치별 선택 여부 비트맵으로 변환합니다.
+
+        Args:
+            filter: 필터 dict 또는 이미 변환된 불리언 비트맵 (None이면 필터 없음)
+
+                - source / title / chunk_id: 값 또는 값 목록과 정확히 일치
+                - title_prefix: 정규화된 제목(또는 '규범명 + 조항' 부분)이 접두어로 시작
+                - page: 청크가 걸친 페이지에 주어진 페이지(또는 목록 중 하나)가 포함
+                - page_range: (시작, 끝) 페이지 구간과 겹침 (양 끝 포함, None이면 열린 구간)
+
+        Returns:
+            shape [num_positions]의 불리언 배열 (필터가 없으면 None)
+        """
+        if filter is None:
+            return None
+        if isinstance(filter, np.ndarray):
+            if filter.dtype != bool or filter.shape != (self.num_positions,):
+                raise ValueError(
+                    f"필터 비트맵은 길이 {self.num_positions}의 불리언 배열이어야 합니다."
+                )
+            return filter
+
+        unknown = set(filter) - set(FILTER_KEYS)
+        if unknown:
+            raise ValueError(
+                f"지원하지 않는 필터 키입니다: {sorted(unknown)} (지원: {FILTER_KEYS})"
+            )
+
+        mask = np.ones(self.num_positions, dtype=bool)
+        for key, condition in filter.items():
+            if key == "page_range":
+                mask &= self._page_range_mask(condition)
+                continue
+            selected = np.zeros(self.num_positions, dtype=bool)
+            for value in self._as_values(condition):
+                expected = int if key == "page" else str
+                if not isinstance(value, expected) or isinstance(value, bool):
+                    raise ValueError(
+                        f"{key} 필터 값은 {expected.__name__}이어야 합니다: {value!r}"
+                    )
+                if key == "title_prefix":
+                    self._mark_title_prefix(selected, value)
+                elif key == "page":
+                    selected |= self._page_range_mask((value, value))
+                else:
+                    positions = self._strings[key].get(value)
+                    if positions is not None:
+                        selected[positions] = True
+            mask &= selected
+        return mask
+
+    @staticmethod
+    def _as_values(condition: Any) -> Iterable[Any]:
+        """필터 조건을 값 목록으로 변환합니다. (단일 값 또는 리스트/튜플/집합)"""
+        if isinstance(condition, (list, tuple, set, frozenset)):
+            return condition
+        return (condition,)
+
+    def _mark_title_prefix(self, selected: np.ndarray, prefix: str) -> None:
+        """정규화된 제목 키가 접두어로 시작하는 위치를 표시합니다."""
+        key = normalize_title(prefix)
+        start = bisect.bisect_left(self._title_keys, key)
+        for i in range(start, len(self._title_keys)):
+            if not self._title_keys[i].startswith(key):
+                break
+            selected[self._title_positions[i]] = True
+
+    def _page_range_mask(self, page_range: Any) -> np.ndarray:
+        """청크 페이지 구간 [page_start, page_end]가 주어진 구간과 겹치는 위치"""
+        if not isinstance(page_range, (list, tuple)) or len(page_range) != 2:
+            raise ValueError(
+                f"page_range는 (시작, 끝) 형식이어야 합니다: {page_range!r}"
+            )
+        low, high = page_range
+        for value in (low, high):
+            if value is not None and (
+                not isinstance(value, int) or isinstance(value, bool)
+            ):
+                raise ValueError(
+                    f"page_range의 시작과 끝은 정수 또는 None이어야 합니다: {page_range!r}"
+                )
+        mask = self._page_start >= 0
+        if low is not None:
+            mask &= self._page_end >= low
+        if high is not None:
+            mask &= self._page_start <= high
+        return mask
+
+    def __len__(self) -> int:
+        return self.num_positions
@@ -0,0 +1,216 @@
+"""
+Title Index
+어문 규범 조항 제목(예: 한글 맞춤법 제18항)으로 청크를 바로 찾는 조회 색인
+"""
+
+import bisect
+import difflib
+import json
+import os
+import re
+import unicodedata
+from typing import Dict, Iterable, List
+
+from langchain_core.documents import Document
+
+# 쿼리에서 조항 인용을 찾는 패턴: <제목> 또는 "[규범명] [제N장] [제N절] 제N항|표N"
+REFERENCE_PATTERN = re.compile(
+    r"<[^<>]+>"
+    r"|(?:[가-힣,]+\s*){0,4}"
+    r"(?:제\s*\d+\s*장\s*)?(?:제\s*\d+\s*절\s*)?(?:제\s*\d+\s*항|표\s*\d+)"
+)
+# 제목에서 규범명 뒤의 조항 번호 부분 (예: 제3장 제1절 제2항, 제2장 표1)
+CLAUSE_PATTERN = re.compile(r"(?:제\d+장)?(?:제\d+절)?(?:제\d+항|표\d+)$")
+
+
+def normalize_title(title: str) -> str:
+    """
+    조항 제목을 조회 키로 정규화합니다.
+
+    꺾쇠괄호를 제거하고 유니코드(NFKC)를 정규화한 뒤 모든 공백을 제거하여
+    '<한글 맞춤법 제 18 항>'과 '한글 맞춤법 제18항'이 같은 키가 되도록 합니다.
+
+    Args:
+        title: 원본 제목
+
+    Returns:
+        정규화된 조회 키
+    """
+    title = unicodedata.normalize("NFKC", title).strip()
+    title = title.strip("<>「」[]")
+    return re.sub(r"\s+", "", title).lower()
+
+
+class TitleIndex:
+    """
+    조항 제목 조회 색인
+
+    청킹 결과의 제목을 정규화하여 chunk_id 목록에 대응시킵니다. 전체 제목 외에
+    '규범명 + 조항'(예: 한글 맞춤법 제18항)과 조항 번호(예: 제18항)도 별칭 키로
+    등록하여, 정확 조회는 dict(O(1)), 접두 조회는 정렬된 키의 이진 탐색으로
+    수행합니다.
+    """
+
+    INDEX_FILE = "title_index.json"
+
+    def __init__(self, titles: Dict[str, List[str]]):
+        """
+        제목 색인 초기화
+
+        Args:
+            titles: 원본 제목 -> chunk_id 리스트
+        """
+        self.titles = titles
+        self._lookup: Dict[str, List[str]] = {}
+        for title, chunk_ids in titles.items():
+            for key in self._alias_keys(title):
+                ids = self._lookup.setdefault(key, [])
+                ids.extend(chunk_id for chunk_id in chunk_ids if chunk_id not in ids)
+        self._sorted_keys = sorted(self._lookup)
+
+    @staticmethod
+    def _alias_keys(title: str) -> List[str]:
+        """제목 하나에 대해 등록할 조회 키 목록을 생성합니다."""
+        keys = [normalize_title(title)]
+        # "분류 - 규범명 조항" 형식이면 분류를 뗀 부분도 등록
+        article = normalize_title(title.split(" - ")[-1])
+        if article not in keys:
+            keys.append(article)
+        clause = CLAUSE_PATTERN.search(article)
+        if clause and clause.group() not in keys:
+            keys.append(clause.group())
+        return keys
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[Document]) -> "TitleIndex":
+        """
+        청크 문서 목록으로 제목 색인을 구축합니다.
+
+        Args:
+            documents: KORChunker가 생성한 청크 리스트
+
+        Returns:
+            구축된 TitleIndex
+        """
+        titles: Dict[str, List[str]] = {}
+        for doc in documents:
+            title = doc.metadata.get("title")
+            chunk_id = doc.metadata.get("chunk_id")
+            if not title or not chunk_id:
+                continue
+            chunk_ids = titles.setdefault(title, [])
+            if chunk_id not in chunk_ids:
+                chunk_ids.append(chunk_id)
+        return cls(titles)
+
+    def lookup(self, title: str) -> List[str]:
+        """
+        제목과 정확히 일치하는 청크를 조회합니다.
+
+        Args:
+            title: 조항 제목 (전체 제목, 규범명 + 조항, 조항 번호 모두 가능)
+
+        Returns:
+            chunk_id 리스트 (없으면 빈 리스트)
+        """
+        return list(self._lookup.get(normalize_title(title), []))
+
+    def prefix_lookup(self, prefix: str, limit: int = 10) -> List[str]:
+        """
+        정규화된 키가 접두어로 시작하는 제목의 청크를 조회합니다.
+
+        Args:
+            prefix: 제목 접두어 (예: "한글 맞춤법 제1")
+            limit: 조회할 최대 키 수
+
+        Returns:
+            chunk_id 리스트
+        """
+        key = normalize_title(prefix)
+        start = bisect.bisect_left(self._sorted_keys, key)
+        chunk_ids: List[str] = []
+        for matched in self._sorted_keys[start : start + limit]:
+            if not matched.startswith(key):
+                break
+            chunk_ids.extend(c for c in self._lookup[matched] if c not in chunk_ids)
+        return chunk_ids
+
+    def fuzzy_lookup(self, title: str, n: int = 3, cutoff: float = 0.8) -> List[str]:
+        """
+        철자가 조금 다른 제목을 유사도로 조회합니다.
+
+        Args:
+            title: 조항 제목
+            n: 조회할 최대 키 수
+            cutoff: 최소 유사도 (0~1)
+
+        Returns:
+            유사도 순 chunk_id 리스트
+        """
+        matches = difflib.get_close_matches(
+            normalize_title(title), self._sorted_keys, n=n, cutoff=cutoff
+        )
+        chunk_ids: List[str] = []
+        for matched in matches:
+            chunk_ids.extend(c for c in self._lookup[matched] if c not in chunk_ids)
+        return chunk_ids
+
+    def find_references(self, query: str) -> List[str]:
+        """
+        쿼리에 인용된 조항을 찾아 해당 청크를 조회합니다.
+
+        인용 구간마다 앞 단어를 하나씩 떼어 가며 가장 긴 일치 키를 사용합니다.
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            인용된 조항의 chunk_id 리스트 (인용이 없으면 빈 리스트)
+        """
+        chunk_ids: List[str] = []
+        for match in REFERENCE_PATTERN.finditer(query):
+            words = match.group().strip("<>").split()
+            for i in range(len(words)):
+                found = self._lookup.get(normalize_title(" ".join(words[i:])))
+                if found:
+                    chunk_ids.extend(c for c in found if c not in chunk_ids)
+                    break
+        return chunk_ids
+
+    @classmethod
+    def exists(cls, path: str) -> bool:
+        """
+        경로에 저장된 제목 색인이 있는지 확인합니다.
+
+        Args:
+            path: 색인 디렉토리 경로
+        """
+        return os.path.exists(os.path.join(path, cls.INDEX_FILE))
+
+    def save(self, path: str) -> None:
+        """
+        제목 색인을 디렉토리에 저장합니다.
+
+        Args:
+            path: 저장할 디렉토리 경로
+        """
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, self.INDEX_FILE), "w", encoding="utf-8") as f:
+            json.dump({"titles": self.titles}, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> "TitleIndex":
+        """
+        저장된 제목 색인을 로드합니다.
+
+        Args:
+            path: 색인 디렉토리 경로
+
+        Returns:
+            로드된 TitleIndex
+        """
+        with open(os.path.join(path, cls.INDEX_FILE), "r", encoding="utf-8") as f:
+            return cls(json.load(f)["titles"])
+
+    def __len__(self) -> int:
+        return len(self.titles)
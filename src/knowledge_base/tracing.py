@@ -0,0 +1,338 @@
+"""
+Tracing
+단계별 소요 시간을 프로세스 내 히스토그램으로 집계하는 경량 스팬/타이머
+
+    from src.knowledge_base import tracing
+
+    tracing.enable()
+    with tracing.span("retriever.search"):
+        ...
+    print(tracing.get_stats())           # 단계별 count, 평균, p50/p95/p99 (ms)
+    print(tracing.prometheus_text())     # Prometheus 텍스트 형식
+
+비활성화 상태(기본값, 환경 변수 KB_TRACING=1이면 활성화)에서는 @traced 함수가
+플래그 하나만 확인하고 원래 함수를 호출하므로 추가 비용이 거의 없습니다.
+"""
+
+import bisect
+import functools
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# 히스토그램 버킷 상한(초): 0.1ms ~ 60초 (마지막은 +Inf)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    math.inf,
+)
+METRIC_NAME = "kb_stage_duration_seconds"
+
+
+class Histogram:
+    """
+    고정 버킷 소요 시간 히스토그램
+
+    분위수는 버킷 안에서 선형 보간한 추정값이며, 관측한 최솟값/최댓값 범위로 제한합니다.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """소요 시간(초) 하나를 기록합니다."""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """
+        버킷 개수로 분위수(초)를 추정합니다.
+
+        Args:
+            q: 분위 (0~1)
+
+        Returns:
+            추정 소요 시간 (기록이 없으면 0)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            if count and cumulative + count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if math.isfinite(self.buckets[i]) else self.max
+                estimate = lower + (upper - lower) * (rank - cumulative) / count
+                return min(max(estimate, self.min), self.max)
+            cumulative += count
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """count, 합계(초), 평균/최소/최대/p50/p95/p99(ms) 요약"""
+        return {
+            "count": self.count,
+            "total_seconds": self.sum,
+            "mean_ms": self.sum / self.count * 1000 if self.count else 0.0,
+            "min_ms": self.min * 1000 if self.count else 0.0,
+            "max_ms": self.max * 1000,
+            "p50_ms": self.quantile(0.5) * 1000,
+            "p95_ms": self.quantile(0.95) * 1000,
+            "p99_ms": self.quantile(0.99) * 1000,
+        }
+
+
+class _Span:
+    """Tracer.span()이 반환하는 타이머"""
+
+    __slots__ = ("_tracer", "_name", "_start")
+
+    def __init__(self, tracer: Optional["Tracer"], name: str):
+        self._tracer = tracer
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> "_Span":
+        if self._tracer is not None:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._tracer is not None:
+            self._tracer.record(self._name, time.perf_counter() - self._start)
+
+
+# 비활성화 상태의 span()이 반환하는 공용 객체
+_NULL_SPAN = _Span(None, "")
+
+
+class Tracer:
+    """
+    단계 이름별 소요 시간 히스토그램 집계기
+
+    capture()로 현재 스레드에서 기록되는 스팬을 순서대로 모을 수 있어, 느린 요청 하나가
+    인코딩/검색/문서 조회 중 어디에서 시간을 썼는지 확인할 수 있습니다.
+    """
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def record(self, name: str, seconds: float) -> None:
+        """
+        단계 소요 시간을 기록합니다.
+
+        Args:
+            name: 단계 이름 (예: "retriever.search")
+            seconds: 소요 시간(초)
+        """
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(seconds)
+        captured = getattr(self._local, "captured", None)
+        if captured is not None:
+            captured.append((name, seconds))
+
+    def span(self, name: str) -> "_Span":
+        """
+        with 블록의 소요 시간을 name 단계로 기록하는 컨텍스트 관리자를 반환합니다.
+
+        비활성화 상태에서는 아무것도 하지 않는 공용 객체를 반환합니다.
+
+        Args:
+            name: 단계 이름
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def traced(self, name: str) -> Callable[[F], F]:
+        """
+        함수 호출 소요 시간을 name 단계로 기록하는 데코레이터를 반환합니다.
+
+        Args:
+            name: 단계 이름
+        """
+
+        def decorator(function: F) -> F:
+            @functools.wraps(function)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+
+            return wrapper  # type: ignore[return-value]
+
+        return decorator
+
+    @contextmanager
+    def capture(self) -> Iterator[List[Tuple[str, float]]]:
+        """
+        with 블록 동안 현재 스레드에서 기록된 (단계 이름, 소요 시간(초))를 모읍니다.
+
+        안쪽 스팬이 먼저 끝나므로 바깥 스팬보다 앞에 기록됩니다.
+
+        Returns:
+            기록된 스팬 리스트 (with 블록이 끝날 때까지 채워짐)
+        """
+        previous = getattr(self._local, "captured", None)
+        captured: List[Tuple[str, float]] = []
+        self._local.captured = captured
+        try:
+            yield captured
+        finally:
+            self._local.captured = previous
+
+    def reset(self) -> None:
+        """집계한 히스토그램을 모두 지웁니다."""
+        with self._lock:
+            self._histograms = {}
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        단계별 소요 시간 요약을 반환합니다.
+
+        Returns:
+            {단계 이름: Histogram.summary()} (이름순)
+        """
+        with self._lock:
+            return {
+                name: self._histograms[name].summary()
+                for name in sorted(self._histograms)
+            }
+
+    def format_text(self) -> str:
+        """단계별 요약을 사람이 읽기 쉬운 표 문자열로 반환합니다."""
+        lines = [
+            f"{'stage':<40} {'count':>8} {'total_s':>10} {'mean_ms':>10} "
+            f"{'p50_ms':>10} {'p95_ms':>10} {'p99_ms':>10}"
+        ]
+        for name, stats in self.get_stats().items():
+            lines.append(
+                f"{name:<40} {stats['count']:>8} {stats['total_seconds']:>10.3f} "
+                f"{stats['mean_ms']:>10.3f} {stats['p50_ms']:>10.3f} "
+                f"{stats['p95_ms']:>10.3f} {stats['p99_ms']:>10.3f}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def prometheus_text(self, metric_name: str = METRIC_NAME) -> str:
+        """
+        단계별 히스토그램을 Prometheus 텍스트 노출 형식으로 반환합니다.
+
+        Args:
+            metric_name: 메트릭 이름 (stage 레이블로 단계를 구분)
+
+        Returns:
+            누적 버킷(_bucket), 합계(_sum), 개수(_count) 텍스트
+        """
+        lines = [
+            f"# HELP {metric_name} Knowledge base stage duration in seconds.",
+            f"# TYPE {metric_name} histogram",
+        ]
+        with self._lock:
+            histograms = [
+                (name, self._histograms[name]) for name in sorted(self._histograms)
+            ]
+            for name, histogram in histograms:
+                stage = name.replace("\\", "\\\\").replace('"', '\\"')
+                cumulative = 0
+                for upper, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    le = "+Inf" if math.isinf(upper) else repr(upper)
+                    labels = f'stage="{stage}",le="{le}"'
+                    lines.append(f"{metric_name}_bucket{{{labels}}} {cumulative}")
+                lines.append(f'{metric_name}_sum{{stage="{stage}"}} {histogram.sum!r}')
+                lines.append(
+                    f'{metric_name}_count{{stage="{stage}"}} {histogram.count}'
+                )
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전역 추적기
+tracer = Tracer(enabled=os.environ.get("KB_TRACING", "").lower() in ("1", "true"))
+
+
+def enable() -> None:
+    """단계별 소요 시간 기록을 켭니다."""
+    tracer.enabled = True
+
+
+def disable() -> None:
+    """단계별 소요 시간 기록을 끕니다. (집계된 값은 유지)"""
+    tracer.enabled = False
+
+
+def is_enabled() -> bool:
+    """기록 중인지 여부"""
+    return tracer.enabled
+
+
+def span(name: str) -> _Span:
+    """전역 추적기의 Tracer.span()"""
+    return tracer.span(name)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """전역 추적기의 Tracer.traced()"""
+    return tracer.traced(name)
+
+
+def capture():
+    """전역 추적기의 Tracer.capture()"""
+    return tracer.capture()
+
+
+def reset() -> None:
+    """전역 추적기의 Tracer.reset()"""
+    tracer.reset()
+
+
+def get_stats() -> Dict[str, Dict[str, float]]:
+    """전역 추적기의 Tracer.get_stats()"""
+    return tracer.get_stats()
+
+
+def format_text() -> str:
+    """전역 추적기의 Tracer.format_text()"""
+    return tracer.format_text()
+
+
+def prometheus_text(metric_name: str = METRIC_NAME) -> str:
+    """전역 추적기의 Tracer.prometheus_text()"""
+    return tracer.prometheus_text(metric_name)
@@ -0,0 +1,79 @@
+"""
+벤치마크 스크립트의 결과 요약/비교 함수 테스트 코드
+"""
+
+import importlib.util
+import os
+
+import numpy as np
+import pytest
+
+SCRIPT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "scripts",
+    "benchmark.py",
+)
+spec = importlib.util.spec_from_file_location("benchmark", SCRIPT_PATH)
+benchmark = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(benchmark)
+
+
+def test_latency_summary():
+    """지연 시간 표본(초)을 밀리초 분위수로 요약하는지 테스트합니다."""
+    summary = benchmark.latency_summary([i / 1000 for i in range(1, 101)])
+    assert summary["p50_ms"] == pytest.approx(50.5)
+    assert summary["p99_ms"] == pytest.approx(99.01)
+    assert summary["max_ms"] == pytest.approx(100.0)
+    assert summary["mean_ms"] == pytest.approx(50.5)
+
+
+def _result(p99_ms, qps, peak_rss_mb=500.0, queries=200):
+    return {
+        "meta": {"commit": "abc"},
+        "stages": {
+            "search": {
+                "queries": queries,
+                "p99_ms": p99_ms,
+                "queries_per_second": qps,
+                "peak_rss_mb": peak_rss_mb,
+            },
+            "index_build": {"hnsw": {"seconds": 1.0}},
+        },
+    }
+
+
+def test_compare_results_flags_regressions_by_direction():
+    """지연 시간 증가와 처리량 감소만 허용 비율을 넘을 때 회귀로 표시하는지 테스트합니다."""
+    baseline = _result(p99_ms=10.0, qps=100.0)
+    current = _result(p99_ms=13.0, qps=70.0, peak_rss_mb=510.0, queries=100)
+    current["stages"]["index_build"]["hnsw"]["seconds"] = 0.5
+
+    rows = {row["metric"]: row for row in benchmark.compare_results(current, baseline)}
+
+    # 개수처럼 방향이 없는 항목은 비교하지 않음
+    assert "search.queries" not in rows
+    assert rows["search.p99_ms"]["change"] == pytest.approx(0.3)
+    assert rows["search.p99_ms"]["regression"]
+    assert rows["search.queries_per_second"]["change"] == pytest.approx(0.3)
+    assert rows["search.queries_per_second"]["regression"]
+    assert not rows["search.peak_rss_mb"]["regression"]
+    # 빨라진 항목은 음수 변화율
+    assert rows["index_build.hnsw.seconds"]["change"] == pytest.approx(-0.5)
+    assert not rows["index_build.hnsw.seconds"]["regression"]
+
+    same = benchmark.compare_results(baseline, baseline, tolerance=0.0)
+    assert not any(row["regression"] for row in same)
+
+
+def test_build_tiny_model(tmp_path):
+    """데이터 문자로 만든 작은 모델을 오프라인으로 생성하고 재사용하는지 테스트합니다."""
+    texts = ["한글 맞춤법 제1항", "표준어 규정", "외래어 표기법"]
+    model_dir = benchmark.build_tiny_model(str(tmp_path / "tiny"), texts)
+    assert benchmark.build_tiny_model(model_dir, []) == model_dir
+
+    embedding_model = benchmark.SentenceTransformersEmbedding(
+        model_name=model_dir, query_cache_size=0
+    )
+    embeddings = embedding_model.embed_texts(texts, show_progress_bar=False)
+    assert embeddings.shape == (3, 32)
+    assert np.isfinite(embeddings).all()
@@ -0,0 +1,68 @@
+"""
+BM25Index 기능 테스트 코드
+"""
+
+import numpy as np
+from langchain_core.documents import Document
+
+from knowledge_base.storage.bm25_index import BM25Index
+
+TEST_DOCUMENTS = [
+    Document(
+        page_content="의존 명사는 띄어 쓴다. 예) 외출 시에는 문을 잠근다.",
+        metadata={"title": "띄어쓰기 - 한글 맞춤법 제42항"},
+    ),
+    Document(
+        page_content="'오뚝하다'를 표준어로 삼는다. '오똑하다'는 버린다.",
+        metadata={"title": "한글 맞춤법, 표준어 규정 - 표준어 사정 원칙 제8항"},
+    ),
+    Document(
+        page_content="어간 끝 받침 'ㄷ'이 모음 앞에서 'ㄹ'로 바뀌는 용언은 바뀐 대로 적는다.",
+        metadata={"title": "한글 맞춤법, 표준어 규정 - 한글 맞춤법 제18항"},
+    ),
+]
+
+
+def test_bm25_exact_surface_form():
+    """표면형이 일치하는 문서가 가장 먼저 검색되는지 테스트합니다."""
+    index = BM25Index.from_documents(TEST_DOCUMENTS)
+
+    _, ids = index.search("오똑한 코", k=3)
+    assert ids[0] == 1
+
+    _, ids = index.search("{외출 시에는/외출시에는}", k=3)
+    assert ids[0] == 0
+
+
+def test_bm25_scores_match_reference():
+    """벡터화된 점수 계산이 BM25 정의식과 일치하는지 테스트합니다."""
+    index = BM25Index.from_documents(TEST_DOCUMENTS, ngram_range=(2, 2))
+    query = "받침 ㄷ 모음"
+
+    docs = [
+        index.tokenize(f"{d.metadata['title']}\n{d.page_content}")
+        for d in TEST_DOCUMENTS
+    ]
+    avg_length = sum(len(d) for d in docs) / len(docs)
+    expected = np.zeros(len(docs))
+    for term in index.tokenize(query):
+        df = sum(term in d for d in docs)
+        if df == 0:
+            continue
+        idf = np.log1p((len(docs) - df + 0.5) / (df + 0.5))
+        for i, d in enumerate(docs):
+            tf = d.count(term)
+            norm = index.k1 * (1 - index.b + index.b * len(d) / avg_length)
+            expected[i] += idf * tf * (index.k1 + 1) / (tf + norm)
+
+    np.testing.assert_allclose(index.get_scores(query), expected, rtol=1e-5)
+
+
+def test_bm25_save_and_load(tmp_path):
+    """저장 후 로드한 색인의 검색 결과가 동일한지 테스트합니다."""
+    index = BM25Index.from_documents(TEST_DOCUMENTS, analyzer="jamo")
+    index.save(str(tmp_path))
+
+    loaded = BM25Index.load(str(tmp_path))
+    query = "불을 것 같아 걱정이다"
+    np.testing.assert_array_equal(loaded.get_scores(query), index.get_scores(query))
@@ -0,0 +1,90 @@
+"""
+ChunkStore 기능 테스트 코드
+"""
+
+from langchain_core.documents import Document
+
+from knowledge_base.storage.chunk_store import ChunkStore
+
+
+def _sample_documents():
+    return [
+        (
+            "doc-0",
+            Document(
+                page_content="한글 맞춤법은 표준어를 소리대로 적되, 어법에 맞도록 함을 원칙으로 한다.",
+                metadata={
+                    "title": "한글 맞춤법 제1항",
+                    "page": 1,
+                    "chunk_id": "KOR-Regulation-00000",
+                    "source": "테스트_규정",
+                },
+            ),
+        ),
+        (
+            "doc-1",
+            Document(
+                page_content="문장의 각 단어는 띄어 씀을 원칙으로 한다.",
+                metadata={"title": "한글 맞춤법 제2항", "similarity_score": 0.5},
+            ),
+        ),
+        ("doc-2", Document(page_content="메타데이터 없는 청크")),
+    ]
+
+
+def test_chunk_store_roundtrip(tmp_path):
+    """저장한 청크가 메모리 매핑 로드 후에도 동일한지 테스트합니다."""
+    documents = _sample_documents()
+    ChunkStore.write(str(tmp_path), documents)
+
+    store = ChunkStore.open(str(tmp_path))
+
+    assert len(store) == len(documents)
+    assert store.ids == [doc_id for doc_id, _ in documents]
+    for doc_id, expected in documents:
+        loaded = store.search(doc_id)
+        assert loaded.id == doc_id
+        assert loaded.page_content == expected.page_content
+        assert loaded.metadata == expected.metadata
+
+    assert isinstance(store.search("missing"), str)
+
+
+def test_chunk_store_add_and_delete(tmp_path):
+    """로드 이후 추가/삭제한 청크가 다시 저장되는지 테스트합니다."""
+    ChunkStore.write(str(tmp_path), _sample_documents())
+    store = ChunkStore.open(str(tmp_path))
+
+    store.add({"doc-3": Document(page_content="새 청크", metadata={"page": 7})})
+    store.delete(["doc-0"])
+
+    assert store.ids == ["doc-1", "doc-2", "doc-3"]
+    assert isinstance(store.search("doc-0"), str)
+
+    ChunkStore.write(
+        str(tmp_path), [(doc_id, store.search(doc_id)) for doc_id in store.ids]
+    )
+    reopened = ChunkStore.open(str(tmp_path))
+
+    assert reopened.ids == ["doc-1", "doc-2", "doc-3"]
+    assert reopened.search("doc-3").metadata == {"page": 7}
+
+
+def test_read_extra_metadata_values_without_documents(tmp_path, monkeypatch):
+    """기타 메타데이터 값을 Document 생성 없이 extra 컬럼에서 읽는지 테스트합니다."""
+    ChunkStore.write(str(tmp_path), _sample_documents())
+    store = ChunkStore.open(str(tmp_path))
+    store.add({"doc-3": Document(page_content="새 청크", metadata={"page_end": 9})})
+
+    def fail(row):
+        raise AssertionError("Document를 생성하면 안 됩니다.")
+
+    monkeypatch.setattr(store, "_read_row", fail)
+    ids = ["doc-0", "doc-1", "doc-2", "doc-3"]
+    assert store.read_metadata_values(ids, "similarity_score") == [
+        None,
+        0.5,
+        None,
+        None,
+    ]
+    assert store.read_metadata_values(ids, "page_end") == [None, None, None, 9]
@@ -37,6 +37,23 @@ def test_basic_functionality():
     print("✅ 기본 초기화 테스트 통과")
 
 
+def test_lazy_loading():
+    """모델 지연 로딩 테스트"""
+    print("\n" + "=" * 50)
+    print("모델 지연 로딩 테스트 시작")
+    print("=" * 50)
+
+    embedding = SentenceTransformersEmbedding()
+    assert embedding._model is None, "생성 시점에 모델이 로드되었습니다"
+
+    # 첫 인코딩 시 모델 로드
+    embedding.embed_query("지연 로딩 테스트 문장입니다.")
+    assert embedding._model is not None, "인코딩 후에도 모델이 로드되지 않았습니다"
+    assert embedding.warmup() >= 0
+
+    print("✅ 모델 지연 로딩 테스트 통과")
+
+
 def test_single_text_embedding():
     """단일 텍스트 임베딩 테스트"""
     print("\n" + "=" * 50)
@@ -96,6 +113,75 @@ def test_batch_text_embedding():
     print("✅ 배치 텍스트 임베딩 테스트 통과")
 
 
+def test_length_bucketing():
+    """길이별 배치 구성 테스트"""
+    print("\n" + "=" * 50)
+    print("길이별 배치 구성 테스트 시작")
+    print("=" * 50)
+
+    embedding = SentenceTransformersEmbedding(batch_size=2, query_cache_size=0)
+
+    # 길이가 크게 다른 텍스트를 섞어 입력
+    texts = [
+        "짧은 문장.",
+        "한글 맞춤법은 표준어를 소리대로 적되, 어법에 맞도록 함을 원칙으로 한다. " * 4,
+        "두 번째 짧은 문장.",
+        "문장의 각 단어는 띄어 씀을 원칙으로 한다. " * 3,
+        "끝.",
+    ]
+
+    embedding.length_bucketing = False
+    default_result = embedding.embed_texts(texts, show_progress_bar=False)
+    # 기본 배치 구성은 인코딩 중 토큰화하지 않고 통계 조회 시 패딩을 계산
+    assert embedding._encoding_stats["tokens"] == 0
+    default_stats = embedding.get_encoding_stats()
+
+    embedding.reset_encoding_stats()
+    embedding.length_bucketing = True
+    bucketed_result = embedding.embed_texts(texts, show_progress_bar=False)
+    bucketed_stats = embedding.get_encoding_stats()
+
+    print(f"기본 배치 패딩 비율: {default_stats['padding_ratio']:.3f}")
+    print(f"길이별 배치 패딩 비율: {bucketed_stats['padding_ratio']:.3f}")
+
+    # 결과는 입력 순서대로 반환되어야 함
+    assert np.allclose(
+        default_result, bucketed_result, atol=1e-5
+    ), "길이별 배치 결과가 기본 배치 결과와 다릅니다"
+    assert bucketed_stats["texts"] == len(texts)
+    assert bucketed_stats["batches"] == 3
+    assert bucketed_stats["tokens"] == default_stats["tokens"]
+    assert bucketed_stats["padding_ratio"] <= default_stats["padding_ratio"]
+
+    print("✅ 길이별 배치 구성 테스트 통과")
+
+
+def test_worker_pool():
+    """작업 프로세스 풀 인코딩 테스트"""
+    print("\n" + "=" * 50)
+    print("작업 프로세스 풀 인코딩 테스트 시작")
+    print("=" * 50)
+
+    texts = [f"{i}번째 테스트 문장입니다. " * (i % 5 + 1) for i in range(80)]
+    embedding = SentenceTransformersEmbedding(
+        batch_size=8, query_cache_size=0, num_workers=2, threads_per_worker=1
+    )
+    try:
+        expected = embedding.model.encode(texts, convert_to_numpy=True)
+        # 두 번째 호출은 이미 로드된 작업 프로세스를 재사용
+        for _ in range(2):
+            result = embedding.embed_texts(texts, show_progress_bar=False)
+            assert result.flags["C_CONTIGUOUS"], "결과 배열이 연속 배열이 아닙니다"
+            assert np.allclose(
+                result, expected, atol=1e-5
+            ), "작업 프로세스 결과가 입력 순서와 일치하지 않습니다"
+        assert embedding.get_encoding_stats()["texts"] == 2 * len(texts)
+    finally:
+        embedding.close()
+
+    print("✅ 작업 프로세스 풀 인코딩 테스트 통과")
+
+
 def test_chunk_embedding():
     """청크 임베딩 테스트"""
     print("\n" + "=" * 50)
@@ -228,8 +314,11 @@ def main():
 
     try:
         test_basic_functionality()
+        test_lazy_loading()
         test_single_text_embedding()
         test_batch_text_embedding()
+        test_length_bucketing()
+        test_worker_pool()
         test_chunk_embedding()
         test_query_embedding()
         test_similarity_computation()
@@ -0,0 +1,52 @@
+"""
+EmbeddingCache 기능 테스트 코드
+"""
+
+import numpy as np
+
+from knowledge_base.embedding.embedding_cache import EmbeddingCache
+
+
+def test_cache_roundtrip(tmp_path):
+    """저장한 임베딩을 새 캐시 인스턴스에서 다시 읽을 수 있는지 테스트합니다."""
+    cache = EmbeddingCache(str(tmp_path), "test/model")
+    texts = ["첫 번째 청크", "두 번째 청크"]
+    vectors = np.random.rand(2, 8).astype(np.float32)
+
+    cache.put_many(texts, vectors)
+    cache.save()
+
+    reloaded = EmbeddingCache(str(tmp_path), "test/model")
+    found, missing = reloaded.get_many(texts + ["새 청크"])
+
+    assert missing == [2]
+    np.testing.assert_array_equal(found[0], vectors[0])
+    np.testing.assert_array_equal(found[1], vectors[1])
+    assert reloaded.get_stats()["hits"] == 2
+    assert reloaded.get_stats()["misses"] == 1
+
+
+def test_cache_is_separated_by_model(tmp_path):
+    """모델명이 다르면 캐시를 공유하지 않는지 테스트합니다."""
+    cache = EmbeddingCache(str(tmp_path), "model-a")
+    cache.put("청크", np.ones(4, dtype=np.float32))
+    cache.save()
+
+    other = EmbeddingCache(str(tmp_path), "model-b")
+    assert other.get("청크") is None
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목이 제거되는지 테스트합니다."""
+    cache = EmbeddingCache(str(tmp_path), "test/model", max_entries=2)
+    cache.put("a", np.zeros(4, dtype=np.float32))
+    cache.put("b", np.zeros(4, dtype=np.float32))
+
+    # "a"를 조회하여 최근 사용 항목으로 갱신
+    assert cache.get("a") is not None
+    cache.put("c", np.zeros(4, dtype=np.float32))
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get_stats()["evictions"] == 1
@@ -0,0 +1,140 @@
+"""
+평가 실행 로그 / 검색 결과 캐시 테스트 코드
+"""
+
+import os
+
+import pytest
+
+from src.evaluate.eval_log import (
+    JsonlRunLog,
+    RetrievalCache,
+    knowledge_base_fingerprint,
+    read_jsonl,
+)
+
+HEADER = {"model_name": "test-model", "max_k": 10, "search_config": {"mode": "dense"}}
+
+
+def _records(start, stop):
+    return [
+        {"index": i, "query": f"질문 {i}", "retrieved_docs": ["a"]}
+        for i in range(start, stop)
+    ]
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.zst"])
+def test_run_log_resumes_completed_records(tmp_path, suffix):
+    """다시 열면 완료된 기록을 반환하고 이어서 기록하는지 테스트합니다."""
+    path = str(tmp_path / f"run{suffix}")
+
+    with JsonlRunLog(path, HEADER) as run_log:
+        assert run_log.open() == []
+        for record in _records(0, 5):
+            run_log.append(record)
+
+    with JsonlRunLog(path, HEADER) as run_log:
+        assert run_log.open() == _records(0, 5)
+        for record in _records(5, 8):
+            run_log.append(record)
+
+    lines, truncated = read_jsonl(path)
+    assert not truncated
+    assert lines[0]["type"] == "header"
+    assert lines[1:] == _records(0, 8)
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.zst"])
+def test_run_log_survives_unclosed_and_truncated_file(tmp_path, suffix):
+    """닫히지 않거나 끝이 잘린 로그에서 완료된 기록까지 재개하는지 테스트합니다."""
+    path = str(tmp_path / f"run{suffix}")
+
+    # close() 없이 중단된 실행 (zstd 프레임이 종료되지 않음)
+    run_log = JsonlRunLog(path, HEADER)
+    run_log.open()
+    for record in _records(0, 20):
+        run_log.append(record)
+    run_log._raw.close()
+
+    # 마지막 기록을 쓰는 도중 중단된 것처럼 끝부분을 잘라냄
+    with open(path, "rb+") as f:
+        f.truncate(os.path.getsize(path) - 5)
+    records, truncated = read_jsonl(path)
+    # 일반 JSONL은 잘린 줄이 남고, zstd는 완전하지 않은 마지막 블록을 읽지 않음
+    assert truncated == (suffix == ".jsonl")
+    assert 0 < len(records) - 1 < 20
+
+    with JsonlRunLog(path, HEADER) as resumed:
+        completed = resumed.open()
+        assert completed == _records(0, len(completed))
+        for record in _records(len(completed), 20):
+            resumed.append(record)
+
+    lines, truncated = read_jsonl(path)
+    assert not truncated
+    assert lines[1:] == _records(0, 20)
+
+
+def test_run_log_rejects_different_settings(tmp_path):
+    """설정이 다른 기존 로그는 재개하지 않는지 테스트합니다."""
+    path = str(tmp_path / "run.jsonl")
+    with JsonlRunLog(path, HEADER) as run_log:
+        run_log.open()
+
+    with pytest.raises(ValueError):
+        JsonlRunLog(path, {**HEADER, "max_k": 5}).open()
+
+
+def test_retrieval_cache_persists_and_respects_k(tmp_path):
+    """저장된 결과가 요청한 k 이상일 때만 적중하고, 다시 열어도 유지되는지 테스트합니다."""
+    cache = RetrievalCache(str(tmp_path), "test-model", "kb-1", {"mode": "dense"})
+    assert cache.get("질문", 3) is None
+    cache.put("질문", 5, ["a", "b", "c", "d", "e"])
+    cache.close()
+
+    cache = RetrievalCache(str(tmp_path), "test-model", "kb-1", {"mode": "dense"})
+    assert cache.get("질문", 3) == ["a", "b", "c"]
+    assert cache.get("질문", 10) is None
+    assert cache.get_stats()["hits"] == 1
+    cache.close()
+
+    # 지식베이스나 검색 설정이 다르면 별도의 캐시
+    other = RetrievalCache(str(tmp_path), "test-model", "kb-2", {"mode": "dense"})
+    assert other.get("질문", 3) is None
+    other.close()
+
+
+def test_retrieval_cache_recovers_truncated_file(tmp_path):
+    """잘린 마지막 줄을 버리고 이후 항목을 정상적으로 추가하는지 테스트합니다."""
+    cache = RetrievalCache(str(tmp_path), "test-model", "kb", None)
+    cache.put("질문 1", 2, ["a", "b"])
+    cache.put("질문 2", 2, ["c", "d"])
+    cache.close()
+
+    cache_file = os.path.join(cache.cache_path, RetrievalCache.FILE_NAME)
+    with open(cache_file, "rb+") as f:
+        f.truncate(os.path.getsize(cache_file) - 3)
+
+    cache = RetrievalCache(str(tmp_path), "test-model", "kb", None)
+    assert cache.get("질문 2", 2) is None
+    cache.put("질문 3", 2, ["e", "f"])
+    cache.close()
+
+    cache = RetrievalCache(str(tmp_path), "test-model", "kb", None)
+    assert cache.get("질문 1", 2) == ["a", "b"]
+    assert cache.get("질문 3", 2) == ["e", "f"]
+    cache.close()
+
+
+def test_knowledge_base_fingerprint_changes_with_content(tmp_path):
+    """지식베이스 파일 내용이 바뀌면 지문이 바뀌는지 테스트합니다."""
+    (tmp_path / "index.json").write_text('{"index_type": "flat"}')
+    (tmp_path / "chunks.bin").write_bytes(b"chunk")
+    first = knowledge_base_fingerprint(str(tmp_path))
+    assert knowledge_base_fingerprint(str(tmp_path)) == first
+
+    (tmp_path / "chunks.bin").write_bytes(b"chunk2")
+    assert knowledge_base_fingerprint(str(tmp_path)) != first
+
+    with pytest.raises(FileNotFoundError):
+        knowledge_base_fingerprint(str(tmp_path / "missing"))
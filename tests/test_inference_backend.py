@@ -0,0 +1,37 @@
+"""
+임베딩 추론 백엔드 기능 테스트 코드
+"""
+
+import numpy as np
+import pytest
+
+from knowledge_base.embedding.inference_backend import cosine_drift, load_model
+from knowledge_base.embedding.sentence_transformers_embedding import (
+    SentenceTransformersEmbedding,
+)
+
+
+def test_cosine_drift():
+    """행별 코사인 유사도와 최대 드리프트를 계산하는지 테스트합니다."""
+    reference = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 4.0]])
+    candidate = np.array([[2.0, 0.0], [1.0, 1.0], [3.0, 4.0]])
+
+    report = cosine_drift(reference, candidate)
+
+    assert report["min_cosine"] == pytest.approx(np.sqrt(0.5))
+    assert report["max_drift"] == pytest.approx(1 - np.sqrt(0.5))
+    assert report["mean_cosine"] == pytest.approx((2 + np.sqrt(0.5)) / 3)
+
+
+def test_cosine_drift_shape_mismatch():
+    """임베딩 행렬 크기가 다르면 오류가 발생하는지 테스트합니다."""
+    with pytest.raises(ValueError):
+        cosine_drift(np.ones((2, 4)), np.ones((3, 4)))
+
+
+def test_invalid_backend():
+    """지원하지 않는 백엔드나 장치는 모델 로딩 전에 거부되는지 테스트합니다."""
+    with pytest.raises(ValueError):
+        SentenceTransformersEmbedding(backend="tensorrt")
+    with pytest.raises(ValueError):
+        load_model("unused-model", device="cuda", backend="int8")
@@ -1,6 +1,8 @@
 import os
 import sys
 
+from langchain_core.documents import Document
+
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 from src.knowledge_base.chunking.kor_chunker import KORChunker
@@ -30,5 +32,80 @@ def test_rag_chunking():
         print(f"내용:\n{chunk.page_content[:300]} (...)")
 
 
+def _assert_same_chunks(expected, actual):
+    assert len(actual) == len(expected)
+    for a, b in zip(expected, actual):
+        assert a.page_content == b.page_content
+        assert a.metadata == b.metadata
+
+
+def test_iter_chunks_matches_process():
+    """스트리밍 청킹 결과가 process() 결과와 동일한지 확인"""
+    pdf_path = "data/국어 지식 기반 생성(RAG) 참조 문서.pdf"
+    docs = PDFLoader(pdf_path).load()
+
+    expected = KORChunker(docs, document_name="참조 문서").process()
+    streamed = list(KORChunker(iter(docs), document_name="참조 문서").iter_chunks())
+    _assert_same_chunks(expected, streamed)
+
+
+def test_iter_chunks_title_across_pages():
+    """페이지 경계에 걸친 조항 제목과 본문이 이어서 처리되는지 확인"""
+    pages = [
+        Document(page_content="머리말\n<한글 맞춤법 제1항>\n첫 조항 본문"),
+        Document(page_content="계속되는 본문\n<한글 맞춤법"),
+        Document(page_content="제2항>\n둘째 조항 <>< 본문 " + "가" * 1200),
+        Document(page_content="<닫히지 않은 제목"),
+    ]
+
+    expected = KORChunker(pages).process()
+    streamed = list(KORChunker(iter(pages)).iter_chunks())
+    _assert_same_chunks(expected, streamed)
+    assert streamed[2].metadata["title"] == "한글 맞춤법\n제2항"
+
+
+def test_page_range_metadata():
+    """청크의 page_start/page_end가 실제 걸친 페이지와 일치하는지 확인"""
+    pages = [
+        Document(page_content="<규정 제1항>\n첫 페이지 본문", metadata={"page": 0}),
+        Document(
+            page_content="<규정 제2항>\n둘째 페이지에서 시작", metadata={"page": 1}
+        ),
+        Document(
+            page_content="셋째 페이지로 이어짐\n<규정 제3항>", metadata={"page": 2}
+        ),
+        Document(page_content="넷째 페이지 본문", metadata={"page": 3}),
+    ]
+
+    chunks = KORChunker(pages).process()
+    ranges = [(c.metadata["page_start"], c.metadata["page_end"]) for c in chunks]
+    assert ranges == [(1, 1), (2, 3), (3, 4)]
+    assert [c.metadata["page"] for c in chunks] == [1, 2, 3]
+    _assert_same_chunks(chunks, list(KORChunker(iter(pages)).iter_chunks()))
+
+
+def test_chunk_size_parameters():
+    """청크 크기를 바꾸면 split_threshold 이상인 조항 블록만 그 크기로 나누는지 확인"""
+    long_body = " ".join(f"문장{i}은 규정의 일부입니다." for i in range(120))
+    pages = [
+        Document(page_content=f"<규정 제1항>\n{long_body}", metadata={"page": 0}),
+        Document(page_content="<규정 제2항>\n짧은 본문", metadata={"page": 1}),
+    ]
+
+    default_chunks = KORChunker(pages).process()
+    small_chunks = KORChunker(pages, chunk_size=200, chunk_overlap=20).process()
+    assert len(small_chunks) > len(default_chunks)
+    assert all(len(c.page_content) <= 200 for c in small_chunks)
+    assert small_chunks[-1].page_content == "짧은 본문"
+    _assert_same_chunks(
+        small_chunks,
+        list(KORChunker(iter(pages), chunk_size=200, chunk_overlap=20).iter_chunks()),
+    )
+
+    # 기준 길이보다 짧은 블록은 나누지 않음
+    unsplit = KORChunker(pages, chunk_size=200, split_threshold=10000).process()
+    assert len(unsplit) == 2
+
+
 if __name__ == "__main__":
     test_rag_chunking()
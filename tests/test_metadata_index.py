@@ -0,0 +1,169 @@
+"""
+MetadataIndex 및 메타데이터 필터 검색 테스트 코드
+"""
+
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+
+from knowledge_base.embedding.sentence_transformers_embedding import (
+    SentenceTransformersEmbedding,
+)
+from knowledge_base.storage.bm25_index import BM25Index
+from knowledge_base.storage.faiss_vector_store import FAISSVectorStore
+from knowledge_base.storage.metadata_index import MetadataIndex
+
+SPELLING = "맞춤법.pdf"
+STANDARD = "표준어.pdf"
+LOANWORD = "외래어.pdf"
+
+
+def make_documents(num_docs: int = 60):
+    """세 규범 문서에 걸친 테스트 청크 (문서마다 20개, 페이지 1~20)"""
+    sources = [
+        (SPELLING, "띄어쓰기 - 한글 맞춤법 제{}항"),
+        (STANDARD, "표준어 규정 - 표준어 사정 원칙 제{}항"),
+        (LOANWORD, "외래어 표기법 제{}항"),
+    ]
+    documents = []
+    for i in range(num_docs):
+        source, title = sources[i % len(sources)]
+        page = i // len(sources) + 1
+        documents.append(
+            Document(
+                id=f"doc-{i}",
+                page_content=f"청크 {i} 본문",
+                metadata={
+                    "title": title.format(page),
+                    "page": page,
+                    "chunk_id": f"KOR-{i:05d}",
+                    "source": source,
+                    "page_start": page,
+                    "page_end": page + 1 if i % 2 else page,
+                },
+            )
+        )
+    return documents
+
+
+def make_store(documents, index_type: str = "flat", metric: str = "cosine"):
+    """모델 없이 임의 벡터로 채운 벡터 저장소"""
+    rng = np.random.default_rng(0)
+    embeddings = rng.standard_normal((len(documents), 16)).astype(np.float32)
+    store = FAISSVectorStore(
+        SentenceTransformersEmbedding(embedding_dim=16),
+        index_type=index_type,
+        index_params={"nlist": 4, "nprobe": 4},
+        metric=metric,
+    )
+    store.add_embeddings(documents, embeddings)
+    return store, embeddings
+
+
+def test_compile_filters():
+    """필터 키별 비트맵과 키 간 AND, 값 목록의 OR 조건을 테스트합니다."""
+    documents = make_documents()
+    values = {
+        key: [doc.metadata.get(key) for doc in documents]
+        for key in ("source", "title", "chunk_id", "page", "page_start", "page_end")
+    }
+    index = MetadataIndex.from_values(len(documents), values)
+
+    def selected(filter):
+        return set(np.flatnonzero(index.compile(filter)).tolist())
+
+    spelling = {i for i in range(60) if i % 3 == 0}
+    assert index.compile(None) is None
+    assert selected({"source": SPELLING}) == spelling
+    assert selected({"source": [SPELLING, LOANWORD]}) == {
+        i for i in range(60) if i % 3 != 1
+    }
+    # 전체 제목과 '분류 - ' 뒤의 규범명 부분 모두 접두어로 조회 (공백 무시)
+    assert selected({"title_prefix": "한글 맞춤법"}) == spelling
+    assert selected({"title_prefix": "띄어쓰기 - 한글맞춤법"}) == spelling
+    # 제1항, 제10항 ~ 제19항
+    assert selected({"title_prefix": "한글 맞춤법 제1"}) == {0} | set(range(27, 57, 3))
+    # 페이지 구간은 청크의 [page_start, page_end]와 겹치는지로 판단
+    assert selected({"page_range": (3, 3)}) == {3, 5, 6, 7, 8}
+    assert selected({"page": 20}) == {55, 57, 58, 59}
+    assert selected({"page_range": (None, 1)}) == {0, 1, 2}
+    assert selected({"source": SPELLING, "page_range": (1, 2)}) == {0, 3}
+    assert selected({"chunk_id": "KOR-00007"}) == {7}
+    assert selected({"source": "없는 문서"}) == set()
+
+    with pytest.raises(ValueError):
+        index.compile({"author": "국립국어원"})
+    with pytest.raises(ValueError):
+        index.compile({"page_range": 3})
+    with pytest.raises(ValueError):
+        index.compile({"page_range": ["a", 3]})
+    with pytest.raises(ValueError):
+        index.compile({"source": [["중첩 목록"]]})
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw", "ivf_flat"])
+@pytest.mark.parametrize("exact_max", [0, 4096])
+def test_filtered_search_matches_brute_force(index_type, exact_max):
+    """필터 검색이 선택된 문서 중의 완전 탐색 결과와 같고 k개를 채우는지 테스트합니다."""
+    documents = make_documents()
+    store, embeddings = make_store(documents, index_type=index_type)
+    store.index_params["filter_exact_max"] = exact_max
+    queries = embeddings[:4] + 0.01
+
+    mask = store.filter_mask({"source": STANDARD})
+    scores, positions = store.search_positions(queries, k=5, filter=mask)
+
+    normalized = embeddings / np.linalg.norm(embeddings, axis=1, keepdims=True)
+    query_vectors = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    similarity = query_vectors @ normalized.T
+    similarity[:, ~mask] = -np.inf
+    expected = np.argsort(-similarity, axis=1)[:, :5]
+
+    assert positions.shape == (4, 5)
+    assert mask[positions].all()
+    if index_type == "flat" or exact_max:
+        np.testing.assert_array_equal(positions, expected)
+        np.testing.assert_allclose(
+            scores, np.take_along_axis(similarity, expected, axis=1), rtol=1e-5
+        )
+
+    results = store.search_by_vectors(queries[:1], k=30, filter={"source": STANDARD})
+    if index_type != "ivf_flat":
+        # IVF는 nprobe개 클러스터 안의 문서만 후보이므로 k개를 보장하지 않음
+        assert len(results[0]) == 20
+    assert {doc.metadata["source"] for doc, _ in results[0]} == {STANDARD}
+
+
+def test_filter_index_follows_updates(tmp_path):
+    """저장/로드 및 문서 갱신 후 필터 색인이 다시 생성되는지 테스트합니다."""
+    documents = make_documents(30)
+    store, embeddings = make_store(documents)
+    store.save(str(tmp_path))
+
+    loaded = FAISSVectorStore(SentenceTransformersEmbedding(embedding_dim=16))
+    loaded.load(str(tmp_path))
+    _, positions = loaded.search_positions(
+        embeddings[:1], k=3, filter={"title_prefix": "외래어 표기법"}
+    )
+    assert [documents[i].metadata["source"] for i in positions[0]] == [LOANWORD] * 3
+
+    loaded.remove_positions(range(0, 30, 3))
+    _, positions = loaded.search_positions(
+        embeddings[:1], k=30, filter={"source": SPELLING}
+    )
+    assert (positions == -1).all()
+
+
+def test_bm25_search_with_mask():
+    """BM25 검색이 선택된 문서 중에서만 상위 k개를 반환하는지 테스트합니다."""
+    documents = [
+        Document(page_content="한글 맞춤법 띄어쓰기 규정"),
+        Document(page_content="한글 맞춤법 띄어쓰기"),
+        Document(page_content="외래어 표기법"),
+        Document(page_content="맞춤법"),
+    ]
+    index = BM25Index.from_documents(documents)
+    mask = np.array([False, False, True, True])
+
+    _, ids = index.search("한글 맞춤법", k=2, mask=mask)
+    assert ids.tolist() == [3]
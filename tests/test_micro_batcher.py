@@ -0,0 +1,168 @@
+"""
+MicroBatcher 기능 테스트 코드
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from knowledge_base.serving.micro_batcher import (
+    MetricWindow,
+    MicroBatcher,
+    QueueFullError,
+)
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_micro_batcher_coalesces_concurrent_requests():
+    """동시에 도착한 요청이 하나의 배치로 처리되고 결과가 요청별로 돌아오는지 테스트합니다."""
+    batches = []
+
+    def square(items):
+        batches.append(list(items))
+        return [item * item for item in items]
+
+    async def scenario():
+        batcher = MicroBatcher(square, max_batch_size=16, max_wait_ms=50)
+        await batcher.start()
+        try:
+            results = await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+        finally:
+            await batcher.stop()
+        return results, batcher.get_stats()
+
+    results, stats = _run(scenario())
+    assert results == [i * i for i in range(10)]
+    assert batches == [list(range(10))]
+    assert stats["requests"] == 10
+    assert stats["batches"] == 1
+    assert stats["batch_size"]["max"] == 10
+    assert stats["queue_depth"]["max"] == 10
+    assert stats["latency_ms"]["p50"] is not None
+
+
+def test_micro_batcher_respects_max_batch_size():
+    """요청 수가 max_batch_size를 넘으면 여러 배치로 나누어 처리하는지 테스트합니다."""
+    batch_sizes = []
+
+    def identity(items):
+        batch_sizes.append(len(items))
+        return list(items)
+
+    async def scenario():
+        batcher = MicroBatcher(identity, max_batch_size=4, max_wait_ms=20)
+        await batcher.start()
+        try:
+            return await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+        finally:
+            await batcher.stop()
+
+    assert _run(scenario()) == list(range(10))
+    assert batch_sizes == [4, 4, 2]
+
+
+def test_micro_batcher_does_not_wait_past_deadline():
+    """요청이 하나뿐이면 max_wait_ms 뒤에 바로 처리되는지 테스트합니다."""
+
+    async def scenario():
+        batcher = MicroBatcher(lambda items: list(items), max_wait_ms=20)
+        await batcher.start()
+        try:
+            start = time.perf_counter()
+            await batcher.submit("only")
+            return time.perf_counter() - start
+        finally:
+            await batcher.stop()
+
+    assert _run(scenario()) < 1.0
+
+
+def test_micro_batcher_runs_batches_off_event_loop():
+    """배치 함수가 이벤트 루프가 아닌 별도 스레드에서 실행되는지 테스트합니다."""
+    threads = []
+
+    def record(items):
+        threads.append(threading.current_thread().name)
+        return list(items)
+
+    async def scenario():
+        batcher = MicroBatcher(record, max_wait_ms=0)
+        await batcher.start()
+        try:
+            await batcher.submit(1)
+        finally:
+            await batcher.stop()
+
+    _run(scenario())
+    assert threads and threads[0].startswith("micro-batch")
+
+
+def test_micro_batcher_propagates_errors():
+    """배치 함수 예외가 배치에 포함된 모든 요청에 전달되는지 테스트합니다."""
+
+    def failing(items):
+        raise RuntimeError("검색 실패")
+
+    async def scenario():
+        batcher = MicroBatcher(failing, max_wait_ms=10)
+        await batcher.start()
+        try:
+            results = await asyncio.gather(
+                *(batcher.submit(i) for i in range(3)), return_exceptions=True
+            )
+        finally:
+            await batcher.stop()
+        return results, batcher.get_stats()
+
+    results, stats = _run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert stats["failed"] == 3
+
+
+def test_micro_batcher_rejects_when_queue_full():
+    """대기 요청 수가 max_queue_size를 넘으면 QueueFullError가 발생하는지 테스트합니다."""
+    release = threading.Event()
+
+    def blocking(items):
+        release.wait(5)
+        return list(items)
+
+    async def scenario():
+        batcher = MicroBatcher(
+            blocking, max_batch_size=1, max_wait_ms=0, max_queue_size=2
+        )
+        await batcher.start()
+        try:
+            # 첫 요청이 처리 중인 동안 큐에 2개가 쌓이면 다음 요청은 거절
+            first = asyncio.ensure_future(batcher.submit(0))
+            await asyncio.sleep(0.05)
+            queued = [asyncio.ensure_future(batcher.submit(i)) for i in (1, 2)]
+            await asyncio.sleep(0)
+            with pytest.raises(QueueFullError):
+                await batcher.submit(3)
+            release.set()
+            return await asyncio.gather(first, *queued)
+        finally:
+            release.set()
+            await batcher.stop()
+
+    assert _run(scenario()) == [0, 1, 2]
+
+
+def test_metric_window_percentiles():
+    """최근 측정값만으로 백분위수를 계산하는지 테스트합니다."""
+    window = MetricWindow(window_size=100)
+    assert window.percentiles(50, 99) == {"p50": None, "p99": None}
+
+    for value in range(1000):
+        window.add(float(value))
+    percentiles = window.percentiles(50, 99)
+    assert window.count == 1000
+    assert 940 <= percentiles["p50"] <= 960
+    assert percentiles["p99"] >= 990
+    assert window.max() == 999.0
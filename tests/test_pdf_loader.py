@@ -0,0 +1,18 @@
+"""
+PDFLoader 병렬 로딩 테스트 코드
+"""
+
+from knowledge_base.loading.pdf_loader import PDFLoader
+
+PDF_PATH = "data/국어 지식 기반 생성(RAG) 참조 문서.pdf"
+
+
+def test_parallel_load_matches_serial():
+    """여러 프로세스로 추출한 페이지가 단일 프로세스 결과와 동일한지 테스트합니다."""
+    serial = PDFLoader(PDF_PATH).load()
+    parallel = list(PDFLoader(PDF_PATH, num_workers=2, pages_per_task=3).lazy_load())
+
+    assert len(parallel) == len(serial)
+    for expected, loaded in zip(serial, parallel):
+        assert loaded.page_content == expected.page_content
+        assert loaded.metadata == expected.metadata
@@ -0,0 +1,71 @@
+"""
+QueryEmbeddingCache 기능 테스트 코드
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from knowledge_base.embedding.query_embedding_cache import QueryEmbeddingCache
+
+
+def test_query_cache_lru_eviction():
+    """용량을 넘으면 가장 오래 사용되지 않은 쿼리가 제거되는지 테스트합니다."""
+    cache = QueryEmbeddingCache(max_entries=2)
+    cache.put("질문 1", np.ones(4))
+    cache.put("질문 2", np.zeros(4))
+    assert cache.get("질문 1") is not None
+
+    cache.put("질문 3", np.full(4, 2.0))
+
+    assert cache.get("질문 2") is None
+    np.testing.assert_array_equal(cache.get("질문 1"), np.ones(4, dtype=np.float32))
+    stats = cache.get_stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_query_cache_ttl_expiration():
+    """TTL이 지난 항목이 만료되는지 테스트합니다."""
+    cache = QueryEmbeddingCache(max_entries=4, ttl_seconds=0.05)
+    cache.put("질문", np.ones(4))
+    assert cache.get("질문") is not None
+
+    time.sleep(0.1)
+
+    assert cache.get("질문") is None
+    assert cache.get_stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_query_cache_returns_read_only_vectors():
+    """캐시된 벡터를 호출자가 수정할 수 없는지 테스트합니다."""
+    cache = QueryEmbeddingCache()
+    cache.put("질문", np.ones(4))
+    with pytest.raises(ValueError):
+        cache.get("질문")[0] = 0.0
+
+
+def test_query_cache_thread_safety():
+    """여러 스레드에서 동시에 사용해도 통계와 용량이 일관적인지 테스트합니다."""
+    cache = QueryEmbeddingCache(max_entries=50)
+
+    def worker(offset):
+        for i in range(200):
+            key = f"질문 {(offset + i) % 80}"
+            if cache.get(key) is None:
+                cache.put(key, np.full(4, i, dtype=np.float32))
+
+    threads = [threading.Thread(target=worker, args=(n * 7,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.get_stats()
+    assert stats["hits"] + stats["misses"] == 8 * 200
+    assert stats["entries"] == len(cache) <= 50
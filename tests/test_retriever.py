@@ -14,9 +14,35 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 from knowledge_base.embedding.sentence_transformers_embedding import (
     SentenceTransformersEmbedding,
 )
+from knowledge_base.retrieval.cross_encoder_reranker import CrossEncoderReranker
 from knowledge_base.retrieval.vector_store_retriever import VectorStoreRetriever
 
 
+def test_rerank_keeps_first_stage_order_after_budget():
+    """시간 예산 초과 시 뒤쪽의 캐시 적중 후보가 미채점 후보를 앞지르지 않는지 테스트합니다."""
+    from langchain_core.documents import Document
+
+    reranker = CrossEncoderReranker()
+    query = "맞춤법 규칙"
+    documents = [Document(page_content=f"후보 {i}") for i in range(5)]
+    # 1차 순위 0, 1과 마지막 후보만 이전 요청에서 채점되어 캐시에 있음
+    for i, score in ((0, 0.25), (1, 0.5), (4, 4.0)):
+        key = (reranker._hash(query), reranker._document_key(documents[i]))
+        reranker._scores[key] = score
+
+    results = reranker.rerank_with_scores(query, documents, k=5, time_budget_ms=0)
+
+    assert [doc.page_content for doc, _ in results] == [
+        "후보 1",
+        "후보 0",
+        "후보 2",
+        "후보 3",
+        "후보 4",
+    ]
+    assert [score for _, score in results] == [0.5, 0.25, None, None, None]
+    assert reranker.get_stats()["pairs_scored"] == 0
+
+
 def main():
     """메인 테스트 함수"""
     # 로깅 설정
@@ -112,6 +138,55 @@ def main():
             print(f"   내용: {content_preview}...")
             print()
 
+        # 배치 검색 테스트
+        print("\n" + "=" * 80)
+        print("배치 검색 테스트")
+        print("=" * 80)
+
+        batch_results = retriever.search_batch(test_queries, k=3)
+
+        for query, results in zip(test_queries, batch_results):
+            single_results = retriever.search(query, k=3)
+            batch_ids = [doc.metadata.get("chunk_id") for doc in results]
+            single_ids = [doc.metadata.get("chunk_id") for doc in single_results]
+            print(f"쿼리: '{query[:40]}' -> {batch_ids}")
+            assert batch_ids == single_ids, "배치 검색 결과가 단일 검색과 다릅니다"
+
+        # 재순위화 검색 테스트
+        print("\n" + "=" * 80)
+        print("재순위화 검색 테스트")
+        print("=" * 80)
+
+        retriever.reranker = CrossEncoderReranker(
+            "cross-encoder/ms-marco-MiniLM-L-2-v2", device="cpu"
+        )
+        reranked = retriever.rerank_search(test_query, k=3, fetch_k=20)
+        for i, doc in enumerate(reranked, 1):
+            title = doc.metadata.get("title", "Unknown")
+            print(f"{i}. 재순위화 점수: {doc.metadata['rerank_score']:.4f} | {title}")
+
+        # 같은 질문은 캐시된 쌍 점수를 재사용
+        retriever.rerank_search(test_query, k=3, fetch_k=20)
+        stats = retriever.reranker.get_stats()
+        print(f"재순위화 통계: {stats}")
+        assert stats["pairs_scored"] == 20, "캐시된 쌍 점수가 재사용되지 않았습니다"
+
+        # 시간 예산이 부족하면 채점하지 못한 후보는 1차 검색 순서를 유지
+        # (쌍당 채점 시간 추정치가 없는 새 재순위화기도 예산을 지켜야 함)
+        retriever.reranker = CrossEncoderReranker(
+            "cross-encoder/ms-marco-MiniLM-L-2-v2", device="cpu"
+        )
+        degraded = retriever.rerank_search(
+            test_queries[0], k=3, fetch_k=20, time_budget_ms=0
+        )
+        stats = retriever.reranker.get_stats()
+        assert stats["pairs_scored"] == 0, "시간 예산이 없는데 후보를 채점했습니다"
+        assert stats["degraded"] == 1
+        first_stage = retriever.search(test_queries[0], k=3)
+        assert [doc.metadata.get("chunk_id") for doc in degraded] == [
+            doc.metadata.get("chunk_id") for doc in first_stage
+        ], "시간 예산 초과 시 1차 검색 순서가 유지되지 않았습니다"
+
         print("\n✅ 모든 검색 테스트 완료!")
 
     except Exception as e:
@@ -0,0 +1,186 @@
+"""
+검색 성능 평가 함수 테스트 코드
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.evaluate.eval_log import JsonlRunLog, RetrievalCache
+from src.evaluate.retriever_evaluator import (
+    compute_hit_ranks,
+    evaluate_retriever_metrics,
+    evaluate_retriever_metrics_batch,
+    metrics_from_hit_ranks,
+    score_search_logs,
+    stream_search_logs,
+)
+from src.knowledge_base.storage.title_index import normalize_title
+
+
+def _make_dataset(num_items, num_articles, seed=0):
+    """질문마다 임의의 정답 조항과, 정답이 임의 순위에 있거나 없는 검색 결과를 만듭니다."""
+    rng = random.Random(seed)
+    articles = [f"한글 맞춤법 - 제{i}항" for i in range(num_articles)]
+    dataset, retrieved = [], {}
+    for i in range(num_items):
+        article = rng.choice(articles)
+        answer = f'"{i}번 문장"이 옳다. 정답 설명 {i}'
+        dataset.append(
+            {
+                "input": {"question": f"질문 {i}"},
+                "output": {"answer": answer, "article": f"<{article}>"},
+            }
+        )
+        # 검색 결과 수도 쿼리마다 다르게 (저장된 문서가 k보다 적은 경우)
+        docs = rng.sample(articles, rng.randint(0, 10))
+        retrieved[f"정답 설명 {i}"] = docs
+    return dataset, retrieved
+
+
+@pytest.mark.parametrize("normalize_id", [None, normalize_title])
+def test_batch_evaluation_matches_sequential(normalize_id):
+    """배치 평가가 기존 쿼리별 평가와 같은 지표와 검색 로그를 반환하는지 테스트합니다."""
+    dataset, retrieved = _make_dataset(622, 30)
+    k_values = [1, 3, 5, 10]
+
+    expected_metrics, expected_logs = evaluate_retriever_metrics(
+        dataset, lambda query: retrieved[query], k_values, normalize_id=normalize_id
+    )
+    calls = []
+
+    def batch_retrieve(queries):
+        calls.append(len(queries))
+        return [retrieved[query] for query in queries]
+
+    metrics, logs = evaluate_retriever_metrics_batch(
+        dataset, batch_retrieve, k_values, normalize_id=normalize_id
+    )
+
+    assert calls == [622]
+    assert logs == expected_logs
+    assert metrics.keys() == expected_metrics.keys()
+    for k in k_values:
+        for name, value in expected_metrics[k].items():
+            assert metrics[k][name] == value
+    if normalize_id is not None:
+        # 꺾쇠괄호를 정규화해야만 적중하므로 지표가 0보다 커야 함
+        assert metrics[10]["recall"] > 0
+
+
+def test_compute_hit_ranks():
+    """첫 정답 순위와 정답이 없는 경우(-1)를 계산하는지 테스트합니다."""
+    ranks = compute_hit_ranks(
+        [["a", "b", "a"], ["c"], [], ["x", "y"]], ["a", "b", "a", "y"]
+    )
+    assert ranks.tolist() == [0, -1, -1, 1]
+    assert compute_hit_ranks([[], []], ["a", "b"]).tolist() == [-1, -1]
+
+
+def test_metrics_from_hit_ranks():
+    """순위 배열에서 k별 지표를 계산하는지 테스트합니다."""
+    metrics = metrics_from_hit_ranks(np.array([0, 2, -1, 4]), [1, 3])
+
+    assert metrics[1]["recall"] == pytest.approx(0.25)
+    assert metrics[1]["precision"] == pytest.approx(0.25)
+    assert metrics[1]["mrr"] == pytest.approx(0.25)
+    assert metrics[3]["recall"] == pytest.approx(0.5)
+    assert metrics[3]["precision"] == pytest.approx(0.5 / 3)
+    assert metrics[3]["f1"] == pytest.approx(0.5 * 2 * (1 / 3) / (1 / 3 + 1))
+    assert metrics[3]["mrr"] == pytest.approx((1 + 1 / 3) / 4)
+    assert metrics[3]["map"] == metrics[3]["mrr"]
+    assert metrics[3]["ndcg"] == pytest.approx((1 + 1 / np.log2(4)) / 4)
+
+
+def test_batch_evaluation_empty_dataset():
+    """빈 데이터셋은 기존 함수와 같이 0 지표와 빈 로그를 반환하는지 테스트합니다."""
+    metrics, logs = evaluate_retriever_metrics_batch([], lambda q: [], [1, 5])
+    assert logs == []
+    assert metrics == evaluate_retriever_metrics([], lambda q: [], [1, 5])[0]
+
+
+def test_stream_search_logs_whole_dataset_batch():
+    """전체 질문을 한 묶음으로 검색하면 배치 평가와 같은 결과를 한 번의 검색으로 얻는지 테스트합니다."""
+    dataset, retrieved = _make_dataset(622, 30)
+    calls = []
+
+    def batch_retrieve(queries):
+        calls.append(len(queries))
+        return [retrieved[query] for query in queries]
+
+    logs = stream_search_logs(
+        dataset, batch_retrieve, 10, normalize_id=normalize_title, batch_size=622
+    )
+    expected_metrics, expected_logs = evaluate_retriever_metrics_batch(
+        dataset, batch_retrieve, [1, 5, 10], normalize_id=normalize_title
+    )
+
+    assert calls == [622, 622]
+    assert [record.pop("index") for record in logs] == list(range(622))
+    assert logs == expected_logs
+    assert score_search_logs(logs, [1, 5, 10], normalize_title) == expected_metrics
+
+
+def test_stream_search_logs_resumes_after_failure(tmp_path):
+    """검색 도중 실패한 실행을 마지막 완료 질문 다음부터 재개하는지 테스트합니다."""
+    dataset, retrieved = _make_dataset(100, 30)
+    path = str(tmp_path / "run.jsonl.zst")
+    searched = []
+
+    def failing_retrieve(queries):
+        if len(searched) >= 40:
+            raise RuntimeError("검색 실패")
+        searched.extend(queries)
+        return [retrieved[query] for query in queries]
+
+    with pytest.raises(RuntimeError):
+        with JsonlRunLog(path, {"max_k": 10}) as run_log:
+            stream_search_logs(
+                dataset,
+                failing_retrieve,
+                10,
+                run_log=run_log,
+                completed=run_log.open(),
+                batch_size=8,
+            )
+
+    searched.clear()
+    with JsonlRunLog(path, {"max_k": 10}) as run_log:
+        completed = run_log.open()
+        logs = stream_search_logs(
+            dataset,
+            lambda queries: searched.extend(queries) or [retrieved[q] for q in queries],
+            10,
+            normalize_id=normalize_title,
+            run_log=run_log,
+            completed=completed,
+            batch_size=8,
+        )
+
+    assert len(completed) == 40
+    assert len(searched) == 60
+    expected_metrics, expected_logs = evaluate_retriever_metrics(
+        dataset, lambda query: retrieved[query], [1, 5, 10], normalize_title
+    )
+    assert [record["query"] for record in logs] == [r["query"] for r in expected_logs]
+    assert score_search_logs(logs, [1, 5, 10], normalize_title) == expected_metrics
+
+
+def test_stream_search_logs_uses_retrieval_cache(tmp_path):
+    """캐시된 쿼리는 다시 검색하지 않고, 더 작은 k로 재평가할 때도 검색하지 않는지 테스트합니다."""
+    dataset, retrieved = _make_dataset(50, 30)
+    searched = []
+
+    def batch_retrieve(queries):
+        searched.extend(queries)
+        return [retrieved[query] for query in queries]
+
+    cache = RetrievalCache(str(tmp_path), "test-model", "kb", None)
+    stream_search_logs(dataset, batch_retrieve, 10, retrieval_cache=cache)
+    assert len(searched) == 50
+
+    logs = stream_search_logs(dataset, batch_retrieve, 5, retrieval_cache=cache)
+    cache.close()
+    assert len(searched) == 50
+    assert logs[0]["retrieved_docs"] == retrieved[logs[0]["query"]][:5]
@@ -0,0 +1,64 @@
+"""
+검색 서버 요청 검증 테스트 코드
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+from langchain_core.documents import Document
+
+from knowledge_base.embedding.sentence_transformers_embedding import (
+    SentenceTransformersEmbedding,
+)
+from knowledge_base.retrieval.vector_store_retriever import VectorStoreRetriever
+from knowledge_base.serving.search_server import SearchService
+from knowledge_base.storage.faiss_vector_store import FAISSVectorStore
+
+
+@pytest.fixture
+def service(tmp_path):
+    """모델 없이 임의 벡터로 구축한 지식베이스의 검색 서비스"""
+    documents = [
+        Document(
+            id=f"doc-{i}",
+            page_content=f"청크 {i} 본문",
+            metadata={"source": "맞춤법.pdf", "page": i + 1, "title": f"제{i}항"},
+        )
+        for i in range(8)
+    ]
+    embedding_model = SentenceTransformersEmbedding(embedding_dim=8)
+    vector_store = FAISSVectorStore(embedding_model)
+    vector_store.add_embeddings(
+        documents, np.random.default_rng(0).standard_normal((8, 8))
+    )
+    vector_store.save(str(tmp_path))
+    return SearchService(VectorStoreRetriever(str(tmp_path), embedding_model))
+
+
+@pytest.mark.parametrize(
+    "filter",
+    [
+        {"page_range": ["a", 3]},
+        {"page_range": [1, "끝"]},
+        {"page_range": [True, 3]},
+        {"page_range": 3},
+        {"author": "국립국어원"},
+        ["source"],
+    ],
+)
+def test_invalid_filter_returns_400(service, filter):
+    """잘못된 필터는 배치에 넣지 않고 400으로 응답하는지 테스트합니다."""
+
+    async def scenario():
+        async with TestClient(TestServer(service.create_app())) as client:
+            response = await client.post(
+                "/search", json={"query": "맞춤법", "filter": filter}
+            )
+            return response.status, await response.json()
+
+    status, body = asyncio.run(scenario())
+    assert status == 400
+    assert body["error"]
+    assert service.batcher.get_stats()["requests"] == 0
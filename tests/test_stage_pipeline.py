@@ -0,0 +1,110 @@
+"""
+StagePipeline 기능 테스트 코드
+"""
+
+import threading
+import time
+
+import pytest
+
+from knowledge_base.stage_pipeline import StagePipeline
+
+
+def _double(items):
+    for item in items:
+        yield item * 2
+
+
+def _batch(size):
+    def stage(items):
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) == size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    return stage
+
+
+def test_stage_pipeline_preserves_order():
+    """단계를 거친 결과가 순차 처리 결과와 같은 순서인지 테스트합니다."""
+    runner = StagePipeline(queue_size=2)
+    results = runner.run(
+        range(25),
+        [("double", _double), ("batch", _batch(4)), ("sum", lambda b: map(sum, b))],
+    )
+
+    expected = [sum(x * 2 for x in range(i, min(i + 4, 25))) for i in range(0, 25, 4)]
+    assert results == expected
+
+    stats = runner.get_stats()
+    assert list(stats["stages"]) == ["source", "double", "batch", "sum"]
+    assert stats["stages"]["double"]["items"] == 25
+    assert stats["stages"]["batch"]["items"] == 7
+    assert stats["stages"]["sum"]["items"] == 7
+
+
+def test_stage_pipeline_backpressure():
+    """느린 마지막 단계 때문에 앞 단계가 큐 크기 이상 앞서가지 않는지 테스트합니다."""
+    produced = []
+    lock = threading.Lock()
+    max_ahead = 0
+
+    def source():
+        for i in range(20):
+            with lock:
+                produced.append(i)
+            yield i
+
+    def slow_sink(items):
+        nonlocal max_ahead
+        for consumed, item in enumerate(items, 1):
+            time.sleep(0.01)
+            with lock:
+                max_ahead = max(max_ahead, len(produced) - consumed)
+            yield item
+
+    runner = StagePipeline(queue_size=2)
+    assert runner.run(source(), [("sink", slow_sink)]) == list(range(20))
+    # 큐 2개 + 큐에 넣으려고 대기 중인 항목 1개
+    assert max_ahead <= 3
+    assert runner.get_stats()["stages"]["source"]["output_wait_seconds"] > 0
+
+
+def test_stage_pipeline_propagates_errors():
+    """중간 단계의 예외가 run()에서 다시 발생하고 작업 스레드가 정리되는지 테스트합니다."""
+
+    def failing(items):
+        for item in items:
+            if item == 5:
+                raise ValueError("단계 실패")
+            yield item
+
+    runner = StagePipeline(queue_size=1)
+    with pytest.raises(ValueError, match="단계 실패"):
+        runner.run(iter(range(1000)), [("fail", failing), ("sink", _double)])
+    assert not [t for t in threading.enumerate() if t.name.startswith("stage-")]
+
+
+def test_stage_pipeline_stops_on_sink_error():
+    """마지막 단계가 실패하면 앞 단계의 무한 입력 순회도 중단되는지 테스트합니다."""
+
+    def endless():
+        i = 0
+        while True:
+            yield i
+            i += 1
+
+    def sink(items):
+        for item in items:
+            if item == 4:
+                raise RuntimeError("저장 실패")
+            yield item
+
+    runner = StagePipeline(queue_size=2)
+    with pytest.raises(RuntimeError, match="저장 실패"):
+        runner.run(endless(), [("double", _double), ("sink", sink)])
+    assert not [t for t in threading.enumerate() if t.name.startswith("stage-")]
@@ -0,0 +1,142 @@
+"""
+검색 설정 그리드 스윕 테스트 코드
+"""
+
+import csv
+
+import numpy as np
+import pytest
+
+from src.evaluate.sweep import (
+    _save_artifact,
+    comparison_table,
+    evaluate_index,
+    expand_grid,
+    run_index_tasks,
+    write_comparison_table,
+)
+
+
+def test_expand_grid_product_and_defaults():
+    """축별 값의 모든 조합을 만들고, 없는 축은 기본값을 사용하는지 테스트합니다."""
+    configs = expand_grid(
+        {
+            "chunk_size": [300, 500],
+            "index_type": ["flat", "hnsw", "flat"],
+            "query_strategy": ["answer", "question"],
+        }
+    )
+    assert len(configs) == 8
+    assert configs[0] == {
+        "model_name": "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
+        "chunk_size": 300,
+        "chunk_overlap": 50,
+        "index_type": "flat",
+        "metric": "cosine",
+        "query_strategy": "answer",
+    }
+    assert configs[-1]["chunk_size"] == 500
+    assert configs[-1]["query_strategy"] == "question"
+
+    with pytest.raises(ValueError):
+        expand_grid({"chunk_sizes": [300]})
+    with pytest.raises(ValueError):
+        expand_grid({"index_type": ["annoy"]})
+    with pytest.raises(ValueError):
+        expand_grid({"query_strategy": []})
+
+
+def _make_task(tmp_path, index_type="flat"):
+    """정답 조항 청크와 가까운 쿼리 벡터로 이루어진 아티팩트와 평가 작업을 만듭니다."""
+    rng = np.random.default_rng(0)
+    titles = [f"한글 맞춤법 - 제{i}항" for i in range(6)]
+    chunk_vectors = rng.normal(size=(len(titles), 16)).astype(np.float32)
+    chunk_path = str(tmp_path / "chunks" / "a")
+    _save_artifact(
+        chunk_path,
+        {"kind": "chunks"},
+        [
+            {"page_content": f"본문 {i}", "metadata": {"title": t}}
+            for i, t in enumerate(titles)
+        ],
+        chunk_vectors,
+    )
+
+    answers = rng.integers(0, len(titles), size=40)
+    queries = {}
+    for strategy, noise in (("answer", 0.01), ("question", 100.0)):
+        query_vectors = chunk_vectors[answers] + noise * rng.normal(size=(40, 16))
+        queries[strategy] = str(tmp_path / "queries" / strategy)
+        _save_artifact(
+            queries[strategy], {"kind": "queries"}, ["q"] * 40, query_vectors
+        )
+
+    return {
+        "config": {
+            "model_name": "test-model",
+            "chunk_size": 500,
+            "chunk_overlap": 50,
+            "index_type": index_type,
+            "metric": "cosine",
+        },
+        "chunk_path": chunk_path,
+        "queries": queries,
+        "relevant_ids": [f"<{titles[i]}>" for i in answers],
+        "k_values": [1, 10],
+        "index_params": {"nlist": 2, "nprobe": 2},
+    }
+
+
+def test_evaluate_index_scores_each_query_strategy(tmp_path):
+    """저장된 벡터로 인덱스를 한 번 만들고 쿼리 생성 방식별 지표를 계산하는지 테스트합니다."""
+    rows = evaluate_index(_make_task(tmp_path))
+
+    assert [row["query_strategy"] for row in rows] == ["answer", "question"]
+    answer, question = rows
+    assert answer["num_chunks"] == 6
+    assert answer["metrics"][1]["recall"] == 1.0
+    assert question["metrics"][1]["recall"] < 1.0
+    # 저장된 청크(6개)보다 큰 k는 모든 청크를 반환하므로 항상 적중
+    assert question["metrics"][10]["recall"] == 1.0
+
+
+def test_run_index_tasks_process_pool_matches_inline(tmp_path):
+    """프로세스 풀 결과가 현재 프로세스에서 순차 수행한 결과와 같은 순서/값인지 테스트합니다."""
+    tasks = [
+        _make_task(tmp_path / index_type, index_type)
+        for index_type in ("flat", "ivf_flat")
+    ]
+    inline = run_index_tasks(tasks, workers=0)
+    pooled = run_index_tasks(tasks, workers=2)
+
+    assert [[row["index_type"] for row in rows] for rows in pooled] == [
+        ["flat", "flat"],
+        ["ivf_flat", "ivf_flat"],
+    ]
+    for inline_rows, pooled_rows in zip(inline, pooled):
+        for a, b in zip(inline_rows, pooled_rows):
+            assert a["metrics"] == b["metrics"]
+
+
+def test_write_comparison_table(tmp_path):
+    """비교 표를 CSV와 마크다운으로 저장하는지 테스트합니다."""
+    rows = evaluate_index(_make_task(tmp_path))
+    table = comparison_table(rows, [1, 10])
+    assert list(table[0])[:6] == [
+        "model_name",
+        "chunk_size",
+        "chunk_overlap",
+        "index_type",
+        "metric",
+        "query_strategy",
+    ]
+    assert table[0]["recall@1"] == 1.0
+
+    prefix = str(tmp_path / "out" / "sweep")
+    write_comparison_table(table, prefix)
+    with open(f"{prefix}.csv", encoding="utf-8") as f:
+        csv_rows = list(csv.DictReader(f))
+    assert [row["query_strategy"] for row in csv_rows] == ["answer", "question"]
+    with open(f"{prefix}.md", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 4 and lines[0].startswith("| model_name |")
@@ -0,0 +1,98 @@
+"""
+TitleIndex 기능 테스트 코드
+"""
+
+from langchain_core.documents import Document
+
+from knowledge_base.storage.chunk_store import ChunkStore
+from knowledge_base.storage.title_index import TitleIndex, normalize_title
+
+TEST_CHUNKS = [
+    Document(
+        page_content="어간 끝 받침 'ㄷ'이 모음 앞에서 'ㄹ'로 바뀌는 용언은 바뀐 대로 적는다.",
+        metadata={
+            "title": "한글 맞춤법, 표준어 규정 - 한글 맞춤법 제18항",
+            "chunk_id": "KOR-00001",
+        },
+    ),
+    Document(
+        page_content="(앞 청크에 이어서) 걷다 - 걸어, 묻다 - 물어",
+        metadata={
+            "title": "한글 맞춤법, 표준어 규정 - 한글 맞춤법 제18항",
+            "chunk_id": "KOR-00001",
+        },
+    ),
+    Document(
+        page_content="의존 명사는 띄어 쓴다.",
+        metadata={"title": "띄어쓰기 - 한글 맞춤법 제42항", "chunk_id": "KOR-00002"},
+    ),
+    Document(
+        page_content="'오뚝하다'를 표준어로 삼는다.",
+        metadata={
+            "title": "한글 맞춤법, 표준어 규정 - 표준어 사정 원칙 제3장 제1절 제8항",
+            "chunk_id": "KOR-00003",
+        },
+    ),
+]
+
+
+def test_normalize_title():
+    """평가 데이터의 꺾쇠괄호 표기와 청크 제목이 같은 키가 되는지 테스트합니다."""
+    assert normalize_title(
+        "<한글 맞춤법, 표준어 규정 - 한글 맞춤법 제18항>"
+    ) == normalize_title("한글 맞춤법, 표준어 규정 - 한글 맞춤법 제18항")
+    assert normalize_title("한글 맞춤법 제 18 항") == normalize_title(
+        "한글맞춤법 제18항"
+    )
+
+
+def test_title_lookup_aliases():
+    """전체 제목, 규범명 + 조항, 접두어로 청크를 조회하는지 테스트합니다."""
+    index = TitleIndex.from_documents(TEST_CHUNKS)
+
+    assert len(index) == 3
+    assert index.lookup("<한글 맞춤법, 표준어 규정 - 한글 맞춤법 제18항>") == [
+        "KOR-00001"
+    ]
+    assert index.lookup("한글 맞춤법 제42항") == ["KOR-00002"]
+    assert index.lookup("표준어 사정 원칙 제3장 제1절 제8항") == ["KOR-00003"]
+    assert index.lookup("없는 조항") == []
+    assert index.prefix_lookup("한글 맞춤법 제") == ["KOR-00001", "KOR-00002"]
+    assert index.fuzzy_lookup("한글 맞춤법 제18황") == ["KOR-00001"]
+
+
+def test_find_references_in_query():
+    """질문에 인용된 조항을 찾는지 테스트합니다."""
+    index = TitleIndex.from_documents(TEST_CHUNKS)
+
+    query = "한글 맞춤법 제18항에 따라 '걷다'의 활용형을 어떻게 적나요?"
+    assert index.find_references(query) == ["KOR-00001"]
+    assert index.find_references("'오뚝하다'가 맞나요?") == []
+
+
+def test_title_index_save_and_load(tmp_path):
+    """저장 후 로드한 색인의 조회 결과가 동일한지 테스트합니다."""
+    index = TitleIndex.from_documents(TEST_CHUNKS)
+    index.save(str(tmp_path))
+
+    assert TitleIndex.exists(str(tmp_path))
+    loaded = TitleIndex.load(str(tmp_path))
+    assert loaded.lookup("한글 맞춤법 제42항") == ["KOR-00002"]
+
+
+def test_chunk_store_metadata_values(tmp_path):
+    """Document 생성 없이 읽은 메타데이터 값이 문서와 일치하는지 테스트합니다."""
+    documents = [(f"doc-{i}", doc) for i, doc in enumerate(TEST_CHUNKS)]
+    ChunkStore.write(str(tmp_path), documents)
+    store = ChunkStore.open(str(tmp_path))
+    store.add({"doc-9": Document(page_content="추가", metadata={"page": 3})})
+
+    ids = store.ids
+    assert store.read_metadata_values(ids, "chunk_id") == [
+        "KOR-00001",
+        "KOR-00001",
+        "KOR-00002",
+        "KOR-00003",
+        None,
+    ]
+    assert store.read_metadata_values(ids, "page") == [None] * 4 + [3]
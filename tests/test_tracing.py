@@ -0,0 +1,123 @@
+"""
+단계별 소요 시간 추적기 테스트 코드
+"""
+
+import math
+import re
+import threading
+
+import pytest
+from langchain_core.documents import Document
+
+from src.knowledge_base import tracing
+from src.knowledge_base.chunking.kor_chunker import KORChunker
+from src.knowledge_base.tracing import Histogram, Tracer
+
+
+@pytest.fixture(autouse=True)
+def _reset_global_tracer():
+    tracing.disable()
+    tracing.reset()
+    yield
+    tracing.disable()
+    tracing.reset()
+
+
+def test_disabled_tracer_records_nothing():
+    """비활성화 상태에서는 함수 결과만 반환하고 기록하지 않는지 테스트합니다."""
+    tracer = Tracer(enabled=False)
+
+    @tracer.traced("stage")
+    def add(a, b):
+        return a + b
+
+    assert add(1, b=2) == 3
+    with tracer.span("block"):
+        pass
+    assert tracer.get_stats() == {}
+
+
+def test_traced_records_calls_and_failures():
+    """호출 횟수와 소요 시간을 기록하고, 예외가 나도 기록하는지 테스트합니다."""
+    tracer = Tracer(enabled=True)
+
+    @tracer.traced("stage")
+    def work(fail=False):
+        """원래 docstring"""
+        if fail:
+            raise RuntimeError("실패")
+        return "ok"
+
+    assert work() == "ok"
+    with pytest.raises(RuntimeError):
+        work(fail=True)
+    assert work.__doc__ == "원래 docstring"
+
+    stats = tracer.get_stats()["stage"]
+    assert stats["count"] == 2
+    assert 0 <= stats["min_ms"] <= stats["p50_ms"] <= stats["max_ms"]
+
+
+def test_capture_collects_nested_spans_per_thread():
+    """capture()가 현재 스레드의 스팬만 안쪽부터 순서대로 모으는지 테스트합니다."""
+    tracer = Tracer(enabled=True)
+    with tracer.capture() as spans:
+        with tracer.span("request"):
+            with tracer.span("encode"):
+                pass
+            with tracer.span("search"):
+                pass
+        other = threading.Thread(target=lambda: tracer.record("other_thread", 0.1))
+        other.start()
+        other.join()
+
+    assert [name for name, _ in spans] == ["encode", "search", "request"]
+    assert tracer.get_stats()["other_thread"]["count"] == 1
+
+
+def test_histogram_quantiles_within_observed_range():
+    """버킷 보간 분위수가 관측 범위 안에 있고 대략 맞는지 테스트합니다."""
+    histogram = Histogram()
+    for i in range(1, 101):
+        histogram.observe(i / 1000)  # 1ms ~ 100ms
+
+    assert histogram.count == 100
+    assert histogram.quantile(0.0) >= 0.001
+    assert histogram.quantile(1.0) == pytest.approx(0.1)
+    assert 0.025 <= histogram.quantile(0.5) <= 0.1
+    assert Histogram().quantile(0.5) == 0.0
+
+
+def test_prometheus_text_format():
+    """누적 버킷, +Inf 버킷 = count, _sum/_count 줄을 출력하는지 테스트합니다."""
+    tracer = Tracer(enabled=True)
+    for seconds in (0.0002, 0.003, 0.003, 120.0):
+        tracer.record('retriever."search"', seconds)
+
+    text = tracer.prometheus_text()
+    assert "# TYPE kb_stage_duration_seconds histogram" in text
+    buckets = re.findall(
+        r'_bucket\{stage="retriever.\\"search\\"",le="([^"]+)"\} (\d+)', text
+    )
+    counts = [int(count) for _, count in buckets]
+    assert counts == sorted(counts)
+    assert buckets[-1] == ("+Inf", "4")
+    assert dict(buckets)["0.0025"] == "1"
+    assert dict(buckets)["0.005"] == "3"
+    assert 'kb_stage_duration_seconds_count{stage="retriever.\\"search\\""} 4' in text
+    total = float(re.search(r"_sum\{[^}]*\} (\S+)", text).group(1))
+    assert math.isclose(total, 120.0062)
+
+
+def test_instrumented_stage_uses_global_tracer():
+    """계측된 단계(KORChunker.process)가 전역 추적기 활성화 시에만 기록되는지 테스트합니다."""
+    pages = [Document(page_content="<규정 제1항>\n본문", metadata={"page": 0})]
+
+    KORChunker(pages).process()
+    assert tracing.get_stats() == {}
+
+    tracing.enable()
+    KORChunker(pages).process()
+    assert tracing.get_stats()["chunker.process"]["count"] == 1
+    assert 'stage="chunker.process"' in tracing.prometheus_text()
+    assert "chunker.process" in tracing.format_text()
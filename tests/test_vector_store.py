@@ -121,6 +121,222 @@ def test_with_kor_chunker():
     print("\n✅ 전체 파이프라인 테스트 완료!")
 
 
+def test_approximate_index_types():
+    """근사 탐색 인덱스(IVF, PQ, HNSW)의 구축 및 재현율 측정을 테스트합니다."""
+
+    print("\n=== 근사 탐색 인덱스 테스트 ===")
+
+    embedding_model = SentenceTransformersEmbedding()
+    test_documents = [
+        Document(
+            page_content=f"테스트 문서 {i}: 한국어 어문 규범 조항 설명입니다.",
+            metadata={"title": f"제{i}항", "page": 1, "chunk_id": f"KOR-{i:03d}"},
+        )
+        for i in range(64)
+    ]
+    queries = ["어문 규범 조항", "테스트 문서 설명", "한국어 규범"]
+
+    for index_type in ("flat", "ivf_flat", "ivf_pq", "hnsw"):
+        vector_store = FAISSVectorStore(
+            embedding_model, index_type=index_type, index_params={"nlist": 8}
+        )
+        vector_store.add_documents(test_documents)
+
+        report = vector_store.evaluate_recall(queries, k=5)
+        print(f"   {index_type}: recall@5={report['recall']:.3f}")
+
+        assert vector_store.db.index.ntotal == len(test_documents)
+        assert 0.0 <= report["recall"] <= 1.0
+        if index_type == "flat":
+            assert report["recall"] == 1.0
+
+    print("✅ 근사 탐색 인덱스 테스트 완료!")
+
+
+def test_cosine_metric():
+    """코사인 척도 저장소의 점수가 실제 코사인 유사도인지 테스트합니다."""
+    import numpy as np
+
+    print("\n=== 코사인 척도 테스트 ===")
+
+    embedding_model = SentenceTransformersEmbedding()
+    vector_store = FAISSVectorStore(embedding_model, metric="cosine")
+    test_documents = [
+        Document(page_content="한글 맞춤법은 표준어를 소리대로 적는다."),
+        Document(page_content="외래어는 국어의 현용 24자모만으로 적는다."),
+    ]
+    vector_store.add_documents(test_documents)
+
+    query = "표준어 맞춤법"
+    results = vector_store.db.similarity_search_with_score(query, k=2)
+
+    query_vec = np.array(embedding_model.embed_query(query))
+    for doc, score in results:
+        doc_vec = np.array(embedding_model.embed_documents([doc.page_content])[0])
+        expected = (
+            query_vec @ doc_vec / np.linalg.norm(query_vec) / np.linalg.norm(doc_vec)
+        )
+        print(f"   점수: {score:.4f} (기대값: {expected:.4f})")
+        assert abs(score - expected) < 1e-4, "점수가 코사인 유사도와 다릅니다"
+
+    assert results[0][1] >= results[1][1], "유사도 내림차순으로 정렬되지 않았습니다"
+    assert vector_store.passes_threshold(results[0][1], results[1][1])
+
+    print("✅ 코사인 척도 테스트 완료!")
+
+
+def test_incremental_update(tmp_path):
+    """바뀐 청크만 임베딩하고 삭제된 청크의 벡터를 제거하는지 테스트합니다."""
+    from knowledge_base.pipeline import fingerprint_chunks
+
+    print("\n=== 증분 갱신 테스트 ===")
+
+    embedding_model = SentenceTransformersEmbedding()
+    chunks = [
+        Document(
+            page_content=f"제{i}항 본문입니다. 규정 내용 {i}",
+            metadata={"title": f"한글 맞춤법 제{i}항", "chunk_id": f"KOR-{i:05d}"},
+        )
+        for i in range(1, 41)
+    ]
+    for chunk, fingerprint in zip(chunks, fingerprint_chunks(chunks)):
+        chunk.id = fingerprint
+
+    for index_type in ["flat", "ivf_flat", "hnsw"]:
+        vector_store = FAISSVectorStore(
+            embedding_model, index_type=index_type, index_params={"nlist": 4}
+        )
+        vector_store.add_documents(chunks)
+        vector_store.save(str(tmp_path / index_type))
+
+        # 한 조항 수정, 한 조항 삭제, 한 조항 추가 (뒤쪽 chunk_id는 하나씩 밀림)
+        changed = [
+            Document(page_content=c.page_content, metadata=dict(c.metadata))
+            for c in chunks
+        ]
+        changed[3].page_content += " (개정)"
+        del changed[10]
+        changed.append(
+            Document(page_content="새 조항", metadata={"title": "한글 맞춤법 제99항"})
+        )
+        for i, chunk in enumerate(changed):
+            chunk.metadata["chunk_id"] = f"KOR-{i:05d}"
+        for chunk, fingerprint in zip(changed, fingerprint_chunks(changed)):
+            chunk.id = fingerprint
+
+        loaded = FAISSVectorStore(embedding_model)
+        loaded.load(str(tmp_path / index_type))
+        report = loaded.update_documents(changed)
+        print(f"   {index_type}: {report}")
+        assert report == {"kept": 38, "added": 2, "removed": 2}
+
+        ntotal = loaded.db.index.ntotal
+        assert ntotal == len(changed)
+        stored = {doc.id: doc for doc in loaded.get_documents(range(ntotal))}
+        for chunk in changed:
+            assert stored[chunk.id].metadata == chunk.metadata
+
+        # 위치마다 해당 문서의 임베딩이 저장되어 있는지 확인 (L2 거리 0)
+        for chunk in [changed[0], changed[20], changed[-1]]:
+            scores, positions = loaded.search_positions(
+                embedding_model.embed_query(chunk.page_content), k=ntotal
+            )
+            position = next(
+                p
+                for p in positions[0]
+                if loaded.db.index_to_docstore_id[int(p)] == chunk.id
+            )
+            score = scores[0][list(positions[0]).index(position)]
+            assert score < 1e-4, "위치와 문서의 대응 관계가 어긋났습니다"
+
+    print("✅ 증분 갱신 테스트 완료!")
+
+
+def test_incremental_update_rebuilds_on_model_change(tmp_path):
+    """다른 모델이나 모델 기록이 없는 저장소는 증분 갱신하지 않는지 테스트합니다."""
+    import json
+
+    import numpy as np
+
+    from knowledge_base.pipeline import KORPipeline
+
+    documents = [Document(id=f"doc-{i}", page_content=f"청크 {i}") for i in range(4)]
+    vector_store = FAISSVectorStore(
+        SentenceTransformersEmbedding(model_name="model-a", embedding_dim=8)
+    )
+    vector_store.add_embeddings(documents, np.eye(4, 8))
+    vector_store.save(str(tmp_path))
+
+    def pipeline(model_name):
+        return KORPipeline(
+            SentenceTransformersEmbedding(model_name=model_name, embedding_dim=8)
+        )
+
+    assert pipeline("model-a")._load_for_update(str(tmp_path))
+    assert not pipeline("model-b")._load_for_update(str(tmp_path))
+
+    # 모델 이름이 기록되기 전에 저장된 저장소
+    config_file = tmp_path / FAISSVectorStore.CONFIG_FILE
+    config = json.loads(config_file.read_text(encoding="utf-8"))
+    del config["model_name"]
+    config_file.write_text(json.dumps(config), encoding="utf-8")
+    assert not pipeline("model-a")._load_for_update(str(tmp_path))
+
+
+def test_load_restores_index_params(tmp_path):
+    """저장된 검색 파라미터를 복원하고, 명시적 인자가 우선하는지 테스트합니다."""
+    import numpy as np
+
+    documents = [Document(id=f"doc-{i}", page_content=f"청크 {i}") for i in range(64)]
+    embeddings = np.random.default_rng(0).standard_normal((64, 8))
+    vector_store = FAISSVectorStore(
+        SentenceTransformersEmbedding(embedding_dim=8),
+        index_type="hnsw",
+        index_params={"ef_search": 17},
+    )
+    vector_store.add_embeddings(documents, embeddings)
+    vector_store.save(str(tmp_path))
+
+    restored = FAISSVectorStore(SentenceTransformersEmbedding(embedding_dim=8))
+    restored.load(str(tmp_path))
+    assert restored.index_params["ef_search"] == 17
+    assert restored.db.index.hnsw.efSearch == 17
+
+    overridden = FAISSVectorStore(
+        SentenceTransformersEmbedding(embedding_dim=8), index_params={"ef_search": 5}
+    )
+    overridden.load(str(tmp_path))
+    assert overridden.db.index.hnsw.efSearch == 5
+
+
+def test_load_rejects_other_embedding_model(tmp_path):
+    """구축 모델을 index.json에 기록하고, 다른 모델로 로드하면 실패하는지 테스트합니다."""
+    import numpy as np
+    import pytest
+
+    documents = [Document(id=f"doc-{i}", page_content=f"청크 {i}") for i in range(4)]
+    vector_store = FAISSVectorStore(
+        SentenceTransformersEmbedding(model_name="build-model", embedding_dim=8)
+    )
+    vector_store.add_embeddings(documents, np.eye(4, 8))
+    vector_store.save(str(tmp_path))
+    assert FAISSVectorStore.saved_model_name(str(tmp_path)) == "build-model"
+
+    other = FAISSVectorStore(
+        SentenceTransformersEmbedding(model_name="other-model", embedding_dim=8)
+    )
+    with pytest.raises(ValueError):
+        other.load(str(tmp_path))
+
+
 if __name__ == "__main__":
     test_vector_store()
     test_with_kor_chunker()
+    test_approximate_index_types()
+    test_cosine_metric()
+
+    import pathlib
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        test_incremental_update(pathlib.Path(tmp_dir))